@@ -18,6 +18,8 @@ class ICUConfig(BaseSettings):
 
     intervals_icu_api_key: str = ""
     intervals_icu_athlete_id: str = ""
+    # Maximum number of API requests one client keeps in flight at once
+    intervals_icu_max_in_flight: int = 32
 
 
 def load_config() -> ICUConfig:
@@ -1,9 +1,17 @@
 """Async HTTP client for Intervals.icu API."""
 
-from typing import Any
+import asyncio
+import base64
+import importlib.util
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from functools import lru_cache
+from typing import Any, TypeVar
 
 import httpx
-from pydantic import TypeAdapter
+import orjson
+from pydantic import BaseModel, TypeAdapter
 
 from .auth import ICUConfig
 from .models import (
@@ -14,6 +22,7 @@ from .models import (
     Athlete,
     BestEffort,
     Event,
+    EventReplaceResult,
     Folder,
     Gear,
     GearReminder,
@@ -27,10 +36,113 @@ from .models import (
     Workout,
 )
 
+# Connection pool shared by every request made through one client instance. Every
+# connection may stay idle in the pool, so bursts of tool calls reuse warm connections.
+_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=100,
+    keepalive_expiry=75.0,
+)
+
+# HTTP/2 needs the optional h2 package (installed via httpx[http2]); without it httpx
+# raises on http2=True, so fall back to HTTP/1.1 keep-alive instead of failing outright
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Loading the CA bundle is slow, so every client shares one SSL context built at import.
+# httpx.create_ssl_context still honours SSL_CERT_FILE / SSL_CERT_DIR like the default.
+_SSL_CONTEXT = httpx.create_ssl_context()
+
+# 30s for reads and writes, but fail fast when connecting or waiting for a pooled connection
+_TIMEOUT = httpx.Timeout(30.0, connect=5.0, pool=5.0)
+
+# Streamed downloads are read in 64 KiB chunks rather than buffered whole
+_STREAM_CHUNK_SIZE = 65536
+
+# Request bodies are encoded with orjson rather than handed to httpx as json=
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Rate-limited requests are retried for any method; transient server errors only for
+# idempotent methods, where repeating the request cannot apply a change twice
+_MAX_ATTEMPTS = 4
+_RETRY_BACKOFF = 0.5  # First retry delay in seconds, doubled on each attempt
+_MAX_RETRY_DELAY = 10.0
+_RETRY_SERVER_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "PUT", "DELETE"})
+
+# How long cached GET responses stay fresh, in seconds
+_CACHE_TTL = 60.0
+_CacheKey = tuple[str, tuple[tuple[str, Any], ...]]
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+_T = TypeVar("_T")
+
+
+@lru_cache(maxsize=256)
+def _adapter(tp: type[_T]) -> TypeAdapter[_T]:
+    """Return a TypeAdapter for tp, built once per type.
+
+    Constructing a TypeAdapter is far more expensive than using it, so every
+    parametrisation (e.g. list[Activity]) is cached on first use.
+    """
+    return TypeAdapter(tp)
+
+
+async def gather_limited(aws: Iterable[Awaitable[_T]], limit: int) -> list[_T]:
+    """Await aws concurrently with at most limit of them running at once.
+
+    Args:
+        aws: Awaitables to run, typically client method calls
+        limit: Maximum number of awaitables in progress at the same time
+
+    Returns:
+        Results in the same order as aws
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*[run(aw) for aw in aws])
+
+
+def _auth_headers(api_key: str) -> dict[str, str]:
+    """Build the Basic Auth header: username "API_KEY", password the actual API key."""
+    token = base64.b64encode(f"API_KEY:{api_key}".encode()).decode("ascii")
+    return {"Authorization": f"Basic {token}"}
+
+
+def _parse(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(response.content)
+
+
+def _date_params(
+    oldest: str | None,
+    newest: str | None,
+    extra: tuple[tuple[str, Any], ...] = (),
+) -> dict[str, Any]:
+    """Build query params for a date-range request, skipping values that are None.
+
+    Other falsy values such as limit=0 are sent as given.
+    """
+    return {k: v for k, v in (("oldest", oldest), ("newest", newest), *extra) if v is not None}
+
+
+def _construct_list(model: type[_ModelT], items: list[dict[str, Any]]) -> list[_ModelT]:
+    """Build models from trusted API data without running pydantic validation.
+
+    Fields are assigned as-is: no type coercion (e.g. ints stay ints in float fields), no
+    constraint checks, and only defaults for missing fields are filled in.
+    """
+    return [model.model_construct(**item) for item in items]
+
 
 class ICUAPIError(Exception):
     """Custom exception for Intervals.icu API errors."""
 
+    __slots__ = ("message", "status_code")
+
     def __init__(self, message: str, status_code: int | None = None):
         """Initialize API error.
 
@@ -43,11 +155,71 @@ class ICUAPIError(Exception):
         super().__init__(self.message)
 
 
+def _retry_delay(response: httpx.Response, attempt: int) -> float | None:
+    """Return how long to wait before retrying a request, or None if it should not be.
+
+    Honours a numeric Retry-After header, otherwise backs off exponentially with jitter.
+    """
+    status = response.status_code
+    method = response.request.method
+    if attempt >= _MAX_ATTEMPTS or not (
+        status == 429 or (status in _RETRY_SERVER_STATUSES and method in _IDEMPOTENT_METHODS)
+    ):
+        return None
+
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), _MAX_RETRY_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    backoff = _RETRY_BACKOFF * 2 ** (attempt - 1)
+    return min(backoff * random.uniform(0.5, 1.0), _MAX_RETRY_DELAY)
+
+
+def _check_response(response: httpx.Response) -> None:
+    """Raise ICUAPIError for an unsuccessful response.
+
+    Raises:
+        ICUAPIError: If the response status is not 2xx
+    """
+    # Handle specific error codes
+    if response.status_code == 401:
+        raise ICUAPIError("Unauthorized. Check your API key and athlete ID.", 401)
+
+    if response.status_code == 404:
+        raise ICUAPIError("Resource not found.", 404)
+
+    if response.status_code == 429:
+        raise ICUAPIError("Rate limit exceeded. Please try again later.", 429)
+
+    if not response.is_success:
+        raise ICUAPIError(f"HTTP {response.status_code}: {response.text}", response.status_code)
+
+
 class ICUClient:
     """Async HTTP client for Intervals.icu API with automatic error handling."""
 
     BASE_URL = "https://intervals.icu/api/v1"
 
+    __slots__ = (
+        "config",
+        "_client",
+        "_depth",
+        "_auth_headers",
+        "_athlete_prefix",
+        "_p_activities",
+        "_p_wellness",
+        "_p_events",
+        "_p_folders",
+        "_p_gear",
+        "_p_sport_settings",
+        "_cache",
+        "_generation",
+        "_pending",
+        "_in_flight",
+    )
+
     def __init__(self, config: ICUConfig):
         """Initialize the Intervals.icu API client.
 
@@ -56,17 +228,64 @@ class ICUClient:
         """
         self.config = config
         self._client: httpx.AsyncClient | None = None
+        self._depth = 0
+        # Sent as a default header, so no auth flow runs per request
+        self._auth_headers = _auth_headers(config.intervals_icu_api_key)
+        self._athlete_prefix = "/athlete/" + config.intervals_icu_athlete_id
+        # Collection roots for the configured athlete, built once instead of per call
+        self._p_activities = self._athlete_prefix + "/activities"
+        self._p_wellness = self._athlete_prefix + "/wellness"
+        self._p_events = self._athlete_prefix + "/events"
+        self._p_folders = self._athlete_prefix + "/folders"
+        self._p_gear = self._athlete_prefix + "/gear"
+        self._p_sport_settings = self._athlete_prefix + "/sport-settings"
+        self._cache: dict[_CacheKey, tuple[float, httpx.Response]] = {}
+        # Bumped by every invalidation, so a GET that was in flight meanwhile isn't cached
+        self._generation = 0
+        # GETs currently on the wire, so identical concurrent GETs share one request
+        self._pending: dict[_CacheKey, asyncio.Future[httpx.Response]] = {}
+        # Caps requests in flight so large fan-outs queue here instead of tripping rate limits
+        self._in_flight = asyncio.Semaphore(config.intervals_icu_max_in_flight)
+
+    def _athlete_path(self, athlete_id: str | None) -> str:
+        """Return the /athlete/{id} path prefix, reusing the configured one by default."""
+        return "/athlete/" + athlete_id if athlete_id else self._athlete_prefix
+
+    def _http(self) -> httpx.AsyncClient:
+        """Return the underlying HTTP client, creating it on first use.
+
+        One AsyncClient (and its connection pool) is kept for the lifetime of this
+        ICUClient, so it can be used without the async context manager and shared
+        across many requests.
+        """
+        if self._client is None:
+            # HTTP/2 lets concurrent requests multiplex over a single keep-alive connection
+            transport = httpx.AsyncHTTPTransport(
+                verify=_SSL_CONTEXT, http2=_HTTP2, limits=_POOL_LIMITS, retries=1
+            )
+
+            self._client = httpx.AsyncClient(
+                base_url=self.BASE_URL,
+                timeout=_TIMEOUT,
+                headers=self._auth_headers,
+                transport=transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client. A later request opens a new one."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def __aenter__(self) -> "ICUClient":
-        """Async context manager entry."""
-        # Use Basic Auth with username "API_KEY" and password as the actual API key
-        auth = httpx.BasicAuth(username="API_KEY", password=self.config.intervals_icu_api_key)
-
-        self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            timeout=30.0,
-            auth=auth,
-        )
+        """Async context manager entry.
+
+        The context manager is re-entrant: a shared, long-lived client can be entered
+        by several callers and is only closed when the outermost context exits.
+        """
+        self._depth += 1
+        self._http()
         return self
 
     async def __aexit__(
@@ -76,21 +295,49 @@ class ICUClient:
         exc_tb: object,
     ) -> None:
         """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        self._depth -= 1
+        if self._depth == 0:
+            await self.aclose()
+
+    def invalidate(self, prefix: str | None = None) -> None:
+        """Drop cached GET responses.
+
+        GETs still in flight under the prefix are detached as well: callers already waiting
+        on them get their response, but later identical GETs send a fresh request.
+
+        Args:
+            prefix: Endpoint path prefix such as "/activity/123"; the path itself and
+                everything below it is dropped. Clears the whole cache when omitted.
+        """
+        self._generation += 1
+        if prefix is None:
+            self._cache.clear()
+            self._pending.clear()
+            return
+        prefix = prefix.rstrip("/")
+        child_prefix = prefix + "/"
+        for key in [k for k in self._cache if k[0] == prefix or k[0].startswith(child_prefix)]:
+            del self._cache[key]
+        for key in [k for k in self._pending if k[0] == prefix or k[0].startswith(child_prefix)]:
+            del self._pending[key]
 
     async def _request(
         self,
         method: str,
         endpoint: str,
-        **kwargs: Any,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        cache: bool = False,
     ) -> httpx.Response:
         """Make an authenticated request to the API.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint path
-            **kwargs: Additional arguments for httpx.request
+            params: Query string parameters
+            json: JSON request body
+            cache: Serve a GET from the response cache when fresh (see _CACHE_TTL)
 
         Returns:
             httpx.Response object
@@ -98,33 +345,128 @@ class ICUClient:
         Raises:
             ICUAPIError: If the request fails
         """
-        if not self._client:
-            raise RuntimeError("Client not initialized. Use async context manager.")
-
-        try:
-            response = await self._client.request(method, endpoint, **kwargs)
-
-            # Handle specific error codes
-            if response.status_code == 401:
-                raise ICUAPIError("Unauthorized. Check your API key and athlete ID.", 401)
+        if method != "GET":
+            content = orjson.dumps(json) if json is not None else None
+            try:
+                return await self._send(
+                    method, endpoint, params, content, _JSON_HEADERS if content else None
+                )
+            finally:
+                # A write may change anything under its /athlete/{id} or /activity/{id} root,
+                # even when it fails partway, so invalidate whatever the outcome
+                self.invalidate("/".join(endpoint.split("/", 3)[:3]))
+
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        generation = self._generation
+        if cache:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL:
+                return cached[1]
+
+        # Single-flight: join an identical GET that is already running instead of
+        # sending a duplicate. Shielded so one caller's cancellation doesn't fail the rest.
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._send(method, endpoint, params, None, None))
+            self._pending[key] = pending
+
+            def done(future: asyncio.Future[httpx.Response]) -> None:
+                # A write may already have detached this request and a newer one taken its key
+                if self._pending.get(key) is future:
+                    del self._pending[key]
+                # Retrieve the error so it isn't logged as never retrieved when every
+                # waiter was cancelled before the request failed
+                if not future.cancelled():
+                    future.exception()
+
+            pending.add_done_callback(done)
+        response = await asyncio.shield(pending)
+
+        # Skip caching if a write landed while the request was in flight: the response
+        # may predate it
+        if cache and generation == self._generation:
+            self._cache[key] = (time.monotonic(), response)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        content: bytes | None,
+        headers: dict[str, str] | None,
+    ) -> httpx.Response:
+        """Send a request, retrying rate-limited and transient failures.
 
-            if response.status_code == 404:
-                raise ICUAPIError("Resource not found.", 404)
+        Raises:
+            ICUAPIError: If the request fails
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with self._in_flight:
+                    response = await self._http().request(
+                        method, endpoint, params=params, content=content, headers=headers
+                    )
+            except httpx.RequestError as e:
+                raise ICUAPIError(f"Request failed: {str(e)}") from e
+
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                break
+            # Sleep outside the in-flight semaphore so other requests can proceed
+            await asyncio.sleep(delay)
+
+        _check_response(response)
+        return response
+
+    async def _stream(self, endpoint: str) -> AsyncIterator[bytes]:
+        """Stream the body of an authenticated GET request in chunks.
+
+        Retried like other requests (see _retry_delay) until the response headers arrive.
 
-            if response.status_code == 429:
-                raise ICUAPIError("Rate limit exceeded. Please try again later.", 429)
+        Args:
+            endpoint: API endpoint path
 
-            response.raise_for_status()
-            return response
+        Yields:
+            Chunks of the response body
 
-        except httpx.HTTPStatusError as e:
-            raise ICUAPIError(
-                f"HTTP {e.response.status_code}: {e.response.text}",
-                e.response.status_code,
-            ) from e
+        Raises:
+            ICUAPIError: If the request fails
+        """
+        http = self._http()
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                # The in-flight slot is held until the headers arrive, not for the whole body,
+                # so a long download doesn't block other requests
+                async with self._in_flight:
+                    response = await http.send(http.build_request("GET", endpoint), stream=True)
+
+                delay = _retry_delay(response, attempt)
+                if delay is None:
+                    break
+                await response.aclose()
+                await asyncio.sleep(delay)
+
+            try:
+                if not response.is_success:
+                    # Error bodies are small; read them so the message can include the text
+                    await response.aread()
+                    _check_response(response)
+                async for chunk in response.aiter_bytes(_STREAM_CHUNK_SIZE):
+                    yield chunk
+            finally:
+                await response.aclose()
         except httpx.RequestError as e:
             raise ICUAPIError(f"Request failed: {str(e)}") from e
 
+    async def _download(self, endpoint: str) -> bytes:
+        """Download a whole file body via the streaming primitive."""
+        return b"".join([chunk async for chunk in self._stream(endpoint)])
+
     # ==================== Athlete Endpoints ====================
 
     async def get_athlete(self, athlete_id: str | None = None) -> Athlete:
@@ -136,9 +478,8 @@ class ICUClient:
         Returns:
             Athlete model with full profile information
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request("GET", f"/athlete/{athlete_id}")
-        return Athlete(**response.json())
+        response = await self._request("GET", self._athlete_path(athlete_id), cache=True)
+        return Athlete.model_validate_json(response.content)
 
     # ==================== Activity Endpoints ====================
 
@@ -148,6 +489,7 @@ class ICUClient:
         oldest: str | None = None,
         newest: str | None = None,
         limit: int = 30,
+        validate: bool = True,
     ) -> list[ActivitySummary]:
         """List activities for a date range.
 
@@ -156,24 +498,20 @@ class ICUClient:
             oldest: Oldest date to fetch (ISO-8601 format)
             newest: Newest date to fetch (ISO-8601 format)
             limit: Maximum number of activities to return
+            validate: Validate the response (default True). When False, models are built
+                with model_construct, skipping coercion and validation for faster decoding
 
         Returns:
             List of ActivitySummary objects
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        params = {}
-
-        if oldest:
-            params["oldest"] = oldest
-        if newest:
-            params["newest"] = newest
-
-        response = await self._request("GET", f"/athlete/{athlete_id}/activities", params=params)
-        adapter = TypeAdapter(list[ActivitySummary])
-        activities = adapter.validate_python(response.json())
-
-        # Limit results
-        return activities[:limit]
+        base = self._p_activities if not athlete_id else f"/athlete/{athlete_id}/activities"
+        params = _date_params(oldest, newest, (("limit", limit),))
+        response = await self._request("GET", base, params=params)
+        # Slice before building models so nothing past the limit is validated
+        items = _parse(response)[:limit]
+        if validate:
+            return _adapter(list[ActivitySummary]).validate_python(items)
+        return _construct_list(ActivitySummary, items)
 
     async def get_activity(self, athlete_id: str | None = None, activity_id: str = "") -> Activity:
         """Get detailed activity information.
@@ -187,7 +525,25 @@ class ICUClient:
         """
         athlete_id = athlete_id or self.config.intervals_icu_athlete_id
         response = await self._request("GET", f"/activity/{activity_id}")
-        return Activity(**response.json())
+        return Activity.model_validate_json(response.content)
+
+    async def get_activities_by_ids(
+        self,
+        ids: list[str],
+        concurrency: int = 8,
+    ) -> list[Activity]:
+        """Get detailed activity information for several activities concurrently.
+
+        Args:
+            ids: Activity IDs to fetch
+            concurrency: Maximum number of requests in flight at once (default 8)
+
+        Returns:
+            List of Activity models in the same order as ids
+        """
+        return await gather_limited(
+            (self.get_activity(activity_id=activity_id) for activity_id in ids), concurrency
+        )
 
     async def search_activities(
         self,
@@ -205,22 +561,18 @@ class ICUClient:
         Returns:
             List of ActivitySearchResult objects
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        params = {"q": query}
+        base = self._p_activities if not athlete_id else f"/athlete/{athlete_id}/activities"
+        params = {"q": query, "limit": limit}
 
-        response = await self._request(
-            "GET", f"/athlete/{athlete_id}/activities/search", params=params
-        )
-        adapter = TypeAdapter(list[ActivitySearchResult])
-        results = adapter.validate_python(response.json())
-
-        return results[:limit]
+        response = await self._request("GET", base + "/search", params=params)
+        return _adapter(list[ActivitySearchResult]).validate_python(_parse(response)[:limit])
 
     async def search_activities_full(
         self,
         athlete_id: str | None = None,
         query: str = "",
         limit: int = 30,
+        validate: bool = True,
     ) -> list[Activity]:
         """Search for activities by name or tag, returning full Activity objects.
 
@@ -228,20 +580,20 @@ class ICUClient:
             athlete_id: Athlete ID (uses config default if not provided)
             query: Search query (name or tag)
             limit: Maximum number of results to return
+            validate: Validate the response (default True). When False, models are built
+                with model_construct, skipping coercion and validation for faster decoding
 
         Returns:
             List of full Activity objects
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        params = {"q": query}
+        base = self._p_activities if not athlete_id else f"/athlete/{athlete_id}/activities"
+        params = {"q": query, "limit": limit}
 
-        response = await self._request(
-            "GET", f"/athlete/{athlete_id}/activities/search-full", params=params
-        )
-        adapter = TypeAdapter(list[Activity])
-        results = adapter.validate_python(response.json())
-
-        return results[:limit]
+        response = await self._request("GET", base + "/search-full", params=params)
+        items = _parse(response)[:limit]
+        if validate:
+            return _adapter(list[Activity]).validate_python(items)
+        return _construct_list(Activity, items)
 
     async def get_activities_around(
         self,
@@ -259,14 +611,12 @@ class ICUClient:
         Returns:
             List of Activity objects around the reference activity
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
         params = {"id": activity_id, "count": count}
 
         response = await self._request(
-            "GET", f"/athlete/{athlete_id}/activities-around", params=params
+            "GET", self._athlete_path(athlete_id) + "/activities-around", params=params
         )
-        adapter = TypeAdapter(list[Activity])
-        return adapter.validate_python(response.json())
+        return _adapter(list[Activity]).validate_json(response.content)
 
     async def update_activity(
         self,
@@ -283,7 +633,7 @@ class ICUClient:
             Updated Activity object
         """
         response = await self._request("PUT", f"/activity/{activity_id}", json=activity_data)
-        return Activity(**response.json())
+        return Activity.model_validate_json(response.content)
 
     async def delete_activity(
         self,
@@ -312,8 +662,7 @@ class ICUClient:
         Returns:
             File content as bytes
         """
-        response = await self._request("GET", f"/activity/{activity_id}/file")
-        return response.content
+        return await self._download(f"/activity/{activity_id}/file")
 
     async def download_fit_file(
         self,
@@ -327,8 +676,22 @@ class ICUClient:
         Returns:
             FIT file content as bytes
         """
-        response = await self._request("GET", f"/activity/{activity_id}/fit-file")
-        return response.content
+        return await self._download(f"/activity/{activity_id}/fit-file")
+
+    async def stream_fit_file(
+        self,
+        activity_id: str,
+    ) -> AsyncIterator[bytes]:
+        """Stream activity as FIT file without buffering the whole file in memory.
+
+        Args:
+            activity_id: Activity ID
+
+        Yields:
+            Chunks of the FIT file content
+        """
+        async for chunk in self._stream(f"/activity/{activity_id}/fit-file"):
+            yield chunk
 
     async def download_gpx_file(
         self,
@@ -342,8 +705,7 @@ class ICUClient:
         Returns:
             GPX file content as bytes
         """
-        response = await self._request("GET", f"/activity/{activity_id}/gpx-file")
-        return response.content
+        return await self._download(f"/activity/{activity_id}/gpx-file")
 
     async def get_power_histogram(
         self,
@@ -357,8 +719,10 @@ class ICUClient:
         Returns:
             Histogram with power distribution bins
         """
-        response = await self._request("GET", f"/activity/{activity_id}/power-histogram")
-        return Histogram(**response.json())
+        response = await self._request(
+            "GET", f"/activity/{activity_id}/power-histogram", cache=True
+        )
+        return Histogram.model_validate_json(response.content)
 
     async def get_hr_histogram(
         self,
@@ -372,8 +736,8 @@ class ICUClient:
         Returns:
             Histogram with HR distribution bins
         """
-        response = await self._request("GET", f"/activity/{activity_id}/hr-histogram")
-        return Histogram(**response.json())
+        response = await self._request("GET", f"/activity/{activity_id}/hr-histogram", cache=True)
+        return Histogram.model_validate_json(response.content)
 
     async def get_pace_histogram(
         self,
@@ -387,8 +751,8 @@ class ICUClient:
         Returns:
             Histogram with pace distribution bins
         """
-        response = await self._request("GET", f"/activity/{activity_id}/pace-histogram")
-        return Histogram(**response.json())
+        response = await self._request("GET", f"/activity/{activity_id}/pace-histogram", cache=True)
+        return Histogram.model_validate_json(response.content)
 
     async def get_gap_histogram(
         self,
@@ -402,8 +766,40 @@ class ICUClient:
         Returns:
             Histogram with GAP distribution bins
         """
-        response = await self._request("GET", f"/activity/{activity_id}/gap-histogram")
-        return Histogram(**response.json())
+        response = await self._request("GET", f"/activity/{activity_id}/gap-histogram", cache=True)
+        return Histogram.model_validate_json(response.content)
+
+    async def get_all_histograms(
+        self,
+        activity_id: str,
+    ) -> dict[str, Histogram]:
+        """Get power, HR, pace and GAP histograms for an activity concurrently.
+
+        The four requests are issued together so they overlap on the shared connection.
+
+        Args:
+            activity_id: Activity ID
+
+        Returns:
+            Dict of histograms keyed by "power", "hr", "pace" and "gap". Histograms the
+            API reports as not found (e.g. pace for a ride) are omitted.
+        """
+        results = await asyncio.gather(
+            self.get_power_histogram(activity_id),
+            self.get_hr_histogram(activity_id),
+            self.get_pace_histogram(activity_id),
+            self.get_gap_histogram(activity_id),
+            return_exceptions=True,
+        )
+
+        histograms: dict[str, Histogram] = {}
+        for name, result in zip(("power", "hr", "pace", "gap"), results, strict=True):
+            if isinstance(result, ICUAPIError) and result.status_code == 404:
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            histograms[name] = result
+        return histograms
 
     # ==================== Wellness Endpoints ====================
 
@@ -412,6 +808,7 @@ class ICUClient:
         athlete_id: str | None = None,
         oldest: str | None = None,
         newest: str | None = None,
+        validate: bool = True,
     ) -> list[Wellness]:
         """Get wellness records for a date range.
 
@@ -419,21 +816,18 @@ class ICUClient:
             athlete_id: Athlete ID (uses config default if not provided)
             oldest: Oldest date to fetch (ISO-8601 format)
             newest: Newest date to fetch (ISO-8601 format)
+            validate: Validate the response (default True). When False, models are built
+                with model_construct, skipping coercion and validation for faster decoding
 
         Returns:
             List of Wellness records
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        params = {}
-
-        if oldest:
-            params["oldest"] = oldest
-        if newest:
-            params["newest"] = newest
-
-        response = await self._request("GET", f"/athlete/{athlete_id}/wellness", params=params)
-        adapter = TypeAdapter(list[Wellness])
-        return adapter.validate_python(response.json())
+        base = self._p_wellness if not athlete_id else f"/athlete/{athlete_id}/wellness"
+        params = _date_params(oldest, newest)
+        response = await self._request("GET", base, params=params)
+        if not validate:
+            return _construct_list(Wellness, _parse(response))
+        return _adapter(list[Wellness]).validate_json(response.content)
 
     async def get_wellness_for_date(
         self,
@@ -449,9 +843,9 @@ class ICUClient:
         Returns:
             Wellness record for the specified date
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request("GET", f"/athlete/{athlete_id}/wellness/{date}")
-        return Wellness(**response.json())
+        base = self._p_wellness if not athlete_id else f"/athlete/{athlete_id}/wellness"
+        response = await self._request("GET", f"{base}/{date}")
+        return Wellness.model_validate_json(response.content)
 
     async def update_wellness(
         self,
@@ -467,9 +861,9 @@ class ICUClient:
         Returns:
             Updated Wellness record
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request("PUT", f"/athlete/{athlete_id}/wellness", json=wellness_data)
-        return Wellness(**response.json())
+        base = self._p_wellness if not athlete_id else f"/athlete/{athlete_id}/wellness"
+        response = await self._request("PUT", base, json=wellness_data)
+        return Wellness.model_validate_json(response.content)
 
     async def update_wellness_by_date(
         self,
@@ -487,32 +881,45 @@ class ICUClient:
         Returns:
             Updated Wellness record
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request(
-            "PUT", f"/athlete/{athlete_id}/wellness/{date}", json=wellness_data
-        )
-        return Wellness(**response.json())
+        base = self._p_wellness if not athlete_id else f"/athlete/{athlete_id}/wellness"
+        response = await self._request("PUT", f"{base}/{date}", json=wellness_data)
+        return Wellness.model_validate_json(response.content)
 
     async def update_wellness_bulk(
         self,
         wellness_records: list[dict[str, Any]],
         athlete_id: str | None = None,
+        chunk_size: int = 100,
+        concurrency: int = 4,
     ) -> list[Wellness]:
         """Bulk update wellness records.
 
+        Large backfills are split into chunks of chunk_size records that are
+        submitted concurrently, rather than as one oversized request.
+
         Args:
             wellness_records: List of wellness data dictionaries (each must include 'id' as date)
             athlete_id: Athlete ID (uses config default if not provided)
+            chunk_size: Maximum number of records per request (default 100)
+            concurrency: Maximum number of chunk requests in flight at once (default 4)
 
         Returns:
-            List of updated Wellness records
+            List of updated Wellness records, in submission order
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request(
-            "PUT", f"/athlete/{athlete_id}/wellness-bulk", json=wellness_records
+        endpoint = self._athlete_path(athlete_id) + "/wellness-bulk"
+
+        async def submit(chunk: list[dict[str, Any]]) -> list[Wellness]:
+            response = await self._request("PUT", endpoint, json=chunk)
+            return _adapter(list[Wellness]).validate_json(response.content)
+
+        results = await gather_limited(
+            (
+                submit(wellness_records[i : i + chunk_size])
+                for i in range(0, len(wellness_records), chunk_size)
+            ),
+            concurrency,
         )
-        adapter = TypeAdapter(list[Wellness])
-        return adapter.validate_python(response.json())
+        return [record for chunk_result in results for record in chunk_result]
 
     # ==================== Event/Calendar Endpoints ====================
 
@@ -521,6 +928,8 @@ class ICUClient:
         athlete_id: str | None = None,
         oldest: str | None = None,
         newest: str | None = None,
+        validate: bool = True,
+        category: str | None = None,
     ) -> list[Event]:
         """Get calendar events (planned workouts, notes, races).
 
@@ -528,21 +937,20 @@ class ICUClient:
             athlete_id: Athlete ID (uses config default if not provided)
             oldest: Oldest date to fetch (ISO-8601 format)
             newest: Newest date to fetch (ISO-8601 format)
+            validate: Validate the response (default True). When False, models are built
+                with model_construct, skipping coercion and validation for faster decoding
+            category: Only return events of this category, e.g. "WORKOUT" (filtered by the API)
 
         Returns:
             List of Event objects
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        params = {}
-
-        if oldest:
-            params["oldest"] = oldest
-        if newest:
-            params["newest"] = newest
-
-        response = await self._request("GET", f"/athlete/{athlete_id}/events", params=params)
-        adapter = TypeAdapter(list[Event])
-        return adapter.validate_python(response.json())
+        base = self._p_events if not athlete_id else f"/athlete/{athlete_id}/events"
+        params = _date_params(oldest, newest, (("category", category),))
+        # Cached: tools often re-read the same calendar window within a conversation
+        response = await self._request("GET", base, params=params, cache=True)
+        if not validate:
+            return _construct_list(Event, _parse(response))
+        return _adapter(list[Event]).validate_json(response.content)
 
     async def get_event(
         self,
@@ -558,9 +966,9 @@ class ICUClient:
         Returns:
             Event object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request("GET", f"/athlete/{athlete_id}/events/{event_id}")
-        return Event(**response.json())
+        base = self._p_events if not athlete_id else f"/athlete/{athlete_id}/events"
+        response = await self._request("GET", f"{base}/{event_id}")
+        return Event.model_validate_json(response.content)
 
     # ==================== Performance Curve Endpoints ====================
 
@@ -580,16 +988,11 @@ class ICUClient:
         Returns:
             PowerCurve with best efforts data
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        params = {}
-
-        if oldest:
-            params["oldest"] = oldest
-        if newest:
-            params["newest"] = newest
-
-        response = await self._request("GET", f"/athlete/{athlete_id}/power-curves", params=params)
-        return PowerCurve(**response.json())
+        params = _date_params(oldest, newest)
+        response = await self._request(
+            "GET", self._athlete_path(athlete_id) + "/power-curves", params=params
+        )
+        return PowerCurve.model_validate_json(response.content)
 
     async def get_hr_curves(
         self,
@@ -607,16 +1010,11 @@ class ICUClient:
         Returns:
             HRCurve with best efforts data
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        params = {}
-
-        if oldest:
-            params["oldest"] = oldest
-        if newest:
-            params["newest"] = newest
-
-        response = await self._request("GET", f"/athlete/{athlete_id}/hr-curves", params=params)
-        return HRCurve(**response.json())
+        params = _date_params(oldest, newest)
+        response = await self._request(
+            "GET", self._athlete_path(athlete_id) + "/hr-curves", params=params
+        )
+        return HRCurve.model_validate_json(response.content)
 
     async def get_pace_curves(
         self,
@@ -636,18 +1034,11 @@ class ICUClient:
         Returns:
             PaceCurve with best efforts data
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        params = {}
-
-        if oldest:
-            params["oldest"] = oldest
-        if newest:
-            params["newest"] = newest
-        if use_gap:
-            params["gap"] = "true"
-
-        response = await self._request("GET", f"/athlete/{athlete_id}/pace-curves", params=params)
-        return PaceCurve(**response.json())
+        params = _date_params(oldest, newest, (("gap", "true" if use_gap else None),))
+        response = await self._request(
+            "GET", self._athlete_path(athlete_id) + "/pace-curves", params=params
+        )
+        return PaceCurve.model_validate_json(response.content)
 
     # ==================== Workout Library Endpoints ====================
 
@@ -663,10 +1054,10 @@ class ICUClient:
         Returns:
             List of folders/plans with workouts
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request("GET", f"/athlete/{athlete_id}/folders")
-        adapter = TypeAdapter(list[Folder])
-        return adapter.validate_python(response.json())
+        base = self._p_folders if not athlete_id else f"/athlete/{athlete_id}/folders"
+        # Cached: agents often browse the library and then act on one of its folders
+        response = await self._request("GET", base, cache=True)
+        return _adapter(list[Folder]).validate_json(response.content)
 
     async def create_folder(
         self,
@@ -682,9 +1073,9 @@ class ICUClient:
         Returns:
             Created Folder object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request("POST", f"/athlete/{athlete_id}/folders", json=folder_data)
-        return Folder(**response.json())
+        base = self._p_folders if not athlete_id else f"/athlete/{athlete_id}/folders"
+        response = await self._request("POST", base, json=folder_data)
+        return Folder.model_validate_json(response.content)
 
     async def update_folder(
         self,
@@ -702,11 +1093,9 @@ class ICUClient:
         Returns:
             Updated Folder object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request(
-            "PUT", f"/athlete/{athlete_id}/folders/{folder_id}", json=folder_data
-        )
-        return Folder(**response.json())
+        base = self._p_folders if not athlete_id else f"/athlete/{athlete_id}/folders"
+        response = await self._request("PUT", f"{base}/{folder_id}", json=folder_data)
+        return Folder.model_validate_json(response.content)
 
     async def delete_folder(
         self,
@@ -719,8 +1108,8 @@ class ICUClient:
             folder_id: ID of the folder/plan to delete
             athlete_id: Athlete ID (uses config default if not provided)
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        await self._request("DELETE", f"/athlete/{athlete_id}/folders/{folder_id}")
+        base = self._p_folders if not athlete_id else f"/athlete/{athlete_id}/folders"
+        await self._request("DELETE", f"{base}/{folder_id}")
 
     async def bulk_create_workouts(
         self,
@@ -736,35 +1125,38 @@ class ICUClient:
         Returns:
             List of created Workout objects
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
         response = await self._request(
-            "POST", f"/athlete/{athlete_id}/workouts/bulk", json=workouts_data
+            "POST", self._athlete_path(athlete_id) + "/workouts/bulk", json=workouts_data
         )
-        adapter = TypeAdapter(list[Workout])
-        return adapter.validate_python(response.json())
+        return _adapter(list[Workout]).validate_json(response.content)
 
     # ==================== Activity Analysis Endpoints ====================
 
     async def get_activity_intervals(
         self,
         activity_id: str,
+        validate: bool = True,
     ) -> list[Interval]:
         """Get intervals for a specific activity.
 
         Args:
             activity_id: Activity ID
+            validate: Validate the response (default True). When False, models are built
+                with model_construct, skipping coercion and validation for faster decoding
 
         Returns:
             List of Interval objects
         """
-        response = await self._request("GET", f"/activity/{activity_id}/intervals")
-        adapter = TypeAdapter(list[Interval])
-        return adapter.validate_python(response.json())
+        response = await self._request("GET", f"/activity/{activity_id}/intervals", cache=True)
+        if not validate:
+            return _construct_list(Interval, _parse(response))
+        return _adapter(list[Interval]).validate_json(response.content)
 
     async def get_activity_streams(
         self,
         activity_id: str,
         streams: list[str] | None = None,
+        validate: bool = True,
     ) -> ActivityStreams:
         """Get time-series data streams for an activity.
 
@@ -772,16 +1164,18 @@ class ICUClient:
             activity_id: Activity ID
             streams: List of stream types to fetch (e.g., ["watts", "heartrate"])
                     If None, fetches all available streams
+            validate: Validate the response (default True). When False, the model is built
+                with model_construct, skipping per-sample validation of the stream arrays
 
         Returns:
             ActivityStreams object with time-series data
         """
-        params = {}
-        if streams:
-            params["types"] = ",".join(streams)
-
+        # Only send a query string when specific streams are requested
+        params = {"types": ",".join(streams)} if streams else None
         response = await self._request("GET", f"/activity/{activity_id}/streams", params=params)
-        return ActivityStreams(**response.json())
+        if not validate:
+            return ActivityStreams.model_construct(**_parse(response))
+        return ActivityStreams.model_validate_json(response.content)
 
     async def get_best_efforts(
         self,
@@ -795,9 +1189,8 @@ class ICUClient:
         Returns:
             List of BestEffort objects
         """
-        response = await self._request("GET", f"/activity/{activity_id}/best-efforts")
-        adapter = TypeAdapter(list[BestEffort])
-        return adapter.validate_python(response.json())
+        response = await self._request("GET", f"/activity/{activity_id}/best-efforts", cache=True)
+        return _adapter(list[BestEffort]).validate_json(response.content)
 
     async def search_intervals(
         self,
@@ -819,8 +1212,8 @@ class ICUClient:
         Returns:
             List of matching intervals with activity context
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        params = {}
+        base = self._p_activities if not athlete_id else f"/athlete/{athlete_id}/activities"
+        params: dict[str, Any] = {"limit": limit}
 
         if interval_type:
             params["type"] = interval_type
@@ -829,10 +1222,8 @@ class ICUClient:
         if max_duration:
             params["maxDuration"] = max_duration
 
-        response = await self._request(
-            "GET", f"/athlete/{athlete_id}/activities/interval-search", params=params
-        )
-        results = response.json()
+        response = await self._request("GET", base + "/interval-search", params=params)
+        results = _parse(response)
         return results[:limit]
 
     # ==================== Workout Library Endpoints ====================
@@ -851,10 +1242,9 @@ class ICUClient:
         Returns:
             List of Workout objects
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request("GET", f"/athlete/{athlete_id}/folders/{folder_id}/workouts")
-        adapter = TypeAdapter(list[Workout])
-        return adapter.validate_python(response.json())
+        base = self._p_folders if not athlete_id else f"/athlete/{athlete_id}/folders"
+        response = await self._request("GET", f"{base}/{folder_id}/workouts")
+        return _adapter(list[Workout]).validate_json(response.content)
 
     # ==================== Event Write Operations ====================
 
@@ -872,9 +1262,9 @@ class ICUClient:
         Returns:
             Created Event object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request("POST", f"/athlete/{athlete_id}/events", json=event_data)
-        return Event(**response.json())
+        base = self._p_events if not athlete_id else f"/athlete/{athlete_id}/events"
+        response = await self._request("POST", base, json=event_data)
+        return Event.model_validate_json(response.content)
 
     async def update_event(
         self,
@@ -892,11 +1282,9 @@ class ICUClient:
         Returns:
             Updated Event object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request(
-            "PUT", f"/athlete/{athlete_id}/events/{event_id}", json=event_data
-        )
-        return Event(**response.json())
+        base = self._p_events if not athlete_id else f"/athlete/{athlete_id}/events"
+        response = await self._request("PUT", f"{base}/{event_id}", json=event_data)
+        return Event.model_validate_json(response.content)
 
     async def delete_event(
         self,
@@ -912,8 +1300,8 @@ class ICUClient:
         Returns:
             True if deletion was successful
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        await self._request("DELETE", f"/athlete/{athlete_id}/events/{event_id}")
+        base = self._p_events if not athlete_id else f"/athlete/{athlete_id}/events"
+        await self._request("DELETE", f"{base}/{event_id}")
         return True
 
     # ==================== Gear Endpoints ====================
@@ -930,10 +1318,9 @@ class ICUClient:
         Returns:
             List of Gear objects
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request("GET", f"/athlete/{athlete_id}/gear")
-        adapter = TypeAdapter(list[Gear])
-        return adapter.validate_python(response.json())
+        base = self._p_gear if not athlete_id else f"/athlete/{athlete_id}/gear"
+        response = await self._request("GET", base)
+        return _adapter(list[Gear]).validate_json(response.content)
 
     async def create_gear(
         self,
@@ -949,9 +1336,9 @@ class ICUClient:
         Returns:
             Created Gear object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request("POST", f"/athlete/{athlete_id}/gear", json=gear_data)
-        return Gear(**response.json())
+        base = self._p_gear if not athlete_id else f"/athlete/{athlete_id}/gear"
+        response = await self._request("POST", base, json=gear_data)
+        return Gear.model_validate_json(response.content)
 
     async def update_gear(
         self,
@@ -969,11 +1356,9 @@ class ICUClient:
         Returns:
             Updated Gear object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request(
-            "PUT", f"/athlete/{athlete_id}/gear/{gear_id}", json=gear_data
-        )
-        return Gear(**response.json())
+        base = self._p_gear if not athlete_id else f"/athlete/{athlete_id}/gear"
+        response = await self._request("PUT", f"{base}/{gear_id}", json=gear_data)
+        return Gear.model_validate_json(response.content)
 
     async def delete_gear(
         self,
@@ -989,8 +1374,8 @@ class ICUClient:
         Returns:
             True if deletion was successful
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        await self._request("DELETE", f"/athlete/{athlete_id}/gear/{gear_id}")
+        base = self._p_gear if not athlete_id else f"/athlete/{athlete_id}/gear"
+        await self._request("DELETE", f"{base}/{gear_id}")
         return True
 
     async def create_gear_reminder(
@@ -1009,11 +1394,9 @@ class ICUClient:
         Returns:
             Created GearReminder object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request(
-            "POST", f"/athlete/{athlete_id}/gear/{gear_id}/reminders", json=reminder_data
-        )
-        return GearReminder(**response.json())
+        base = self._p_gear if not athlete_id else f"/athlete/{athlete_id}/gear"
+        response = await self._request("POST", f"{base}/{gear_id}/reminders", json=reminder_data)
+        return GearReminder.model_validate_json(response.content)
 
     async def update_gear_reminder(
         self,
@@ -1033,13 +1416,13 @@ class ICUClient:
         Returns:
             Updated GearReminder object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
+        base = self._p_gear if not athlete_id else f"/athlete/{athlete_id}/gear"
         response = await self._request(
             "PUT",
-            f"/athlete/{athlete_id}/gear/{gear_id}/reminders/{reminder_id}",
+            f"{base}/{gear_id}/reminders/{reminder_id}",
             json=reminder_data,
         )
-        return GearReminder(**response.json())
+        return GearReminder.model_validate_json(response.content)
 
     # ==================== Sport Settings Endpoints ====================
 
@@ -1055,10 +1438,22 @@ class ICUClient:
         Returns:
             List of SportSettings objects
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request("GET", f"/athlete/{athlete_id}/sport-settings")
-        adapter = TypeAdapter(list[SportSettings])
-        return adapter.validate_python(response.json())
+        base = self._p_sport_settings if not athlete_id else f"/athlete/{athlete_id}/sport-settings"
+        response = await self._request("GET", base, cache=True)
+        return _adapter(list[SportSettings]).validate_json(response.content)
+
+    def invalidate_sport_settings(self, athlete_id: str | None = None) -> None:
+        """Drop cached sport settings so the next get_sport_settings call refetches them.
+
+        Writes made through this client invalidate the cache automatically; this is for
+        changes made elsewhere (e.g. in the Intervals.icu web app).
+
+        Args:
+            athlete_id: Athlete ID (uses config default if not provided)
+        """
+        self.invalidate(
+            self._p_sport_settings if not athlete_id else f"/athlete/{athlete_id}/sport-settings"
+        )
 
     async def update_sport_settings(
         self,
@@ -1076,11 +1471,9 @@ class ICUClient:
         Returns:
             Updated SportSettings object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request(
-            "PUT", f"/athlete/{athlete_id}/sport-settings/{sport_id}", json=settings_data
-        )
-        return SportSettings(**response.json())
+        base = self._p_sport_settings if not athlete_id else f"/athlete/{athlete_id}/sport-settings"
+        response = await self._request("PUT", f"{base}/{sport_id}", json=settings_data)
+        return SportSettings.model_validate_json(response.content)
 
     async def apply_sport_settings(
         self,
@@ -1098,15 +1491,13 @@ class ICUClient:
         Returns:
             Result of applying settings
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        params = {}
+        base = self._p_sport_settings if not athlete_id else f"/athlete/{athlete_id}/sport-settings"
+        params: dict[str, Any] = {}
         if oldest:
             params["oldest"] = oldest
 
-        response = await self._request(
-            "POST", f"/athlete/{athlete_id}/sport-settings/{sport_id}/apply", params=params
-        )
-        return response.json()
+        response = await self._request("POST", f"{base}/{sport_id}/apply", params=params)
+        return _parse(response)
 
     async def create_sport_settings(
         self,
@@ -1122,11 +1513,9 @@ class ICUClient:
         Returns:
             Created SportSettings object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request(
-            "POST", f"/athlete/{athlete_id}/sport-settings", json=settings_data
-        )
-        return SportSettings(**response.json())
+        base = self._p_sport_settings if not athlete_id else f"/athlete/{athlete_id}/sport-settings"
+        response = await self._request("POST", base, json=settings_data)
+        return SportSettings.model_validate_json(response.content)
 
     async def delete_sport_settings(
         self,
@@ -1142,8 +1531,8 @@ class ICUClient:
         Returns:
             True if deletion was successful
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        await self._request("DELETE", f"/athlete/{athlete_id}/sport-settings/{sport_id}")
+        base = self._p_sport_settings if not athlete_id else f"/athlete/{athlete_id}/sport-settings"
+        await self._request("DELETE", f"{base}/{sport_id}")
         return True
 
     # ==================== Bulk Event Operations ====================
@@ -1162,12 +1551,9 @@ class ICUClient:
         Returns:
             List of created Event objects
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request(
-            "POST", f"/athlete/{athlete_id}/events/bulk", json=events_data
-        )
-        adapter = TypeAdapter(list[Event])
-        return adapter.validate_python(response.json())
+        base = self._p_events if not athlete_id else f"/athlete/{athlete_id}/events"
+        response = await self._request("POST", base + "/bulk", json=events_data)
+        return _adapter(list[Event]).validate_json(response.content)
 
     async def bulk_delete_events(
         self,
@@ -1183,11 +1569,47 @@ class ICUClient:
         Returns:
             Result of bulk deletion
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
-        response = await self._request(
-            "DELETE", f"/athlete/{athlete_id}/events/bulk", json={"ids": event_ids}
-        )
-        return response.json()
+        base = self._p_events if not athlete_id else f"/athlete/{athlete_id}/events"
+        response = await self._request("DELETE", base + "/bulk", json={"ids": event_ids})
+        return _parse(response)
+
+    async def replace_events(
+        self,
+        to_delete: list[int],
+        to_create: list[dict[str, Any]],
+        athlete_id: str | None = None,
+    ) -> EventReplaceResult:
+        """Delete some calendar events and create others in one round trip.
+
+        The bulk delete and bulk create requests are sent concurrently, so replanning a
+        week costs one round trip instead of two. The two operations are independent and
+        not atomic: if either fails, the error is raised once both requests have
+        finished, and the other operation may already have been applied.
+
+        Args:
+            to_delete: IDs of events to delete (skipped when empty)
+            to_create: Event data dictionaries to create (skipped when empty)
+            athlete_id: Athlete ID (uses config default if not provided)
+
+        Returns:
+            EventReplaceResult with the bulk delete response and the created events
+
+        Raises:
+            ICUAPIError: If either request fails
+        """
+
+        async def delete() -> dict[str, Any]:
+            return await self.bulk_delete_events(to_delete, athlete_id) if to_delete else {}
+
+        async def create() -> list[Event]:
+            return await self.bulk_create_events(to_create, athlete_id) if to_create else []
+
+        deleted, created = await asyncio.gather(delete(), create(), return_exceptions=True)
+        if isinstance(deleted, BaseException):
+            raise deleted
+        if isinstance(created, BaseException):
+            raise created
+        return EventReplaceResult(deleted=deleted, created=created)
 
     async def duplicate_event(
         self,
@@ -1205,10 +1627,10 @@ class ICUClient:
         Returns:
             Created Event object
         """
-        athlete_id = athlete_id or self.config.intervals_icu_athlete_id
+        base = self._p_events if not athlete_id else f"/athlete/{athlete_id}/events"
         response = await self._request(
             "POST",
-            f"/athlete/{athlete_id}/events/{event_id}/duplicate",
+            f"{base}/{event_id}/duplicate",
             json={"start_date_local": new_date},
         )
-        return Event(**response.json())
+        return Event.model_validate_json(response.content)
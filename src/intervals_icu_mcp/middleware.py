@@ -3,13 +3,15 @@
 This module provides middleware components that run before tool execution.
 """
 
+import asyncio
 from collections.abc import Callable
 from typing import Any
 
 from fastmcp.exceptions import ToolError
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 
-from .auth import load_config, validate_credentials
+from .auth import ICUConfig, load_config, validate_credentials
+from .client import ICUClient
 
 
 class ConfigMiddleware(Middleware):
@@ -19,9 +21,41 @@ class ConfigMiddleware(Middleware):
     1. Loads the ICU config from environment variables
     2. Validates that credentials are properly configured
     3. Injects the config into the context state for tools to access via ctx.get_state("config")
-    4. Raises ToolError if authentication is not configured
+    4. Injects a process-wide ICUClient via ctx.get_state("icu_client"), so tool calls share
+       one connection pool instead of opening a new one per call
+    5. Raises ToolError if authentication is not configured
     """
 
+    def __init__(self) -> None:
+        """Initialize the middleware without a client; one is created on first use."""
+        self._client: ICUClient | None = None
+        # Serializes creating and swapping the client, so concurrent first calls share one
+        self._lock = asyncio.Lock()
+
+    async def _shared_client(self, config: ICUConfig) -> ICUClient:
+        """Return the shared client, replacing it if the credentials have changed."""
+        client = self._client
+        if client is not None and client.config == config:
+            return client
+
+        async with self._lock:
+            client = self._client
+            if client is None or client.config != config:
+                replaced, client = client, ICUClient(config)
+                # The middleware holds the client open until it is replaced or shut down
+                await client.__aenter__()
+                self._client = client
+                if replaced is not None:
+                    # Closes the old pool once tool calls still using it have finished
+                    await replaced.__aexit__(None, None, None)
+            return client
+
+    async def aclose(self) -> None:
+        """Close the shared client, e.g. on server shutdown."""
+        if self._client is not None:
+            await self._client.__aexit__(None, None, None)
+            self._client = None
+
     async def on_call_tool(self, context: MiddlewareContext, call_next: Callable[..., Any]):
         """Load and validate config before every tool call."""
         # Load configuration from environment
@@ -34,9 +68,12 @@ class ConfigMiddleware(Middleware):
                 "Please run 'icu-mcp-auth' to set up authentication."
             )
 
-        # Inject config into context state for tools to access
-        if context.fastmcp_context:
-            context.fastmcp_context.set_state("config", config)
+        # Inject config and the shared client into context state for tools to access.
+        # The call holds the client open, so swapping it mid-call doesn't close its pool.
+        async with await self._shared_client(config) as client:
+            if context.fastmcp_context:
+                context.fastmcp_context.set_state("config", config)
+                context.fastmcp_context.set_state("icu_client", client)
 
-        # Continue to the tool execution
-        return await call_next(context)
+            # Continue to the tool execution
+            return await call_next(context)
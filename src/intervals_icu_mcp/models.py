@@ -1,6 +1,7 @@
 """Pydantic models for Intervals.icu API responses."""
 
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -38,7 +39,7 @@ class Athlete(BaseModel):
     atl: float | None = None
     tsb: float | None = None
     ramp_rate: float | None = None
-    sport_settings: list[SportSettings] = Field(default_factory=list[SportSettings])
+    sport_settings: list[SportSettings] = Field(default_factory=lambda: [])
 
 
 class AthleteProfile(BaseModel):
@@ -60,7 +61,7 @@ class ActivitySummary(BaseModel):
     """Summary representation of an activity (for lists)."""
 
     id: str
-    start_date_local: datetime
+    start_date_local: str  # ISO-8601 local datetime, kept as sent by the API
     name: str | None = None
     type: str | None = None
     distance: float | None = None
@@ -75,6 +76,11 @@ class ActivitySummary(BaseModel):
     icu_training_load: int | None = None
     icu_intensity: float | None = None
 
+    @cached_property
+    def start_date_local_dt(self) -> datetime:
+        """Start time parsed into a datetime on first access."""
+        return datetime.fromisoformat(self.start_date_local)
+
 
 class Activity(ActivitySummary):
     """Detailed activity with full information."""
@@ -109,11 +115,16 @@ class ActivitySearchResult(BaseModel):
 
     id: str
     name: str | None = None
-    start_date_local: datetime
+    start_date_local: str  # ISO-8601 local datetime, kept as sent by the API
     type: str | None = None
     distance: float | None = None
     moving_time: int | None = None
 
+    @cached_property
+    def start_date_local_dt(self) -> datetime:
+        """Start time parsed into a datetime on first access."""
+        return datetime.fromisoformat(self.start_date_local)
+
 
 # ==================== Wellness Models ====================
 
@@ -192,6 +203,13 @@ class Event(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class EventReplaceResult(BaseModel):
+    """Result of replacing calendar events (bulk delete and bulk create together)."""
+
+    deleted: dict[str, Any] = Field(default_factory=dict)  # Raw bulk delete response
+    created: list[Event] = Field(default_factory=lambda: [])
+
+
 # ==================== Workout Library Models ====================
 
 
@@ -256,7 +274,7 @@ class PowerCurve(BaseModel):
     name: str | None = None
     type: str | None = None
     athlete_id: str | None = None
-    data: list[DataCurvePt] = Field(default_factory=list[DataCurvePt])
+    data: list[DataCurvePt] = Field(default_factory=lambda: [])
 
 
 class HRCurve(BaseModel):
@@ -265,7 +283,7 @@ class HRCurve(BaseModel):
     name: str | None = None
     type: str | None = None
     athlete_id: str | None = None
-    data: list[DataCurvePt] = Field(default_factory=list[DataCurvePt])
+    data: list[DataCurvePt] = Field(default_factory=lambda: [])
 
 
 class PaceCurve(BaseModel):
@@ -274,7 +292,7 @@ class PaceCurve(BaseModel):
     name: str | None = None
     type: str | None = None
     athlete_id: str | None = None
-    data: list[DataCurvePt] = Field(default_factory=list[DataCurvePt])
+    data: list[DataCurvePt] = Field(default_factory=lambda: [])
 
 
 # ==================== Training Plan Models ====================
@@ -410,7 +428,7 @@ class Gear(BaseModel):
     distance: float | None = None  # Total distance in meters
     moving_time: int | None = Field(None, alias="moving_time")  # Total time in seconds
     activity_count: int | None = Field(None, alias="activity_count")
-    reminders: list[GearReminder] = Field(default_factory=list[GearReminder])
+    reminders: list[GearReminder] = Field(default_factory=lambda: [])
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -430,6 +448,6 @@ class HistogramBin(BaseModel):
 class Histogram(BaseModel):
     """Histogram data for activity metrics."""
 
-    bins: list[HistogramBin] = Field(default_factory=list[HistogramBin])
+    bins: list[HistogramBin] = Field(default_factory=lambda: [])
     total_count: int | None = None
     total_secs: int | None = None
@@ -10,20 +10,13 @@ across all MCP tools. All tools return JSON with a standard structure:
 }
 """
 
-import json
 from datetime import datetime
-from typing import Any, cast
+from typing import Any
 
+import orjson
 
-def _convert_datetimes(obj: Any) -> Any:  # type: ignore[misc]
-    """Recursively convert datetime objects to ISO strings."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {str(k): _convert_datetimes(v) for k, v in obj.items()}  # type: ignore[misc]
-    elif isinstance(obj, list):
-        return [_convert_datetimes(item) for item in obj]  # type: ignore[misc]
-    return obj
+# orjson writes datetimes as ISO strings natively; non-string dict keys are stringified
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
 
 
 class ResponseBuilder:
@@ -84,27 +77,20 @@ class ResponseBuilder:
                 }
             }
         """
-        # Convert datetime objects to ISO strings
-        converted_data = cast(dict[str, Any], _convert_datetimes(data))
-        converted_analysis: dict[str, Any] | None = None
-        if analysis:
-            converted_analysis = cast(dict[str, Any], _convert_datetimes(analysis))
-
-        response: dict[str, Any] = {"data": converted_data}
+        response: dict[str, Any] = {"data": data}
 
-        if converted_analysis:
-            response["analysis"] = converted_analysis
+        if analysis:
+            response["analysis"] = analysis
 
-        # Build metadata with timestamp
-        meta = metadata or {}
-        converted_meta = cast(dict[str, Any], _convert_datetimes(meta))
-        converted_meta["fetched_at"] = datetime.now().isoformat()
+        # Build metadata with timestamp (copied so the caller's dict is left untouched)
+        meta = dict(metadata) if metadata else {}
+        meta["fetched_at"] = datetime.now().isoformat()
         if query_type:
-            converted_meta["query_type"] = query_type
+            meta["query_type"] = query_type
 
-        response["metadata"] = converted_meta
+        response["metadata"] = meta
 
-        return json.dumps(response, separators=(",", ":"))
+        return orjson.dumps(response, option=_DUMPS_OPTIONS).decode()
 
     @staticmethod
     def build_error_response(
@@ -133,4 +119,4 @@ class ResponseBuilder:
         if suggestions:
             response["error"]["suggestions"] = suggestions
 
-        return json.dumps(response, separators=(",", ":"))
+        return orjson.dumps(response, option=_DUMPS_OPTIONS).decode()
@@ -1,5 +1,7 @@
 """Intervals.icu MCP Server - FastMCP entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from dotenv import load_dotenv
@@ -8,13 +10,24 @@ from fastmcp import FastMCP
 # Load environment variables
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared Intervals.icu client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await config_middleware.aclose()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("Intervals.icu")
+mcp = FastMCP("Intervals.icu", lifespan=lifespan)
 
 # Register middleware
 from .middleware import ConfigMiddleware
 
-mcp.add_middleware(ConfigMiddleware())
+config_middleware = ConfigMiddleware()
+mcp.add_middleware(config_middleware)
 
 # Import and register tools
 from .tools.activities import (
@@ -49,7 +62,12 @@ from .tools.event_management import (
     duplicate_event,
     update_event,
 )
-from .tools.events import get_calendar_events, get_event, get_upcoming_workouts
+from .tools.events import (
+    get_calendar_events,
+    get_event,
+    get_training_context,
+    get_upcoming_workouts,
+)
 from .tools.gear import (
     create_gear,
     create_gear_reminder,
@@ -110,6 +128,7 @@ mcp.tool()(update_wellness)
 mcp.tool()(get_calendar_events)
 mcp.tool()(get_upcoming_workouts)
 mcp.tool()(get_event)
+mcp.tool()(get_training_context)
 mcp.tool()(create_event)
 mcp.tool()(update_event)
 mcp.tool()(delete_event)
@@ -309,7 +328,8 @@ Include:
 4. Workout library structure (if using a training plan)
 5. Recommendations for adjustments
 
-Use get_upcoming_workouts to see the plan, get_fitness_summary for current form,
+Use get_upcoming_workouts to see the plan, get_fitness_summary for current form
+(or get_training_context to fetch fitness, wellness, and the calendar at once),
 and optionally get_workout_library to see available training plans, then evaluate
 if the plan is appropriate and suggest any modifications."""
 
@@ -1,11 +1,13 @@
 """Activity-related tools for Intervals.icu MCP server."""
 
+import base64
+import os
+import tempfile
 from datetime import datetime, timedelta
 from typing import Annotated, Any
 
 from fastmcp import Context
 
-from ..auth import ICUConfig
 from ..client import ICUAPIError, ICUClient
 from ..response_builder import ResponseBuilder
 
@@ -28,66 +30,65 @@ async def get_recent_activities(
         JSON string with activity summaries
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
         # Calculate date range
         oldest_date = datetime.now() - timedelta(days=days_back)
         oldest = oldest_date.strftime("%Y-%m-%d")
 
-        async with ICUClient(config) as client:
-            activities = await client.get_activities(
-                oldest=oldest,
-                limit=min(limit, 100),  # Cap at 100
-            )
-
-            if not activities:
-                return ResponseBuilder.build_response(
-                    data={"activities": [], "count": 0},
-                    metadata={"message": "No activities found"},
-                )
-
-            activities_data: list[dict[str, Any]] = []
-            for activity in activities:
-                activity_item: dict[str, Any] = {
-                    "id": activity.id,
-                    "name": activity.name or "Untitled",
-                    "start_date": activity.start_date_local,
-                    "type": activity.type,
-                }
-
-                if activity.distance:
-                    activity_item["distance_meters"] = activity.distance
-
-                if activity.moving_time:
-                    activity_item["moving_time_seconds"] = activity.moving_time
-
-                if activity.total_elevation_gain:
-                    activity_item["elevation_gain_meters"] = activity.total_elevation_gain
-
-                # Performance metrics
-                if activity.average_watts:
-                    activity_item["average_watts"] = activity.average_watts
-                if activity.normalized_power:
-                    activity_item["normalized_power"] = activity.normalized_power
-                if activity.average_heartrate:
-                    activity_item["average_heartrate"] = activity.average_heartrate
-                if activity.average_cadence:
-                    activity_item["average_cadence"] = activity.average_cadence
-
-                # Training load
-                if activity.icu_training_load:
-                    activity_item["training_load"] = activity.icu_training_load
-                if activity.icu_intensity:
-                    activity_item["intensity_factor"] = activity.icu_intensity
-
-                activities_data.append(activity_item)
+        activities = await client.get_activities(
+            oldest=oldest,
+            limit=min(limit, 100),  # Cap at 100
+        )
 
+        if not activities:
             return ResponseBuilder.build_response(
-                data={"activities": activities_data, "count": len(activities_data)},
-                query_type="recent_activities",
+                data={"activities": [], "count": 0},
+                metadata={"message": "No activities found"},
             )
 
+        activities_data: list[dict[str, Any]] = []
+        for activity in activities:
+            activity_item: dict[str, Any] = {
+                "id": activity.id,
+                "name": activity.name or "Untitled",
+                "start_date": activity.start_date_local,
+                "type": activity.type,
+            }
+
+            if activity.distance:
+                activity_item["distance_meters"] = activity.distance
+
+            if activity.moving_time:
+                activity_item["moving_time_seconds"] = activity.moving_time
+
+            if activity.total_elevation_gain:
+                activity_item["elevation_gain_meters"] = activity.total_elevation_gain
+
+            # Performance metrics
+            if activity.average_watts:
+                activity_item["average_watts"] = activity.average_watts
+            if activity.normalized_power:
+                activity_item["normalized_power"] = activity.normalized_power
+            if activity.average_heartrate:
+                activity_item["average_heartrate"] = activity.average_heartrate
+            if activity.average_cadence:
+                activity_item["average_cadence"] = activity.average_cadence
+
+            # Training load
+            if activity.icu_training_load:
+                activity_item["training_load"] = activity.icu_training_load
+            if activity.icu_intensity:
+                activity_item["intensity_factor"] = activity.icu_intensity
+
+            activities_data.append(activity_item)
+
+        return ResponseBuilder.build_response(
+            data={"activities": activities_data, "count": len(activities_data)},
+            query_type="recent_activities",
+        )
+
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
     except Exception as e:
@@ -112,114 +113,113 @@ async def get_activity_details(
         JSON string with detailed activity information
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            activity = await client.get_activity(activity_id=activity_id)
-
-            activity_data: dict[str, Any] = {
-                "id": activity.id,
-                "name": activity.name or "Untitled",
-                "type": activity.type,
-                "start_date": activity.start_date_local,
-            }
-
-            if activity.description:
-                activity_data["description"] = activity.description
-
-            # Duration and distance
-            if activity.moving_time:
-                activity_data["moving_time_seconds"] = activity.moving_time
-            if activity.elapsed_time:
-                activity_data["elapsed_time_seconds"] = activity.elapsed_time
-            if activity.distance:
-                activity_data["distance_meters"] = activity.distance
-            if activity.total_elevation_gain:
-                activity_data["elevation_gain_meters"] = activity.total_elevation_gain
-
-            # Speed/Pace
-            if activity.average_speed:
-                activity_data["average_speed_meters_per_sec"] = activity.average_speed
-            if activity.max_speed:
-                activity_data["max_speed_meters_per_sec"] = activity.max_speed
-
-            # Power metrics
-            power_metrics: dict[str, Any] = {}
-            if activity.average_watts:
-                power_metrics["average"] = activity.average_watts
-            if activity.normalized_power:
-                power_metrics["normalized"] = activity.normalized_power
-            if activity.weighted_average_watts:
-                power_metrics["weighted_average"] = activity.weighted_average_watts
-            if activity.max_watts:
-                power_metrics["max"] = activity.max_watts
-            if activity.variability_index:
-                power_metrics["variability_index"] = round(activity.variability_index, 2)
-            if activity.efficiency_factor:
-                power_metrics["efficiency_factor"] = round(activity.efficiency_factor, 2)
-            if power_metrics:
-                activity_data["power"] = power_metrics
-
-            # Heart rate
-            hr_metrics: dict[str, Any] = {}
-            if activity.average_heartrate:
-                hr_metrics["average"] = activity.average_heartrate
-            if activity.max_heartrate:
-                hr_metrics["max"] = activity.max_heartrate
-            if hr_metrics:
-                activity_data["heart_rate"] = hr_metrics
-
-            # Cadence
-            cadence_metrics: dict[str, Any] = {}
-            if activity.average_cadence:
-                cadence_metrics["average"] = activity.average_cadence
-            if activity.max_cadence:
-                cadence_metrics["max"] = activity.max_cadence
-            if cadence_metrics:
-                activity_data["cadence"] = cadence_metrics
-
-            # Training load
-            training_metrics: dict[str, Any] = {}
-            if activity.icu_training_load:
-                training_metrics["training_load"] = activity.icu_training_load
-            if activity.icu_intensity:
-                training_metrics["intensity_factor"] = activity.icu_intensity
-            if activity.tss:
-                training_metrics["tss"] = round(activity.tss, 0)
-            if activity.hrss:
-                training_metrics["hrss"] = round(activity.hrss, 0)
-            if activity.trimp:
-                training_metrics["trimp"] = round(activity.trimp, 0)
-            if training_metrics:
-                activity_data["training"] = training_metrics
-
-            # Subjective metrics
-            subjective: dict[str, Any] = {}
-            if activity.feel:
-                subjective["feel"] = activity.feel
-            if activity.perceived_exertion:
-                subjective["rpe"] = activity.perceived_exertion
-            if subjective:
-                activity_data["subjective"] = subjective
-
-            # Other info
-            other_info: dict[str, Any] = {}
-            if activity.calories:
-                other_info["calories"] = activity.calories
-            if activity.device_name:
-                other_info["device"] = activity.device_name
-            if activity.trainer or activity.indoor:
-                other_info["indoor"] = True
-            if activity.commute:
-                other_info["commute"] = True
-            if other_info:
-                activity_data["other"] = other_info
-
-            return ResponseBuilder.build_response(
-                data=activity_data,
-                query_type="activity_details",
-            )
+        activity = await client.get_activity(activity_id=activity_id)
+
+        activity_data: dict[str, Any] = {
+            "id": activity.id,
+            "name": activity.name or "Untitled",
+            "type": activity.type,
+            "start_date": activity.start_date_local,
+        }
+
+        if activity.description:
+            activity_data["description"] = activity.description
+
+        # Duration and distance
+        if activity.moving_time:
+            activity_data["moving_time_seconds"] = activity.moving_time
+        if activity.elapsed_time:
+            activity_data["elapsed_time_seconds"] = activity.elapsed_time
+        if activity.distance:
+            activity_data["distance_meters"] = activity.distance
+        if activity.total_elevation_gain:
+            activity_data["elevation_gain_meters"] = activity.total_elevation_gain
+
+        # Speed/Pace
+        if activity.average_speed:
+            activity_data["average_speed_meters_per_sec"] = activity.average_speed
+        if activity.max_speed:
+            activity_data["max_speed_meters_per_sec"] = activity.max_speed
+
+        # Power metrics
+        power_metrics: dict[str, Any] = {}
+        if activity.average_watts:
+            power_metrics["average"] = activity.average_watts
+        if activity.normalized_power:
+            power_metrics["normalized"] = activity.normalized_power
+        if activity.weighted_average_watts:
+            power_metrics["weighted_average"] = activity.weighted_average_watts
+        if activity.max_watts:
+            power_metrics["max"] = activity.max_watts
+        if activity.variability_index:
+            power_metrics["variability_index"] = round(activity.variability_index, 2)
+        if activity.efficiency_factor:
+            power_metrics["efficiency_factor"] = round(activity.efficiency_factor, 2)
+        if power_metrics:
+            activity_data["power"] = power_metrics
+
+        # Heart rate
+        hr_metrics: dict[str, Any] = {}
+        if activity.average_heartrate:
+            hr_metrics["average"] = activity.average_heartrate
+        if activity.max_heartrate:
+            hr_metrics["max"] = activity.max_heartrate
+        if hr_metrics:
+            activity_data["heart_rate"] = hr_metrics
+
+        # Cadence
+        cadence_metrics: dict[str, Any] = {}
+        if activity.average_cadence:
+            cadence_metrics["average"] = activity.average_cadence
+        if activity.max_cadence:
+            cadence_metrics["max"] = activity.max_cadence
+        if cadence_metrics:
+            activity_data["cadence"] = cadence_metrics
+
+        # Training load
+        training_metrics: dict[str, Any] = {}
+        if activity.icu_training_load:
+            training_metrics["training_load"] = activity.icu_training_load
+        if activity.icu_intensity:
+            training_metrics["intensity_factor"] = activity.icu_intensity
+        if activity.tss:
+            training_metrics["tss"] = round(activity.tss, 0)
+        if activity.hrss:
+            training_metrics["hrss"] = round(activity.hrss, 0)
+        if activity.trimp:
+            training_metrics["trimp"] = round(activity.trimp, 0)
+        if training_metrics:
+            activity_data["training"] = training_metrics
+
+        # Subjective metrics
+        subjective: dict[str, Any] = {}
+        if activity.feel:
+            subjective["feel"] = activity.feel
+        if activity.perceived_exertion:
+            subjective["rpe"] = activity.perceived_exertion
+        if subjective:
+            activity_data["subjective"] = subjective
+
+        # Other info
+        other_info: dict[str, Any] = {}
+        if activity.calories:
+            other_info["calories"] = activity.calories
+        if activity.device_name:
+            other_info["device"] = activity.device_name
+        if activity.trainer or activity.indoor:
+            other_info["indoor"] = True
+        if activity.commute:
+            other_info["commute"] = True
+        if other_info:
+            activity_data["other"] = other_info
+
+        return ResponseBuilder.build_response(
+            data=activity_data,
+            query_type="activity_details",
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -247,7 +247,7 @@ async def search_activities(
         JSON string with matching activities
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     if not query.strip():
         return ResponseBuilder.build_error_response(
@@ -256,39 +256,38 @@ async def search_activities(
         )
 
     try:
-        async with ICUClient(config) as client:
-            results = await client.search_activities(
-                query=query,
-                limit=min(limit, 100),  # Cap at 100
-            )
+        results = await client.search_activities(
+            query=query,
+            limit=min(limit, 100),  # Cap at 100
+        )
 
-            if not results:
-                return ResponseBuilder.build_response(
-                    data={"activities": [], "count": 0, "query": query},
-                    metadata={"message": f"No activities found matching '{query}'"},
-                )
+        if not results:
+            return ResponseBuilder.build_response(
+                data={"activities": [], "count": 0, "query": query},
+                metadata={"message": f"No activities found matching '{query}'"},
+            )
 
-            activities_data: list[dict[str, Any]] = []
-            for result in results:
-                activity_item: dict[str, Any] = {
-                    "id": result.id,
-                    "name": result.name or "Untitled",
-                    "start_date": result.start_date_local,
-                    "type": result.type,
-                }
+        activities_data: list[dict[str, Any]] = []
+        for result in results:
+            activity_item: dict[str, Any] = {
+                "id": result.id,
+                "name": result.name or "Untitled",
+                "start_date": result.start_date_local,
+                "type": result.type,
+            }
 
-                if result.distance:
-                    activity_item["distance_meters"] = result.distance
+            if result.distance:
+                activity_item["distance_meters"] = result.distance
 
-                if result.moving_time:
-                    activity_item["moving_time_seconds"] = result.moving_time
+            if result.moving_time:
+                activity_item["moving_time_seconds"] = result.moving_time
 
-                activities_data.append(activity_item)
+            activities_data.append(activity_item)
 
-            return ResponseBuilder.build_response(
-                data={"activities": activities_data, "count": len(activities_data), "query": query},
-                query_type="search_activities",
-            )
+        return ResponseBuilder.build_response(
+            data={"activities": activities_data, "count": len(activities_data), "query": query},
+            query_type="search_activities",
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -328,7 +327,7 @@ async def update_activity(
         JSON string with updated activity information
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
         # Build update data (only include provided fields)
@@ -355,32 +354,31 @@ async def update_activity(
                 error_type="validation_error",
             )
 
-        async with ICUClient(config) as client:
-            activity = await client.update_activity(activity_id, activity_data)
-
-            result_data: dict[str, Any] = {
-                "id": activity.id,
-                "name": activity.name or "Untitled",
-                "type": activity.type,
-                "start_date": activity.start_date_local,
-            }
-
-            if activity.description:
-                result_data["description"] = activity.description
-            if activity.trainer is not None:
-                result_data["trainer"] = activity.trainer
-            if activity.commute is not None:
-                result_data["commute"] = activity.commute
-            if activity.feel is not None:
-                result_data["feel"] = activity.feel
-            if activity.perceived_exertion is not None:
-                result_data["rpe"] = activity.perceived_exertion
-
-            return ResponseBuilder.build_response(
-                data=result_data,
-                query_type="update_activity",
-                metadata={"message": f"Successfully updated activity {activity_id}"},
-            )
+        activity = await client.update_activity(activity_id, activity_data)
+
+        result_data: dict[str, Any] = {
+            "id": activity.id,
+            "name": activity.name or "Untitled",
+            "type": activity.type,
+            "start_date": activity.start_date_local,
+        }
+
+        if activity.description:
+            result_data["description"] = activity.description
+        if activity.trainer is not None:
+            result_data["trainer"] = activity.trainer
+        if activity.commute is not None:
+            result_data["commute"] = activity.commute
+        if activity.feel is not None:
+            result_data["feel"] = activity.feel
+        if activity.perceived_exertion is not None:
+            result_data["rpe"] = activity.perceived_exertion
+
+        return ResponseBuilder.build_response(
+            data=result_data,
+            query_type="update_activity",
+            metadata={"message": f"Successfully updated activity {activity_id}"},
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -406,23 +404,22 @@ async def delete_activity(
         JSON string with deletion confirmation
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            success = await client.delete_activity(activity_id)
-
-            if success:
-                return ResponseBuilder.build_response(
-                    data={"activity_id": activity_id, "deleted": True},
-                    query_type="delete_activity",
-                    metadata={"message": f"Successfully deleted activity {activity_id}"},
-                )
-            else:
-                return ResponseBuilder.build_error_response(
-                    f"Failed to delete activity {activity_id}",
-                    error_type="api_error",
-                )
+        success = await client.delete_activity(activity_id)
+
+        if success:
+            return ResponseBuilder.build_response(
+                data={"activity_id": activity_id, "deleted": True},
+                query_type="delete_activity",
+                metadata={"message": f"Successfully deleted activity {activity_id}"},
+            )
+        else:
+            return ResponseBuilder.build_error_response(
+                f"Failed to delete activity {activity_id}",
+                error_type="api_error",
+            )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -450,47 +447,42 @@ async def download_activity_file(
         JSON string with file info and base64-encoded content (if no output_path)
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            file_content = await client.download_activity_file(activity_id)
-
-            if output_path:
-                # Save to file
-                import os
-
-                os.makedirs(
-                    os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
-                    exist_ok=True,
-                )
-                with open(output_path, "wb") as f:
-                    f.write(file_content)
-
-                return ResponseBuilder.build_response(
-                    data={
-                        "activity_id": activity_id,
-                        "saved_to": output_path,
-                        "size_bytes": len(file_content),
-                    },
-                    query_type="download_activity_file",
-                    metadata={"message": f"Activity file saved to {output_path}"},
-                )
-            else:
-                # Return base64 encoded
-                import base64
-
-                encoded = base64.b64encode(file_content).decode("utf-8")
-
-                return ResponseBuilder.build_response(
-                    data={
-                        "activity_id": activity_id,
-                        "size_bytes": len(file_content),
-                        "content_base64": encoded,
-                        "note": "File content is base64 encoded. Decode to get original file.",
-                    },
-                    query_type="download_activity_file",
-                )
+        file_content = await client.download_activity_file(activity_id)
+
+        if output_path:
+            # Save to file
+            os.makedirs(
+                os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
+                exist_ok=True,
+            )
+            with open(output_path, "wb") as f:
+                f.write(file_content)
+
+            return ResponseBuilder.build_response(
+                data={
+                    "activity_id": activity_id,
+                    "saved_to": output_path,
+                    "size_bytes": len(file_content),
+                },
+                query_type="download_activity_file",
+                metadata={"message": f"Activity file saved to {output_path}"},
+            )
+        else:
+            # Return base64 encoded
+            encoded = base64.b64encode(file_content).decode("utf-8")
+
+            return ResponseBuilder.build_response(
+                data={
+                    "activity_id": activity_id,
+                    "size_bytes": len(file_content),
+                    "content_base64": encoded,
+                    "note": "File content is base64 encoded. Decode to get original file.",
+                },
+                query_type="download_activity_file",
+            )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -518,49 +510,52 @@ async def download_fit_file(
         JSON string with file info and base64-encoded content (if no output_path)
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
+        if output_path:
+            # Stream straight to disk so large files are never held in memory. Chunks go to
+            # a temporary file that only replaces output_path once the download completes,
+            # so a failed download never truncates or half-writes an existing file.
+            output_dir = os.path.dirname(output_path) or "."
+            os.makedirs(output_dir, exist_ok=True)
+            size_bytes = 0
+            with tempfile.NamedTemporaryFile(dir=output_dir, suffix=".part", delete=False) as f:
+                try:
+                    async for chunk in client.stream_fit_file(activity_id):
+                        f.write(chunk)
+                        size_bytes += len(chunk)
+                except BaseException:
+                    f.close()
+                    os.unlink(f.name)
+                    raise
+            os.replace(f.name, output_path)
+
+            return ResponseBuilder.build_response(
+                data={
+                    "activity_id": activity_id,
+                    "format": "FIT",
+                    "saved_to": output_path,
+                    "size_bytes": size_bytes,
+                },
+                query_type="download_fit_file",
+                metadata={"message": f"FIT file saved to {output_path}"},
+            )
+        else:
+            # Return base64 encoded
             file_content = await client.download_fit_file(activity_id)
+            encoded = base64.b64encode(file_content).decode("utf-8")
 
-            if output_path:
-                # Save to file
-                import os
-
-                os.makedirs(
-                    os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
-                    exist_ok=True,
-                )
-                with open(output_path, "wb") as f:
-                    f.write(file_content)
-
-                return ResponseBuilder.build_response(
-                    data={
-                        "activity_id": activity_id,
-                        "format": "FIT",
-                        "saved_to": output_path,
-                        "size_bytes": len(file_content),
-                    },
-                    query_type="download_fit_file",
-                    metadata={"message": f"FIT file saved to {output_path}"},
-                )
-            else:
-                # Return base64 encoded
-                import base64
-
-                encoded = base64.b64encode(file_content).decode("utf-8")
-
-                return ResponseBuilder.build_response(
-                    data={
-                        "activity_id": activity_id,
-                        "format": "FIT",
-                        "size_bytes": len(file_content),
-                        "content_base64": encoded,
-                        "note": "File content is base64 encoded. Decode to get FIT file.",
-                    },
-                    query_type="download_fit_file",
-                )
+            return ResponseBuilder.build_response(
+                data={
+                    "activity_id": activity_id,
+                    "format": "FIT",
+                    "size_bytes": len(file_content),
+                    "content_base64": encoded,
+                    "note": "File content is base64 encoded. Decode to get FIT file.",
+                },
+                query_type="download_fit_file",
+            )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -588,49 +583,44 @@ async def download_gpx_file(
         JSON string with file info and base64-encoded content (if no output_path)
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            file_content = await client.download_gpx_file(activity_id)
-
-            if output_path:
-                # Save to file
-                import os
-
-                os.makedirs(
-                    os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
-                    exist_ok=True,
-                )
-                with open(output_path, "wb") as f:
-                    f.write(file_content)
-
-                return ResponseBuilder.build_response(
-                    data={
-                        "activity_id": activity_id,
-                        "format": "GPX",
-                        "saved_to": output_path,
-                        "size_bytes": len(file_content),
-                    },
-                    query_type="download_gpx_file",
-                    metadata={"message": f"GPX file saved to {output_path}"},
-                )
-            else:
-                # Return base64 encoded
-                import base64
-
-                encoded = base64.b64encode(file_content).decode("utf-8")
-
-                return ResponseBuilder.build_response(
-                    data={
-                        "activity_id": activity_id,
-                        "format": "GPX",
-                        "size_bytes": len(file_content),
-                        "content_base64": encoded,
-                        "note": "File content is base64 encoded. Decode to get GPX file.",
-                    },
-                    query_type="download_gpx_file",
-                )
+        file_content = await client.download_gpx_file(activity_id)
+
+        if output_path:
+            # Save to file
+            os.makedirs(
+                os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
+                exist_ok=True,
+            )
+            with open(output_path, "wb") as f:
+                f.write(file_content)
+
+            return ResponseBuilder.build_response(
+                data={
+                    "activity_id": activity_id,
+                    "format": "GPX",
+                    "saved_to": output_path,
+                    "size_bytes": len(file_content),
+                },
+                query_type="download_gpx_file",
+                metadata={"message": f"GPX file saved to {output_path}"},
+            )
+        else:
+            # Return base64 encoded
+            encoded = base64.b64encode(file_content).decode("utf-8")
+
+            return ResponseBuilder.build_response(
+                data={
+                    "activity_id": activity_id,
+                    "format": "GPX",
+                    "size_bytes": len(file_content),
+                    "content_base64": encoded,
+                    "note": "File content is base64 encoded. Decode to get GPX file.",
+                },
+                query_type="download_gpx_file",
+            )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -659,7 +649,7 @@ async def search_activities_full(
         JSON string with complete activity details for matches
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     if not query.strip():
         return ResponseBuilder.build_error_response(
@@ -668,65 +658,64 @@ async def search_activities_full(
         )
 
     try:
-        async with ICUClient(config) as client:
-            activities = await client.search_activities_full(
-                query=query,
-                limit=min(limit, 100),
-            )
-
-            if not activities:
-                return ResponseBuilder.build_response(
-                    data={"activities": [], "count": 0, "query": query},
-                    metadata={"message": f"No activities found matching '{query}'"},
-                )
-
-            activities_data: list[dict[str, Any]] = []
-            for activity in activities:
-                activity_item: dict[str, Any] = {
-                    "id": activity.id,
-                    "name": activity.name or "Untitled",
-                    "type": activity.type,
-                    "start_date": activity.start_date_local,
-                }
-
-                # Basic metrics
-                if activity.distance:
-                    activity_item["distance_meters"] = activity.distance
-                if activity.moving_time:
-                    activity_item["moving_time_seconds"] = activity.moving_time
-                if activity.total_elevation_gain:
-                    activity_item["elevation_gain_meters"] = activity.total_elevation_gain
-
-                # Performance metrics
-                performance: dict[str, Any] = {}
-                if activity.average_watts:
-                    performance["average_watts"] = activity.average_watts
-                if activity.normalized_power:
-                    performance["normalized_power"] = activity.normalized_power
-                if activity.average_heartrate:
-                    performance["average_heartrate"] = activity.average_heartrate
-                if activity.average_cadence:
-                    performance["average_cadence"] = activity.average_cadence
-                if performance:
-                    activity_item["performance"] = performance
-
-                # Training load
-                if activity.icu_training_load:
-                    activity_item["training_load"] = activity.icu_training_load
-                if activity.icu_intensity:
-                    activity_item["intensity_factor"] = activity.icu_intensity
-
-                activities_data.append(activity_item)
+        activities = await client.search_activities_full(
+            query=query,
+            limit=min(limit, 100),
+        )
 
+        if not activities:
             return ResponseBuilder.build_response(
-                data={
-                    "activities": activities_data,
-                    "count": len(activities_data),
-                    "query": query,
-                },
-                query_type="search_activities_full",
+                data={"activities": [], "count": 0, "query": query},
+                metadata={"message": f"No activities found matching '{query}'"},
             )
 
+        activities_data: list[dict[str, Any]] = []
+        for activity in activities:
+            activity_item: dict[str, Any] = {
+                "id": activity.id,
+                "name": activity.name or "Untitled",
+                "type": activity.type,
+                "start_date": activity.start_date_local,
+            }
+
+            # Basic metrics
+            if activity.distance:
+                activity_item["distance_meters"] = activity.distance
+            if activity.moving_time:
+                activity_item["moving_time_seconds"] = activity.moving_time
+            if activity.total_elevation_gain:
+                activity_item["elevation_gain_meters"] = activity.total_elevation_gain
+
+            # Performance metrics
+            performance: dict[str, Any] = {}
+            if activity.average_watts:
+                performance["average_watts"] = activity.average_watts
+            if activity.normalized_power:
+                performance["normalized_power"] = activity.normalized_power
+            if activity.average_heartrate:
+                performance["average_heartrate"] = activity.average_heartrate
+            if activity.average_cadence:
+                performance["average_cadence"] = activity.average_cadence
+            if performance:
+                activity_item["performance"] = performance
+
+            # Training load
+            if activity.icu_training_load:
+                activity_item["training_load"] = activity.icu_training_load
+            if activity.icu_intensity:
+                activity_item["intensity_factor"] = activity.icu_intensity
+
+            activities_data.append(activity_item)
+
+        return ResponseBuilder.build_response(
+            data={
+                "activities": activities_data,
+                "count": len(activities_data),
+                "query": query,
+            },
+            query_type="search_activities_full",
+        )
+
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
     except Exception as e:
@@ -754,85 +743,84 @@ async def get_activities_around(
         JSON string with activities around the reference activity
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            activities = await client.get_activities_around(
-                activity_id=activity_id,
-                count=count,
+        activities = await client.get_activities_around(
+            activity_id=activity_id,
+            count=count,
+        )
+
+        if not activities:
+            return ResponseBuilder.build_response(
+                data={
+                    "activities": [],
+                    "count": 0,
+                    "reference_activity_id": activity_id,
+                },
+                metadata={"message": "No activities found around the reference activity"},
             )
 
-            if not activities:
-                return ResponseBuilder.build_response(
-                    data={
-                        "activities": [],
-                        "count": 0,
-                        "reference_activity_id": activity_id,
-                    },
-                    metadata={"message": "No activities found around the reference activity"},
-                )
-
-            # Sort by date
-            activities.sort(key=lambda x: x.start_date_local)
-
-            # Find the reference activity position
-            ref_index = next((i for i, a in enumerate(activities) if a.id == activity_id), None)
-
-            activities_data: list[dict[str, Any]] = []
-            for i, activity in enumerate(activities):
-                activity_item: dict[str, Any] = {
-                    "id": activity.id,
-                    "name": activity.name or "Untitled",
-                    "type": activity.type,
-                    "start_date": activity.start_date_local,
-                }
-
-                # Mark if this is the reference activity
-                if activity.id == activity_id:
-                    activity_item["is_reference"] = True
-                elif ref_index is not None:
-                    if i < ref_index:
-                        activity_item["position"] = "before"
-                        activity_item["days_before"] = ref_index - i
-                    else:
-                        activity_item["position"] = "after"
-                        activity_item["days_after"] = i - ref_index
-
-                # Basic metrics
-                if activity.distance:
-                    activity_item["distance_meters"] = activity.distance
-                if activity.moving_time:
-                    activity_item["moving_time_seconds"] = activity.moving_time
-                if activity.icu_training_load:
-                    activity_item["training_load"] = activity.icu_training_load
-
-                # Performance summary
-                performance: dict[str, Any] = {}
-                if activity.average_watts:
-                    performance["average_watts"] = activity.average_watts
-                if activity.average_heartrate:
-                    performance["average_heartrate"] = activity.average_heartrate
-                if performance:
-                    activity_item["performance"] = performance
-
-                activities_data.append(activity_item)
-
-            result_data = {
-                "reference_activity_id": activity_id,
-                "activities": activities_data,
-                "count": len(activities_data),
+        # Sort by date
+        activities.sort(key=lambda x: x.start_date_local)
+
+        # Find the reference activity position
+        ref_index = next((i for i, a in enumerate(activities) if a.id == activity_id), None)
+
+        activities_data: list[dict[str, Any]] = []
+        for i, activity in enumerate(activities):
+            activity_item: dict[str, Any] = {
+                "id": activity.id,
+                "name": activity.name or "Untitled",
+                "type": activity.type,
+                "start_date": activity.start_date_local,
             }
 
-            if ref_index is not None:
-                result_data["reference_position"] = ref_index
-                result_data["activities_before"] = ref_index
-                result_data["activities_after"] = len(activities) - ref_index - 1
+            # Mark if this is the reference activity
+            if activity.id == activity_id:
+                activity_item["is_reference"] = True
+            elif ref_index is not None:
+                if i < ref_index:
+                    activity_item["position"] = "before"
+                    activity_item["days_before"] = ref_index - i
+                else:
+                    activity_item["position"] = "after"
+                    activity_item["days_after"] = i - ref_index
+
+            # Basic metrics
+            if activity.distance:
+                activity_item["distance_meters"] = activity.distance
+            if activity.moving_time:
+                activity_item["moving_time_seconds"] = activity.moving_time
+            if activity.icu_training_load:
+                activity_item["training_load"] = activity.icu_training_load
 
-            return ResponseBuilder.build_response(
-                data=result_data,
-                query_type="activities_around",
-            )
+            # Performance summary
+            performance: dict[str, Any] = {}
+            if activity.average_watts:
+                performance["average_watts"] = activity.average_watts
+            if activity.average_heartrate:
+                performance["average_heartrate"] = activity.average_heartrate
+            if performance:
+                activity_item["performance"] = performance
+
+            activities_data.append(activity_item)
+
+        result_data = {
+            "reference_activity_id": activity_id,
+            "activities": activities_data,
+            "count": len(activities_data),
+        }
+
+        if ref_index is not None:
+            result_data["reference_position"] = ref_index
+            result_data["activities_before"] = ref_index
+            result_data["activities_after"] = len(activities) - ref_index - 1
+
+        return ResponseBuilder.build_response(
+            data=result_data,
+            query_type="activities_around",
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -1,11 +1,11 @@
 """Event/calendar management tools for Intervals.icu MCP server."""
 
+import json
 from datetime import datetime
 from typing import Annotated, Any
 
 from fastmcp import Context
 
-from ..auth import ICUConfig
 from ..client import ICUAPIError, ICUClient
 from ..response_builder import ResponseBuilder
 
@@ -40,7 +40,7 @@ async def create_event(
         JSON string with created event data
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     # Validate category
     valid_categories = ["WORKOUT", "NOTE", "RACE", "GOAL"]
@@ -78,32 +78,31 @@ async def create_event(
         if training_load:
             event_data["icu_training_load"] = training_load
 
-        async with ICUClient(config) as client:
-            event = await client.create_event(event_data)
+        event = await client.create_event(event_data)
 
-            event_result: dict[str, Any] = {
-                "id": event.id,
-                "start_date": event.start_date_local,
-                "name": event.name,
-                "category": event.category,
-            }
-
-            if event.description:
-                event_result["description"] = event.description
-            if event.type:
-                event_result["type"] = event.type
-            if event.moving_time:
-                event_result["duration_seconds"] = event.moving_time
-            if event.distance:
-                event_result["distance_meters"] = event.distance
-            if event.icu_training_load:
-                event_result["training_load"] = event.icu_training_load
+        event_result: dict[str, Any] = {
+            "id": event.id,
+            "start_date": event.start_date_local,
+            "name": event.name,
+            "category": event.category,
+        }
 
-            return ResponseBuilder.build_response(
-                data=event_result,
-                query_type="create_event",
-                metadata={"message": f"Successfully created {category.lower()}: {name}"},
-            )
+        if event.description:
+            event_result["description"] = event.description
+        if event.type:
+            event_result["type"] = event.type
+        if event.moving_time:
+            event_result["duration_seconds"] = event.moving_time
+        if event.distance:
+            event_result["distance_meters"] = event.distance
+        if event.icu_training_load:
+            event_result["training_load"] = event.icu_training_load
+
+        return ResponseBuilder.build_response(
+            data=event_result,
+            query_type="create_event",
+            metadata={"message": f"Successfully created {category.lower()}: {name}"},
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -143,7 +142,7 @@ async def update_event(
         JSON string with updated event data
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     # Validate date format if provided
     if start_date:
@@ -180,32 +179,31 @@ async def update_event(
                 error_type="validation_error",
             )
 
-        async with ICUClient(config) as client:
-            event = await client.update_event(event_id, event_data)
-
-            event_result: dict[str, Any] = {
-                "id": event.id,
-                "start_date": event.start_date_local,
-                "name": event.name,
-                "category": event.category,
-            }
+        event = await client.update_event(event_id, event_data)
 
-            if event.description:
-                event_result["description"] = event.description
-            if event.type:
-                event_result["type"] = event.type
-            if event.moving_time:
-                event_result["duration_seconds"] = event.moving_time
-            if event.distance:
-                event_result["distance_meters"] = event.distance
-            if event.icu_training_load:
-                event_result["training_load"] = event.icu_training_load
+        event_result: dict[str, Any] = {
+            "id": event.id,
+            "start_date": event.start_date_local,
+            "name": event.name,
+            "category": event.category,
+        }
 
-            return ResponseBuilder.build_response(
-                data=event_result,
-                query_type="update_event",
-                metadata={"message": f"Successfully updated event {event_id}"},
-            )
+        if event.description:
+            event_result["description"] = event.description
+        if event.type:
+            event_result["type"] = event.type
+        if event.moving_time:
+            event_result["duration_seconds"] = event.moving_time
+        if event.distance:
+            event_result["distance_meters"] = event.distance
+        if event.icu_training_load:
+            event_result["training_load"] = event.icu_training_load
+
+        return ResponseBuilder.build_response(
+            data=event_result,
+            query_type="update_event",
+            metadata={"message": f"Successfully updated event {event_id}"},
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -230,23 +228,22 @@ async def delete_event(
         JSON string with deletion confirmation
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            success = await client.delete_event(event_id)
-
-            if success:
-                return ResponseBuilder.build_response(
-                    data={"event_id": event_id, "deleted": True},
-                    query_type="delete_event",
-                    metadata={"message": f"Successfully deleted event {event_id}"},
-                )
-            else:
-                return ResponseBuilder.build_error_response(
-                    f"Failed to delete event {event_id}",
-                    error_type="api_error",
-                )
+        success = await client.delete_event(event_id)
+
+        if success:
+            return ResponseBuilder.build_response(
+                data={"event_id": event_id, "deleted": True},
+                query_type="delete_event",
+                metadata={"message": f"Successfully deleted event {event_id}"},
+            )
+        else:
+            return ResponseBuilder.build_error_response(
+                f"Failed to delete event {event_id}",
+                error_type="api_error",
+            )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -275,11 +272,9 @@ async def bulk_create_events(
         JSON string with created events
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        import json
-
         # Parse the JSON string
         try:
             parsed_data = json.loads(events)
@@ -331,39 +326,38 @@ async def bulk_create_events(
                     error_type="validation_error",
                 )
 
-        async with ICUClient(config) as client:
-            created_events = await client.bulk_create_events(events_data)
-
-            events_result: list[dict[str, Any]] = []
-            for event in created_events:
-                event_info: dict[str, Any] = {
-                    "id": event.id,
-                    "start_date": event.start_date_local,
-                    "name": event.name,
-                    "category": event.category,
-                }
-
-                if event.description:
-                    event_info["description"] = event.description
-                if event.type:
-                    event_info["type"] = event.type
-                if event.moving_time:
-                    event_info["duration_seconds"] = event.moving_time
-                if event.distance:
-                    event_info["distance_meters"] = event.distance
-                if event.icu_training_load:
-                    event_info["training_load"] = event.icu_training_load
-
-                events_result.append(event_info)
+        created_events = await client.bulk_create_events(events_data)
 
-            return ResponseBuilder.build_response(
-                data={"events": events_result},
-                query_type="bulk_create_events",
-                metadata={
-                    "message": f"Successfully created {len(created_events)} events",
-                    "count": len(created_events),
-                },
-            )
+        events_result: list[dict[str, Any]] = []
+        for event in created_events:
+            event_info: dict[str, Any] = {
+                "id": event.id,
+                "start_date": event.start_date_local,
+                "name": event.name,
+                "category": event.category,
+            }
+
+            if event.description:
+                event_info["description"] = event.description
+            if event.type:
+                event_info["type"] = event.type
+            if event.moving_time:
+                event_info["duration_seconds"] = event.moving_time
+            if event.distance:
+                event_info["distance_meters"] = event.distance
+            if event.icu_training_load:
+                event_info["training_load"] = event.icu_training_load
+
+            events_result.append(event_info)
+
+        return ResponseBuilder.build_response(
+            data={"events": events_result},
+            query_type="bulk_create_events",
+            metadata={
+                "message": f"Successfully created {len(created_events)} events",
+                "count": len(created_events),
+            },
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -389,11 +383,9 @@ async def bulk_delete_events(
         JSON string with deletion confirmation
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        import json
-
         # Parse the JSON string
         try:
             parsed_data = json.loads(event_ids)
@@ -415,14 +407,13 @@ async def bulk_delete_events(
         # Type cast after validation
         ids_list: list[int] = parsed_data  # type: ignore[assignment]
 
-        async with ICUClient(config) as client:
-            result = await client.bulk_delete_events(ids_list)
+        result = await client.bulk_delete_events(ids_list)
 
-            return ResponseBuilder.build_response(
-                data={"deleted_count": len(ids_list), "event_ids": ids_list, "result": result},
-                query_type="bulk_delete_events",
-                metadata={"message": f"Successfully deleted {len(ids_list)} events"},
-            )
+        return ResponseBuilder.build_response(
+            data={"deleted_count": len(ids_list), "event_ids": ids_list, "result": result},
+            query_type="bulk_delete_events",
+            metadata={"message": f"Successfully deleted {len(ids_list)} events"},
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -450,7 +441,7 @@ async def duplicate_event(
         JSON string with the duplicated event
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     # Validate date format
     try:
@@ -462,36 +453,35 @@ async def duplicate_event(
         )
 
     try:
-        async with ICUClient(config) as client:
-            duplicated_event = await client.duplicate_event(event_id, new_date)
-
-            event_result: dict[str, Any] = {
-                "id": duplicated_event.id,
-                "start_date": duplicated_event.start_date_local,
-                "name": duplicated_event.name,
-                "category": duplicated_event.category,
-                "original_event_id": event_id,
-            }
-
-            if duplicated_event.description:
-                event_result["description"] = duplicated_event.description
-            if duplicated_event.type:
-                event_result["type"] = duplicated_event.type
-            if duplicated_event.moving_time:
-                event_result["duration_seconds"] = duplicated_event.moving_time
-            if duplicated_event.distance:
-                event_result["distance_meters"] = duplicated_event.distance
-            if duplicated_event.icu_training_load:
-                event_result["training_load"] = duplicated_event.icu_training_load
+        duplicated_event = await client.duplicate_event(event_id, new_date)
+
+        event_result: dict[str, Any] = {
+            "id": duplicated_event.id,
+            "start_date": duplicated_event.start_date_local,
+            "name": duplicated_event.name,
+            "category": duplicated_event.category,
+            "original_event_id": event_id,
+        }
 
-            return ResponseBuilder.build_response(
-                data=event_result,
-                query_type="duplicate_event",
-                metadata={
-                    "message": f"Successfully duplicated event {event_id} to {new_date}",
-                    "original_event_id": event_id,
-                },
-            )
+        if duplicated_event.description:
+            event_result["description"] = duplicated_event.description
+        if duplicated_event.type:
+            event_result["type"] = duplicated_event.type
+        if duplicated_event.moving_time:
+            event_result["duration_seconds"] = duplicated_event.moving_time
+        if duplicated_event.distance:
+            event_result["distance_meters"] = duplicated_event.distance
+        if duplicated_event.icu_training_load:
+            event_result["training_load"] = duplicated_event.icu_training_load
+
+        return ResponseBuilder.build_response(
+            data=event_result,
+            query_type="duplicate_event",
+            metadata={
+                "message": f"Successfully duplicated event {event_id} to {new_date}",
+                "original_event_id": event_id,
+            },
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -1,14 +1,99 @@
 """Calendar and event tools for Intervals.icu MCP server."""
 
-from datetime import datetime, timedelta
+import asyncio
+import heapq
+from collections import Counter, defaultdict
+from datetime import date as _date
+from datetime import timedelta
+from operator import attrgetter
 from typing import Annotated, Any
 
 from fastmcp import Context
 
-from ..auth import ICUConfig
 from ..client import ICUAPIError, ICUClient
+from ..models import Event
 from ..response_builder import ResponseBuilder
 
+# Calendar reads ending within this many days of today all fetch the same window, so
+# they are served from the client's response cache instead of separate requests
+_EVENT_WINDOW_DAYS = 30
+
+# Relative timing labels for offsets within a year, built once instead of per event
+_IN_DAYS = tuple(f"in_{i}_days" for i in range(366))
+_DAYS_AGO = tuple(f"{i}_days_ago" for i in range(366))
+
+
+async def _fetch_events(client: ICUClient, oldest: str, newest: str) -> list[Event]:
+    """Fetch events from oldest to newest, widening short look-aheads to the shared window.
+
+    Events are built without validation: the calendar tools only read a few fields, and
+    validating every field of a large calendar costs more than the formatting itself.
+    """
+    window_newest = (_date.today() + timedelta(days=_EVENT_WINDOW_DAYS)).isoformat()
+    if newest >= window_newest:
+        return await client.get_events(oldest=oldest, newest=newest, validate=False)
+
+    events = await client.get_events(oldest=oldest, newest=window_newest, validate=False)
+    return [e for e in events if e.start_date_local[:10] <= newest]
+
+
+def _relative_timing(days: int) -> str:
+    """Describe an offset in days from today, e.g. "today", "in_3_days" or "2_days_ago"."""
+    if days == 0:
+        return "today"
+    if days > 0:
+        return _IN_DAYS[days] if days < len(_IN_DAYS) else f"in_{days}_days"
+    return _DAYS_AGO[-days] if -days < len(_DAYS_AGO) else f"{-days}_days_ago"
+
+
+def _add_workout_metrics(item: dict[str, Any], event: Event) -> None:
+    """Add the planned distance, duration, load and intensity of a workout to item."""
+    distance = event.distance or event.distance_target
+    if distance:
+        item["distance_meters"] = distance
+    if event.moving_time:
+        item["duration_seconds"] = event.moving_time
+    if event.icu_training_load:
+        item["training_load"] = event.icu_training_load
+    if event.icu_intensity:
+        item["intensity_factor"] = event.icu_intensity
+
+
+def _event_to_item(event: Event, date: str, relative_timing: str) -> dict[str, Any]:
+    """Build the calendar entry for an event."""
+    category = event.category
+    item: dict[str, Any] = {
+        "date": date,
+        "relative_timing": relative_timing,
+        "name": event.name or category or "Event",
+        "category": category,
+    }
+    if event.type:
+        item["type"] = event.type
+    if category == "WORKOUT":
+        _add_workout_metrics(item, event)
+    if event.description:
+        item["description"] = event.description.strip()
+    return item
+
+
+def _workout_to_item(workout: Event, today: _date) -> dict[str, Any]:
+    """Build the upcoming-workout entry for a planned workout."""
+    # Extract date part only (handle both "YYYY-MM-DD" and "YYYY-MM-DDTHH:MM:SS")
+    date = workout.start_date_local.split("T")[0]
+    days_until = (_date.fromisoformat(date) - today).days
+    item: dict[str, Any] = {
+        "date": date,
+        "relative_timing": "tomorrow" if days_until == 1 else _relative_timing(days_until),
+        "name": workout.name or "Workout",
+    }
+    if workout.type:
+        item["type"] = workout.type
+    _add_workout_metrics(item, workout)
+    if workout.description:
+        item["description"] = workout.description.strip()
+    return item
+
 
 async def get_calendar_events(
     days_ahead: Annotated[int, "Number of days to look ahead"] = 7,
@@ -28,115 +113,67 @@ async def get_calendar_events(
         JSON string with calendar events
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
         # Calculate date range
-        oldest_date = datetime.now() - timedelta(days=days_back)
-        newest_date = datetime.now() + timedelta(days=days_ahead)
-
-        oldest = oldest_date.strftime("%Y-%m-%d")
-        newest = newest_date.strftime("%Y-%m-%d")
-
-        async with ICUClient(config) as client:
-            events = await client.get_events(
-                oldest=oldest,
-                newest=newest,
-            )
+        today = _date.today()
+        oldest = (today - timedelta(days=days_back)).isoformat()
+        newest = (today + timedelta(days=days_ahead)).isoformat()
 
-            if not events:
-                return ResponseBuilder.build_response(
-                    data={
-                        "events": [],
-                        "count": 0,
-                        "date_range": {"oldest": oldest, "newest": newest},
-                    },
-                    metadata={
-                        "message": "No events found on your calendar for the specified period"
-                    },
-                )
-
-            # Sort by date
-            events.sort(key=lambda x: x.start_date_local)
-
-            # Group events by date
-            events_by_date: dict[str, list[dict[str, Any]]] = {}
-            for event in events:
-                # Extract date part only (handle both "YYYY-MM-DD" and "YYYY-MM-DDTHH:MM:SS")
-                date = event.start_date_local.split("T")[0]
-                if date not in events_by_date:
-                    events_by_date[date] = []
-
-                # Determine relative timing
-                date_obj = datetime.strptime(date, "%Y-%m-%d").date()
-                today = datetime.now().date()
-
-                if date_obj == today:
-                    relative_timing = "today"
-                elif date_obj < today:
-                    days_ago = (today - date_obj).days
-                    relative_timing = f"{days_ago}_days_ago"
-                else:
-                    days_until = (date_obj - today).days
-                    relative_timing = f"in_{days_until}_days"
-
-                event_item: dict[str, Any] = {
-                    "date": date,
-                    "relative_timing": relative_timing,
-                    "name": event.name or event.category or "Event",
-                    "category": event.category,
-                }
-
-                if event.type:
-                    event_item["type"] = event.type
-
-                # Workout details
-                if event.category == "WORKOUT":
-                    if event.distance or event.distance_target:
-                        distance = event.distance or event.distance_target
-                        if distance:
-                            event_item["distance_meters"] = distance
-
-                    if event.moving_time:
-                        event_item["duration_seconds"] = event.moving_time
-
-                    if event.icu_training_load:
-                        event_item["training_load"] = event.icu_training_load
-
-                    if event.icu_intensity:
-                        event_item["intensity_factor"] = event.icu_intensity
-
-                # Description
-                if event.description:
-                    event_item["description"] = event.description.strip()
-
-                events_by_date[date].append(event_item)
-
-            # Calculate summary
-            workout_count = sum(1 for e in events if e.category == "WORKOUT")
-            race_count = sum(1 for e in events if e.category == "RACE")
-            note_count = sum(1 for e in events if e.category == "NOTE")
-            goal_count = sum(1 for e in events if e.category == "GOAL")
-
-            summary = {
-                "total_events": len(events),
-                "by_category": {
-                    "workouts": workout_count,
-                    "races": race_count,
-                    "notes": note_count,
-                    "goals": goal_count,
-                },
-            }
+        events = await _fetch_events(client, oldest, newest)
 
+        if not events:
             return ResponseBuilder.build_response(
                 data={
-                    "events_by_date": events_by_date,
+                    "events": [],
+                    "count": 0,
                     "date_range": {"oldest": oldest, "newest": newest},
-                    "summary": summary,
                 },
-                query_type="calendar_events",
+                metadata={"message": "No events found on your calendar for the specified period"},
             )
 
+        # Sort by date
+        events.sort(key=attrgetter("start_date_local"))
+
+        # Group events by date
+        events_by_date: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        # Relative timing per date, since several events often share a day
+        timing_by_date: dict[str, str] = {}
+        category_counts: Counter[str | None] = Counter()
+        for event in events:
+            # Extract date part only (handle both "YYYY-MM-DD" and "YYYY-MM-DDTHH:MM:SS")
+            date = event.start_date_local.split("T")[0]
+
+            # Determine relative timing
+            relative_timing = timing_by_date.get(date)
+            if relative_timing is None:
+                relative_timing = _relative_timing((_date.fromisoformat(date) - today).days)
+                timing_by_date[date] = relative_timing
+
+            events_by_date[date].append(_event_to_item(event, date, relative_timing))
+            category_counts[event.category] += 1
+
+        # Calculate summary
+        summary = {
+            "total_events": len(events),
+            "by_category": {
+                "workouts": category_counts["WORKOUT"],
+                "races": category_counts["RACE"],
+                "notes": category_counts["NOTE"],
+                "goals": category_counts["GOAL"],
+            },
+        }
+
+        return ResponseBuilder.build_response(
+            data={
+                "events_by_date": events_by_date,
+                "date_range": {"oldest": oldest, "newest": newest},
+                "summary": summary,
+            },
+            query_type="calendar_events",
+        )
+
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
     except Exception as e:
@@ -161,89 +198,41 @@ async def get_upcoming_workouts(
         JSON string with upcoming workouts
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
         # Look ahead 30 days to find workouts
-        oldest = datetime.now().strftime("%Y-%m-%d")
-        newest_date = datetime.now() + timedelta(days=30)
-        newest = newest_date.strftime("%Y-%m-%d")
-
-        async with ICUClient(config) as client:
-            events = await client.get_events(
-                oldest=oldest,
-                newest=newest,
-            )
-
-            # Filter for workouts only
-            workouts = [e for e in events if e.category == "WORKOUT"]
-
-            if not workouts:
-                return ResponseBuilder.build_response(
-                    data={"workouts": [], "count": 0},
-                    metadata={"message": "No workouts planned on your calendar"},
-                )
-
-            # Sort by date and limit
-            workouts.sort(key=lambda x: x.start_date_local)
-            workouts = workouts[:limit]
-
-            workouts_data: list[dict[str, Any]] = []
-            for workout in workouts:
-                # Extract date part only (handle both "YYYY-MM-DD" and "YYYY-MM-DDTHH:MM:SS")
-                date = workout.start_date_local.split("T")[0]
-                date_obj = datetime.strptime(date, "%Y-%m-%d").date()
-                today = datetime.now().date()
-
-                if date_obj == today:
-                    relative_timing = "today"
-                elif date_obj == today + timedelta(days=1):
-                    relative_timing = "tomorrow"
-                else:
-                    days_until = (date_obj - today).days
-                    relative_timing = f"in_{days_until}_days"
-
-                workout_item: dict[str, Any] = {
-                    "date": date,
-                    "relative_timing": relative_timing,
-                    "name": workout.name or "Workout",
-                }
+        today = _date.today()
+        oldest = today.isoformat()
+        newest = (today + timedelta(days=_EVENT_WINDOW_DAYS)).isoformat()
 
-                if workout.type:
-                    workout_item["type"] = workout.type
+        # Filter the shared calendar window rather than asking the API for workouts only,
+        # so this and get_calendar_events are served by one cached request
+        events = await _fetch_events(client, oldest, newest)
+        workouts = [e for e in events if e.category == "WORKOUT"]
 
-                # Workout metrics
-                if workout.distance or workout.distance_target:
-                    distance = workout.distance or workout.distance_target
-                    if distance:
-                        workout_item["distance_meters"] = distance
-
-                if workout.moving_time:
-                    workout_item["duration_seconds"] = workout.moving_time
-
-                if workout.icu_training_load:
-                    workout_item["training_load"] = workout.icu_training_load
-
-                if workout.icu_intensity:
-                    workout_item["intensity_factor"] = workout.icu_intensity
+        if not workouts:
+            return ResponseBuilder.build_response(
+                data={"workouts": [], "count": 0},
+                metadata={"message": "No workouts planned on your calendar"},
+            )
 
-                # Workout description
-                if workout.description:
-                    workout_item["description"] = workout.description.strip()
+        # Earliest workouts up to the limit, in date order
+        workouts = heapq.nsmallest(limit, workouts, key=attrgetter("start_date_local"))
 
-                workouts_data.append(workout_item)
+        workouts_data = [_workout_to_item(workout, today) for workout in workouts]
 
-            # Calculate total load
-            total_load = sum(w.icu_training_load or 0 for w in workouts)
+        # Calculate total load
+        total_load = sum(w.icu_training_load or 0 for w in workouts)
 
-            return ResponseBuilder.build_response(
-                data={
-                    "workouts": workouts_data,
-                    "count": len(workouts_data),
-                    "total_planned_load": total_load if total_load > 0 else None,
-                },
-                query_type="upcoming_workouts",
-            )
+        return ResponseBuilder.build_response(
+            data={
+                "workouts": workouts_data,
+                "count": len(workouts_data),
+                "total_planned_load": total_load if total_load > 0 else None,
+            },
+            query_type="upcoming_workouts",
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -269,66 +258,164 @@ async def get_event(
         JSON string with event details
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            event = await client.get_event(event_id)
+        event = await client.get_event(event_id)
+
+        # Extract date part only (handle both "YYYY-MM-DD" and "YYYY-MM-DDTHH:MM:SS")
+        date = event.start_date_local.split("T")[0]
+
+        event_data: dict[str, Any] = {
+            "id": event.id,
+            "date": date,
+            "name": event.name or event.category or "Event",
+            "category": event.category,
+        }
+
+        if event.description:
+            event_data["description"] = event.description
+        if event.type:
+            event_data["type"] = event.type
+
+        # Workout/Event metrics
+        metrics: dict[str, Any] = {}
+        if event.distance or event.distance_target:
+            distance = event.distance or event.distance_target
+            if distance:
+                metrics["distance_meters"] = distance
+        if event.moving_time:
+            metrics["duration_seconds"] = event.moving_time
+        if event.icu_training_load:
+            metrics["training_load"] = event.icu_training_load
+        if event.icu_intensity:
+            metrics["intensity_factor"] = event.icu_intensity
+        if event.joules:
+            metrics["joules"] = event.joules
+        if event.joules_above_ftp:
+            metrics["joules_above_ftp"] = event.joules_above_ftp
+
+        if metrics:
+            event_data["metrics"] = metrics
+
+        # Fitness context
+        fitness: dict[str, Any] = {}
+        if event.icu_ctl is not None:
+            fitness["ctl"] = round(event.icu_ctl, 1)
+        if event.icu_atl is not None:
+            fitness["atl"] = round(event.icu_atl, 1)
+        if fitness:
+            event_data["fitness_context"] = fitness
+
+        # Metadata
+        if event.color:
+            event_data["color"] = event.color
+        if event.external_id:
+            event_data["external_id"] = event.external_id
+
+        return ResponseBuilder.build_response(
+            data=event_data,
+            query_type="get_event",
+        )
 
-            # Extract date part only (handle both "YYYY-MM-DD" and "YYYY-MM-DDTHH:MM:SS")
-            date = event.start_date_local.split("T")[0]
+    except ICUAPIError as e:
+        return ResponseBuilder.build_error_response(e.message, error_type="api_error")
+    except Exception as e:
+        return ResponseBuilder.build_error_response(
+            f"Unexpected error: {str(e)}", error_type="internal_error"
+        )
 
-            event_data: dict[str, Any] = {
-                "id": event.id,
-                "date": date,
-                "name": event.name or event.category or "Event",
-                "category": event.category,
-            }
 
-            if event.description:
-                event_data["description"] = event.description
+async def get_training_context(
+    days_back: Annotated[int, "Number of days of wellness history to include"] = 7,
+    days_ahead: Annotated[int, "Number of days of planned events to include"] = 7,
+    ctx: Context | None = None,
+) -> str:
+    """Get current fitness, recent wellness, and upcoming calendar events in one call.
+
+    Fetches the athlete profile, wellness records, and calendar events concurrently.
+    Useful for planning or reviewing training without calling get_fitness_summary,
+    get_wellness_data, and get_calendar_events one after another.
+
+    Args:
+        days_back: Number of days of wellness history to include (default 7)
+        days_ahead: Number of days of planned events to include (default 7)
+
+    Returns:
+        JSON string with fitness, wellness, and upcoming events
+    """
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("icu_client")
+
+    try:
+        today = _date.today()
+        oldest = (today - timedelta(days=days_back)).isoformat()
+        newest = (today + timedelta(days=days_ahead)).isoformat()
+
+        # Concurrent HTTP requests; the client's in-flight limit bounds the fan-out
+        athlete, wellness_records, events = await asyncio.gather(
+            client.get_athlete(),
+            client.get_wellness(oldest=oldest, newest=today.isoformat()),
+            _fetch_events(client, today.isoformat(), newest),
+        )
+
+        # Fitness
+        fitness: dict[str, Any] = {}
+        if athlete.ctl is not None:
+            fitness["ctl"] = round(athlete.ctl, 1)
+        if athlete.atl is not None:
+            fitness["atl"] = round(athlete.atl, 1)
+        if athlete.tsb is not None:
+            fitness["tsb"] = round(athlete.tsb, 1)
+        if athlete.ramp_rate is not None:
+            fitness["ramp_rate"] = round(athlete.ramp_rate, 1)
+
+        # Wellness (most recent first)
+        wellness_records.sort(key=attrgetter("id"), reverse=True)
+        wellness_data: list[dict[str, Any]] = []
+        for record in wellness_records:
+            day_data: dict[str, Any] = {"date": record.id}
+            if record.hrv:
+                day_data["hrv_rmssd"] = round(record.hrv, 1)
+            if record.resting_hr:
+                day_data["resting_hr"] = record.resting_hr
+            if record.sleep_secs:
+                day_data["sleep_seconds"] = record.sleep_secs
+            if record.fatigue:
+                day_data["fatigue"] = record.fatigue
+            if record.soreness:
+                day_data["soreness"] = record.soreness
+            if record.readiness:
+                day_data["readiness"] = round(record.readiness, 0)
+            wellness_data.append(day_data)
+
+        # Upcoming events
+        events.sort(key=attrgetter("start_date_local"))
+        events_data: list[dict[str, Any]] = []
+        for event in events:
+            category = event.category
+            event_item: dict[str, Any] = {
+                "date": event.start_date_local.split("T")[0],
+                "name": event.name or category or "Event",
+                "category": category,
+            }
             if event.type:
-                event_data["type"] = event.type
-
-            # Workout/Event metrics
-            metrics: dict[str, Any] = {}
-            if event.distance or event.distance_target:
-                distance = event.distance or event.distance_target
-                if distance:
-                    metrics["distance_meters"] = distance
+                event_item["type"] = event.type
             if event.moving_time:
-                metrics["duration_seconds"] = event.moving_time
+                event_item["duration_seconds"] = event.moving_time
             if event.icu_training_load:
-                metrics["training_load"] = event.icu_training_load
-            if event.icu_intensity:
-                metrics["intensity_factor"] = event.icu_intensity
-            if event.joules:
-                metrics["joules"] = event.joules
-            if event.joules_above_ftp:
-                metrics["joules_above_ftp"] = event.joules_above_ftp
-
-            if metrics:
-                event_data["metrics"] = metrics
-
-            # Fitness context
-            fitness: dict[str, Any] = {}
-            if event.icu_ctl is not None:
-                fitness["ctl"] = round(event.icu_ctl, 1)
-            if event.icu_atl is not None:
-                fitness["atl"] = round(event.icu_atl, 1)
-            if fitness:
-                event_data["fitness_context"] = fitness
-
-            # Metadata
-            if event.color:
-                event_data["color"] = event.color
-            if event.external_id:
-                event_data["external_id"] = event.external_id
-
-            return ResponseBuilder.build_response(
-                data=event_data,
-                query_type="get_event",
-            )
+                event_item["training_load"] = event.icu_training_load
+            events_data.append(event_item)
+
+        return ResponseBuilder.build_response(
+            data={
+                "fitness": fitness,
+                "wellness": wellness_data,
+                "upcoming_events": events_data,
+                "date_range": {"oldest": oldest, "newest": newest},
+            },
+            query_type="training_context",
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
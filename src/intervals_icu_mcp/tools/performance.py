@@ -5,7 +5,6 @@ from typing import Annotated, Any
 
 from fastmcp import Context
 
-from ..auth import ICUConfig
 from ..client import ICUAPIError, ICUClient
 from ..response_builder import ResponseBuilder
 
@@ -35,7 +34,7 @@ async def get_power_curves(
         JSON string with power curve data
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
         # Determine date range
@@ -70,125 +69,124 @@ async def get_power_curves(
             oldest = oldest_date.strftime("%Y-%m-%d")
             period_label = "90_days"
 
-        async with ICUClient(config) as client:
-            power_curve = await client.get_power_curves(oldest=oldest)
+        power_curve = await client.get_power_curves(oldest=oldest)
 
-            if not power_curve.data or len(power_curve.data) == 0:
-                return ResponseBuilder.build_response(
-                    data={"power_curve": [], "period": period_label},
-                    metadata={
-                        "message": f"No power curve data available for {period_label}. "
-                        "Complete some rides with power to build your power curve."
-                    },
-                )
-
-            # Key durations to highlight (in seconds)
-            key_durations = {
-                5: "5_sec",
-                15: "15_sec",
-                30: "30_sec",
-                60: "1_min",
-                120: "2_min",
-                300: "5_min",
-                600: "10_min",
-                1200: "20_min",
-                3600: "1_hour",
-            }
-
-            # Find data points for key durations
-            peak_efforts: dict[str, dict[str, Any]] = {}
-            for seconds, label in key_durations.items():
-                # Find closest data point
-                closest_point = min(
-                    power_curve.data,
-                    key=lambda p: abs(p.secs - seconds),
-                    default=None,
-                )
-
-                if closest_point and abs(closest_point.secs - seconds) <= seconds * 0.1:
-                    # Only include if within 10% of target duration
-                    effort: dict[str, Any] = {
-                        "watts": closest_point.watts,
-                        "duration_seconds": closest_point.secs,
-                    }
-                    if closest_point.date:
-                        effort["date"] = closest_point.date
-                    if closest_point.src_activity_id:
-                        effort["activity_id"] = closest_point.src_activity_id
-
-                    peak_efforts[label] = effort
-
-            # Calculate summary statistics
-            max_power_point = max(power_curve.data, key=lambda p: p.watts or 0)
-            min_duration = min(power_curve.data, key=lambda p: p.secs)
-            max_duration = max(power_curve.data, key=lambda p: p.secs)
-
-            summary: dict[str, Any] = {
-                "total_data_points": len(power_curve.data),
-                "max_power_watts": max_power_point.watts,
-                "max_power_duration_seconds": max_power_point.secs,
-                "duration_range": {
-                    "min_seconds": min_duration.secs,
-                    "max_seconds": max_duration.secs,
+        if not power_curve.data or len(power_curve.data) == 0:
+            return ResponseBuilder.build_response(
+                data={"power_curve": [], "period": period_label},
+                metadata={
+                    "message": f"No power curve data available for {period_label}. "
+                    "Complete some rides with power to build your power curve."
                 },
-            }
-
-            # If we have dates, show range
-            dates = [p.date for p in power_curve.data if p.date]
-            if dates:
-                summary["effort_date_range"] = {"oldest": min(dates), "newest": max(dates)}
+            )
 
-            # Calculate FTP and power zones (based on 20-min power)
-            twenty_min_point = min(
+        # Key durations to highlight (in seconds)
+        key_durations = {
+            5: "5_sec",
+            15: "15_sec",
+            30: "30_sec",
+            60: "1_min",
+            120: "2_min",
+            300: "5_min",
+            600: "10_min",
+            1200: "20_min",
+            3600: "1_hour",
+        }
+
+        # Find data points for key durations
+        peak_efforts: dict[str, dict[str, Any]] = {}
+        for seconds, label in key_durations.items():
+            # Find closest data point
+            closest_point = min(
                 power_curve.data,
-                key=lambda p: abs(p.secs - 1200),
+                key=lambda p: abs(p.secs - seconds),
                 default=None,
             )
 
-            ftp_analysis = None
-            if twenty_min_point and abs(twenty_min_point.secs - 1200) <= 120:
-                # Estimate FTP as 95% of 20-min power
-                estimated_ftp = int((twenty_min_point.watts or 0) * 0.95)
-
-                if estimated_ftp > 0:
-                    # Power zones
-                    zones = {
-                        "recovery": (0, 0.55),
-                        "endurance": (0.56, 0.75),
-                        "tempo": (0.76, 0.90),
-                        "threshold": (0.91, 1.05),
-                        "vo2max": (1.06, 1.20),
-                        "anaerobic": (1.21, 1.50),
-                    }
+            if closest_point and abs(closest_point.secs - seconds) <= seconds * 0.1:
+                # Only include if within 10% of target duration
+                effort: dict[str, Any] = {
+                    "watts": closest_point.watts,
+                    "duration_seconds": closest_point.secs,
+                }
+                if closest_point.date:
+                    effort["date"] = closest_point.date
+                if closest_point.src_activity_id:
+                    effort["activity_id"] = closest_point.src_activity_id
+
+                peak_efforts[label] = effort
+
+        # Calculate summary statistics
+        max_power_point = max(power_curve.data, key=lambda p: p.watts or 0)
+        min_duration = min(power_curve.data, key=lambda p: p.secs)
+        max_duration = max(power_curve.data, key=lambda p: p.secs)
+
+        summary: dict[str, Any] = {
+            "total_data_points": len(power_curve.data),
+            "max_power_watts": max_power_point.watts,
+            "max_power_duration_seconds": max_power_point.secs,
+            "duration_range": {
+                "min_seconds": min_duration.secs,
+                "max_seconds": max_duration.secs,
+            },
+        }
+
+        # If we have dates, show range
+        dates = [p.date for p in power_curve.data if p.date]
+        if dates:
+            summary["effort_date_range"] = {"oldest": min(dates), "newest": max(dates)}
+
+        # Calculate FTP and power zones (based on 20-min power)
+        twenty_min_point = min(
+            power_curve.data,
+            key=lambda p: abs(p.secs - 1200),
+            default=None,
+        )
 
-                    power_zones: dict[str, dict[str, int]] = {}
-                    for zone_name, (low, high) in zones.items():
-                        power_zones[zone_name] = {
-                            "min_watts": int(estimated_ftp * low),
-                            "max_watts": int(estimated_ftp * high),
-                            "min_percent_ftp": int(low * 100),
-                            "max_percent_ftp": int(high * 100),
-                        }
-
-                    ftp_analysis = {
-                        "twenty_min_power": twenty_min_point.watts,
-                        "estimated_ftp": estimated_ftp,
-                        "power_zones": power_zones,
+        ftp_analysis = None
+        if twenty_min_point and abs(twenty_min_point.secs - 1200) <= 120:
+            # Estimate FTP as 95% of 20-min power
+            estimated_ftp = int((twenty_min_point.watts or 0) * 0.95)
+
+            if estimated_ftp > 0:
+                # Power zones
+                zones = {
+                    "recovery": (0, 0.55),
+                    "endurance": (0.56, 0.75),
+                    "tempo": (0.76, 0.90),
+                    "threshold": (0.91, 1.05),
+                    "vo2max": (1.06, 1.20),
+                    "anaerobic": (1.21, 1.50),
+                }
+
+                power_zones: dict[str, dict[str, int]] = {}
+                for zone_name, (low, high) in zones.items():
+                    power_zones[zone_name] = {
+                        "min_watts": int(estimated_ftp * low),
+                        "max_watts": int(estimated_ftp * high),
+                        "min_percent_ftp": int(low * 100),
+                        "max_percent_ftp": int(high * 100),
                     }
 
-            result_data: dict[str, Any] = {
-                "period": period_label,
-                "peak_efforts": peak_efforts,
-                "summary": summary,
-            }
+                ftp_analysis = {
+                    "twenty_min_power": twenty_min_point.watts,
+                    "estimated_ftp": estimated_ftp,
+                    "power_zones": power_zones,
+                }
 
-            if ftp_analysis:
-                result_data["ftp_analysis"] = ftp_analysis
+        result_data: dict[str, Any] = {
+            "period": period_label,
+            "peak_efforts": peak_efforts,
+            "summary": summary,
+        }
 
-            return ResponseBuilder.build_response(
-                data=result_data,
-                query_type="power_curves",
-            )
+        if ftp_analysis:
+            result_data["ftp_analysis"] = ftp_analysis
+
+        return ResponseBuilder.build_response(
+            data=result_data,
+            query_type="power_curves",
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -4,7 +4,6 @@ from typing import Annotated, Any
 
 from fastmcp import Context
 
-from ..auth import load_config, validate_credentials
 from ..client import ICUAPIError, ICUClient
 from ..response_builder import ResponseBuilder
 
@@ -17,59 +16,55 @@ async def get_sport_settings(
     Returns:
         Formatted list of sport settings with thresholds and zones
     """
-    config = load_config()
-    if not validate_credentials(config):
-        return (
-            "Error: Intervals.icu credentials not configured. Run intervals-icu-mcp-auth to set up."
-        )
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            settings_list = await client.get_sport_settings()
-
-            if not settings_list:
-                return ResponseBuilder.build_response(
-                    {"message": "No sport settings found"}, metadata={"count": 0}
-                )
-
-            settings_data: list[dict[str, Any]] = []
-
-            for settings in settings_list:
-                sport_info: dict[str, Any] = {
-                    "id": settings.id,
-                    "type": settings.type,
-                }
-
-                # Power settings (cycling)
-                if settings.ftp is not None:
-                    sport_info["ftp_watts"] = settings.ftp
-
-                # Heart rate settings
-                if settings.fthr is not None:
-                    sport_info["fthr_bpm"] = settings.fthr
-
-                # Pace settings (running/swimming)
-                if settings.pace_threshold is not None:
-                    # Convert to min:sec per km
-                    pace_secs = settings.pace_threshold * 60
-                    minutes = int(pace_secs // 60)
-                    seconds = int(pace_secs % 60)
-                    sport_info["pace_threshold"] = f"{minutes}:{seconds:02d} /km"
-
-                if settings.swim_threshold is not None:
-                    # Convert to min:sec per 100m
-                    swim_secs = settings.swim_threshold * 60
-                    minutes = int(swim_secs // 60)
-                    seconds = int(swim_secs % 60)
-                    sport_info["swim_threshold"] = f"{minutes}:{seconds:02d} /100m"
-
-                settings_data.append(sport_info)
+        settings_list = await client.get_sport_settings()
 
+        if not settings_list:
             return ResponseBuilder.build_response(
-                {"sport_settings": settings_data},
-                metadata={"count": len(settings_list), "type": "sport_settings_list"},
+                {"message": "No sport settings found"}, metadata={"count": 0}
             )
 
+        settings_data: list[dict[str, Any]] = []
+
+        for settings in settings_list:
+            sport_info: dict[str, Any] = {
+                "id": settings.id,
+                "type": settings.type,
+            }
+
+            # Power settings (cycling)
+            if settings.ftp is not None:
+                sport_info["ftp_watts"] = settings.ftp
+
+            # Heart rate settings
+            if settings.fthr is not None:
+                sport_info["fthr_bpm"] = settings.fthr
+
+            # Pace settings (running/swimming)
+            if settings.pace_threshold is not None:
+                # Convert to min:sec per km
+                pace_secs = settings.pace_threshold * 60
+                minutes = int(pace_secs // 60)
+                seconds = int(pace_secs % 60)
+                sport_info["pace_threshold"] = f"{minutes}:{seconds:02d} /km"
+
+            if settings.swim_threshold is not None:
+                # Convert to min:sec per 100m
+                swim_secs = settings.swim_threshold * 60
+                minutes = int(swim_secs // 60)
+                seconds = int(swim_secs % 60)
+                sport_info["swim_threshold"] = f"{minutes}:{seconds:02d} /100m"
+
+            settings_data.append(sport_info)
+
+        return ResponseBuilder.build_response(
+            {"sport_settings": settings_data},
+            metadata={"count": len(settings_list), "type": "sport_settings_list"},
+        )
+
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
     except Exception as e:
@@ -100,60 +95,56 @@ async def update_sport_settings(
     Returns:
         Updated sport settings
     """
-    config = load_config()
-    if not validate_credentials(config):
-        return (
-            "Error: Intervals.icu credentials not configured. Run intervals-icu-mcp-auth to set up."
-        )
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            settings_data: dict[str, Any] = {}
-
-            if ftp is not None:
-                settings_data["ftp"] = ftp
-            if fthr is not None:
-                settings_data["fthr"] = fthr
-            if pace_threshold is not None:
-                settings_data["pace_threshold"] = pace_threshold
-            if swim_threshold is not None:
-                settings_data["swim_threshold"] = swim_threshold
-
-            if not settings_data:
-                return ResponseBuilder.build_error_response(
-                    "No fields provided to update", error_type="validation_error"
-                )
-
-            settings = await client.update_sport_settings(sport_id, settings_data)
-
-            result: dict[str, Any] = {
-                "id": settings.id,
-                "type": settings.type,
-            }
-
-            if settings.ftp is not None:
-                result["ftp_watts"] = settings.ftp
-            if settings.fthr is not None:
-                result["fthr_bpm"] = settings.fthr
-            if settings.pace_threshold is not None:
-                pace_secs = settings.pace_threshold * 60
-                minutes = int(pace_secs // 60)
-                seconds = int(pace_secs % 60)
-                result["pace_threshold"] = f"{minutes}:{seconds:02d} /km"
-            if settings.swim_threshold is not None:
-                swim_secs = settings.swim_threshold * 60
-                minutes = int(swim_secs // 60)
-                seconds = int(swim_secs % 60)
-                result["swim_threshold"] = f"{minutes}:{seconds:02d} /100m"
-
-            return ResponseBuilder.build_response(
-                result,
-                metadata={
-                    "type": "sport_settings_updated",
-                    "message": "Sport settings updated successfully",
-                },
+        settings_data: dict[str, Any] = {}
+
+        if ftp is not None:
+            settings_data["ftp"] = ftp
+        if fthr is not None:
+            settings_data["fthr"] = fthr
+        if pace_threshold is not None:
+            settings_data["pace_threshold"] = pace_threshold
+        if swim_threshold is not None:
+            settings_data["swim_threshold"] = swim_threshold
+
+        if not settings_data:
+            return ResponseBuilder.build_error_response(
+                "No fields provided to update", error_type="validation_error"
             )
 
+        settings = await client.update_sport_settings(sport_id, settings_data)
+
+        result: dict[str, Any] = {
+            "id": settings.id,
+            "type": settings.type,
+        }
+
+        if settings.ftp is not None:
+            result["ftp_watts"] = settings.ftp
+        if settings.fthr is not None:
+            result["fthr_bpm"] = settings.fthr
+        if settings.pace_threshold is not None:
+            pace_secs = settings.pace_threshold * 60
+            minutes = int(pace_secs // 60)
+            seconds = int(pace_secs % 60)
+            result["pace_threshold"] = f"{minutes}:{seconds:02d} /km"
+        if settings.swim_threshold is not None:
+            swim_secs = settings.swim_threshold * 60
+            minutes = int(swim_secs // 60)
+            seconds = int(swim_secs % 60)
+            result["swim_threshold"] = f"{minutes}:{seconds:02d} /100m"
+
+        return ResponseBuilder.build_response(
+            result,
+            metadata={
+                "type": "sport_settings_updated",
+                "message": "Sport settings updated successfully",
+            },
+        )
+
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
     except Exception as e:
@@ -179,23 +170,19 @@ async def apply_sport_settings(
     Returns:
         Result of applying settings
     """
-    config = load_config()
-    if not validate_credentials(config):
-        return (
-            "Error: Intervals.icu credentials not configured. Run intervals-icu-mcp-auth to set up."
-        )
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            result = await client.apply_sport_settings(sport_id, oldest=oldest_date)
-
-            return ResponseBuilder.build_response(
-                result,
-                metadata={
-                    "type": "sport_settings_applied",
-                    "message": "Sport settings applied to activities successfully",
-                },
-            )
+        result = await client.apply_sport_settings(sport_id, oldest=oldest_date)
+
+        return ResponseBuilder.build_response(
+            result,
+            metadata={
+                "type": "sport_settings_applied",
+                "message": "Sport settings applied to activities successfully",
+            },
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -227,54 +214,50 @@ async def create_sport_settings(
     Returns:
         Created sport settings
     """
-    config = load_config()
-    if not validate_credentials(config):
-        return (
-            "Error: Intervals.icu credentials not configured. Run intervals-icu-mcp-auth to set up."
-        )
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            settings_data: dict[str, Any] = {"type": sport_type}
-
-            if ftp is not None:
-                settings_data["ftp"] = ftp
-            if fthr is not None:
-                settings_data["fthr"] = fthr
-            if pace_threshold is not None:
-                settings_data["pace_threshold"] = pace_threshold
-            if swim_threshold is not None:
-                settings_data["swim_threshold"] = swim_threshold
-
-            settings = await client.create_sport_settings(settings_data)
-
-            result: dict[str, Any] = {
-                "id": settings.id,
-                "type": settings.type,
-            }
-
-            if settings.ftp is not None:
-                result["ftp_watts"] = settings.ftp
-            if settings.fthr is not None:
-                result["fthr_bpm"] = settings.fthr
-            if settings.pace_threshold is not None:
-                pace_secs = settings.pace_threshold * 60
-                minutes = int(pace_secs // 60)
-                seconds = int(pace_secs % 60)
-                result["pace_threshold"] = f"{minutes}:{seconds:02d} /km"
-            if settings.swim_threshold is not None:
-                swim_secs = settings.swim_threshold * 60
-                minutes = int(swim_secs // 60)
-                seconds = int(swim_secs % 60)
-                result["swim_threshold"] = f"{minutes}:{seconds:02d} /100m"
-
-            return ResponseBuilder.build_response(
-                result,
-                metadata={
-                    "type": "sport_settings_created",
-                    "message": "Sport settings created successfully",
-                },
-            )
+        settings_data: dict[str, Any] = {"type": sport_type}
+
+        if ftp is not None:
+            settings_data["ftp"] = ftp
+        if fthr is not None:
+            settings_data["fthr"] = fthr
+        if pace_threshold is not None:
+            settings_data["pace_threshold"] = pace_threshold
+        if swim_threshold is not None:
+            settings_data["swim_threshold"] = swim_threshold
+
+        settings = await client.create_sport_settings(settings_data)
+
+        result: dict[str, Any] = {
+            "id": settings.id,
+            "type": settings.type,
+        }
+
+        if settings.ftp is not None:
+            result["ftp_watts"] = settings.ftp
+        if settings.fthr is not None:
+            result["fthr_bpm"] = settings.fthr
+        if settings.pace_threshold is not None:
+            pace_secs = settings.pace_threshold * 60
+            minutes = int(pace_secs // 60)
+            seconds = int(pace_secs % 60)
+            result["pace_threshold"] = f"{minutes}:{seconds:02d} /km"
+        if settings.swim_threshold is not None:
+            swim_secs = settings.swim_threshold * 60
+            minutes = int(swim_secs // 60)
+            seconds = int(swim_secs % 60)
+            result["swim_threshold"] = f"{minutes}:{seconds:02d} /100m"
+
+        return ResponseBuilder.build_response(
+            result,
+            metadata={
+                "type": "sport_settings_created",
+                "message": "Sport settings created successfully",
+            },
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -294,23 +277,19 @@ async def delete_sport_settings(
     Returns:
         Deletion confirmation
     """
-    config = load_config()
-    if not validate_credentials(config):
-        return (
-            "Error: Intervals.icu credentials not configured. Run intervals-icu-mcp-auth to set up."
-        )
+    assert ctx is not None
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            await client.delete_sport_settings(sport_id)
-
-            return ResponseBuilder.build_response(
-                {"sport_id": sport_id, "deleted": True},
-                metadata={
-                    "type": "sport_settings_deleted",
-                    "message": "Sport settings deleted successfully",
-                },
-            )
+        await client.delete_sport_settings(sport_id)
+
+        return ResponseBuilder.build_response(
+            {"sport_id": sport_id, "deleted": True},
+            metadata={
+                "type": "sport_settings_deleted",
+                "message": "Sport settings deleted successfully",
+            },
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
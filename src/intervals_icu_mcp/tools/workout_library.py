@@ -1,13 +1,111 @@
 """Workout library tools for Intervals.icu MCP server."""
 
-from typing import Annotated, Any
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Annotated, Any, cast
 
+import orjson
 from fastmcp import Context
 
-from ..auth import ICUConfig
 from ..client import ICUAPIError, ICUClient
+from ..models import Workout
 from ..response_builder import ResponseBuilder
 
+_PLAN_TYPES = frozenset({"FOLDER", "PLAN"})
+_VISIBILITIES = frozenset({"PRIVATE", "PUBLIC"})
+_REQUIRED_WORKOUT_FIELDS = frozenset({"name", "type", "moving_time", "day"})
+# "attachments" also defaults to a new empty list per workout
+_WORKOUT_DEFAULTS: dict[str, Any] = {
+    "indoor": False,
+    "joules": 0,
+    "joules_above_ftp": 0,
+    "sub_type": "NONE",
+}
+
+
+def _non_empty(*fields: tuple[str, Any]) -> dict[str, Any]:
+    """Build a dict from (key, value) pairs, keeping only truthy values."""
+    return {key: value for key, value in fields if value}
+
+
+def _format_created_workouts(
+    created_workouts: list[Workout],
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Format newly created workouts and total their duration and load in one pass.
+
+    Returns:
+        Tuple of (workout entries, summary with count and totals)
+    """
+    workouts_data: list[dict[str, Any]] = []
+    total_duration = 0
+    total_load = 0
+    for workout in created_workouts:
+        workout_item: dict[str, Any] = {
+            "id": workout.id,
+            "name": workout.name,
+            "type": workout.type,
+        }
+
+        if workout.description:
+            workout_item["description"] = workout.description
+        if workout.moving_time:
+            workout_item["duration_seconds"] = workout.moving_time
+            total_duration += workout.moving_time
+        if workout.icu_training_load:
+            workout_item["training_load"] = workout.icu_training_load
+            total_load += workout.icu_training_load
+        if workout.folder_id:
+            workout_item["folder_id"] = workout.folder_id
+
+        workouts_data.append(workout_item)
+
+    summary = {
+        "count": len(created_workouts),
+        "total_duration_seconds": total_duration,
+        "total_training_load": total_load,
+    }
+    return workouts_data, summary
+
+
+@lru_cache(maxsize=1)
+def _next_monday(today: date) -> str:
+    """Return the ISO date of the Monday after today (a week ahead if today is Monday)."""
+    # Calculate days until next Monday (0=Monday, 6=Sunday)
+    days_until_monday = (7 - today.weekday()) % 7 or 7
+    return (today + timedelta(days=days_until_monday)).isoformat()
+
+
+def _parse_workouts(workouts: str) -> tuple[list[dict[str, Any]], str | None]:
+    """Parse and validate a JSON array of workout definitions, filling in defaults.
+
+    Returns:
+        Tuple of (workouts, error message). The message is None when the input is valid.
+    """
+    try:
+        parsed: Any = orjson.loads(workouts)
+    except orjson.JSONDecodeError as e:
+        return [], f"Invalid JSON format: {str(e)}"
+
+    if not isinstance(parsed, list):
+        return [], "workouts must be a JSON array"
+
+    workouts_list = cast(list[dict[str, Any]], parsed)
+    if len(workouts_list) == 0:
+        return [], "workouts array cannot be empty"
+
+    for i, workout in enumerate(workouts_list):
+        if not isinstance(workout, dict):  # type: ignore[reportUnnecessaryIsInstance]
+            return [], f"Workout at index {i} must be an object"
+
+        missing = _REQUIRED_WORKOUT_FIELDS - workout.keys()
+        if missing:
+            return [], f"Workout at index {i} missing required field: {', '.join(sorted(missing))}"
+
+        # Set defaults for optional fields; values given in the workout take precedence
+        workouts_list[i] = {**_WORKOUT_DEFAULTS, "attachments": [], **workout}
+
+    return workouts_list, None
+
 
 async def get_workout_library(
     ctx: Context | None = None,
@@ -23,95 +121,89 @@ async def get_workout_library(
         JSON string with workout folders/plans
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            folders = await client.get_workout_folders()
-
-            if not folders:
-                return ResponseBuilder.build_response(
-                    data={"folders": [], "count": 0},
-                    metadata={
-                        "message": "No workout folders found. Create folders in Intervals.icu to organize your workouts."
-                    },
-                )
-
-            folders_data: list[dict[str, Any]] = []
-            for folder in folders:
-                folder_item: dict[str, Any] = {
-                    "id": folder.id,
-                    "name": folder.name,
+        folders = await client.get_workout_folders()
+
+        if not folders:
+            return ResponseBuilder.build_response(
+                data={"folders": [], "count": 0},
+                metadata={
+                    "message": "No workout folders found. Create folders in Intervals.icu to organize your workouts."
+                },
+            )
+
+        folders_data: list[dict[str, Any]] = []
+        plan_count = 0
+        total_workouts = 0
+        for folder in folders:
+            # Categorize folders: training plans have a duration
+            plan_count += folder.duration_weeks is not None
+            total_workouts += folder.num_workouts or 0
+
+            folder_item: dict[str, Any] = {
+                "id": folder.id,
+                "name": folder.name,
+                **_non_empty(
+                    ("description", folder.description),
+                    ("num_workouts", folder.num_workouts),
+                    # Training plan info
+                    ("start_date", folder.start_date_local),
+                    ("duration_weeks", folder.duration_weeks),
+                ),
+            }
+            if folder.hours_per_week_min or folder.hours_per_week_max:
+                folder_item["hours_per_week"] = {
+                    "min": folder.hours_per_week_min,
+                    "max": folder.hours_per_week_max,
                 }
 
-                if folder.description:
-                    folder_item["description"] = folder.description
-                if folder.num_workouts:
-                    folder_item["num_workouts"] = folder.num_workouts
-
-                # Training plan info
-                if folder.start_date_local:
-                    folder_item["start_date"] = folder.start_date_local
-                if folder.duration_weeks:
-                    folder_item["duration_weeks"] = folder.duration_weeks
-                if folder.hours_per_week_min or folder.hours_per_week_max:
-                    folder_item["hours_per_week"] = {
-                        "min": folder.hours_per_week_min,
-                        "max": folder.hours_per_week_max,
+            # Include workouts (children) if present
+            if folder.children:
+                workouts: list[dict[str, Any]] = []
+                for workout in folder.children:
+                    workout_data: dict[str, Any] = {
+                        "id": workout.id,
+                        "name": workout.name,
+                        **_non_empty(
+                            ("description", workout.description),
+                            ("type", workout.type),
+                            ("duration_seconds", workout.moving_time),
+                            ("training_load", workout.icu_training_load),
+                            ("intensity_factor", workout.icu_intensity),
+                            ("color", workout.color),
+                        ),
                     }
+                    # Day 0 and indoor=False are meaningful, so only None is dropped
+                    if workout.day is not None:
+                        workout_data["day"] = workout.day
+                    if workout.indoor is not None:
+                        workout_data["indoor"] = workout.indoor
 
-                # Include workouts (children) if present
-                if folder.children:
-                    workouts: list[dict[str, Any]] = []
-                    for workout in folder.children:
-                        workout_data: dict[str, Any] = {
-                            "id": workout.id,
-                            "name": workout.name,
-                        }
-                        if workout.description:
-                            workout_data["description"] = workout.description
-                        if workout.type:
-                            workout_data["type"] = workout.type
-                        if workout.moving_time:
-                            workout_data["duration_seconds"] = workout.moving_time
-                        if workout.day is not None:
-                            workout_data["day"] = workout.day
-                        if workout.icu_training_load:
-                            workout_data["training_load"] = workout.icu_training_load
-                        if workout.icu_intensity:
-                            workout_data["intensity_factor"] = workout.icu_intensity
-                        if workout.indoor is not None:
-                            workout_data["indoor"] = workout.indoor
-                        if workout.color:
-                            workout_data["color"] = workout.color
-
-                        workouts.append(workout_data)
-
-                    folder_item["workouts"] = workouts
-                    folder_item["workouts_count"] = len(workouts)
-
-                folders_data.append(folder_item)
-
-            # Categorize folders
-            training_plans = [f for f in folders if f.duration_weeks is not None]
-            regular_folders = [f for f in folders if f.duration_weeks is None]
-
-            summary = {
-                "total_folders": len(folders),
-                "training_plans": len(training_plans),
-                "regular_folders": len(regular_folders),
-                "total_workouts": sum(f.num_workouts or 0 for f in folders),
-            }
+                    workouts.append(workout_data)
 
-            result_data = {
-                "folders": folders_data,
-                "summary": summary,
-            }
+                folder_item["workouts"] = workouts
+                folder_item["workouts_count"] = len(workouts)
 
-            return ResponseBuilder.build_response(
-                data=result_data,
-                query_type="workout_library",
-            )
+            folders_data.append(folder_item)
+
+        summary = {
+            "total_folders": len(folders),
+            "training_plans": plan_count,
+            "regular_folders": len(folders) - plan_count,
+            "total_workouts": total_workouts,
+        }
+
+        result_data = {
+            "folders": folders_data,
+            "summary": summary,
+        }
+
+        return ResponseBuilder.build_response(
+            data=result_data,
+            query_type="workout_library",
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -137,79 +229,71 @@ async def get_workouts_in_folder(
         JSON string with workout details
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            workouts = await client.get_workouts_in_folder(folder_id)
-
-            if not workouts:
-                return ResponseBuilder.build_response(
-                    data={"workouts": [], "count": 0, "folder_id": folder_id},
-                    metadata={"message": f"No workouts found in folder {folder_id}"},
-                )
-
-            workouts_data: list[dict[str, Any]] = []
-            for workout in workouts:
-                workout_item: dict[str, Any] = {
-                    "id": workout.id,
-                    "name": workout.name,
-                }
+        workouts = await client.get_workouts_in_folder(folder_id)
 
-                if workout.description:
-                    workout_item["description"] = workout.description
-                if workout.type:
-                    workout_item["type"] = workout.type
-
-                # Workout metrics
-                metrics: dict[str, Any] = {}
-                if workout.moving_time:
-                    metrics["duration_seconds"] = workout.moving_time
-                if workout.distance:
-                    metrics["distance_meters"] = workout.distance
-                if workout.icu_training_load:
-                    metrics["training_load"] = workout.icu_training_load
-                if workout.icu_intensity:
-                    metrics["intensity_factor"] = workout.icu_intensity
-                if workout.joules:
-                    metrics["joules"] = workout.joules
-                if workout.joules_above_ftp:
-                    metrics["joules_above_ftp"] = workout.joules_above_ftp
-
-                if metrics:
-                    workout_item["metrics"] = metrics
-
-                # Other properties
-                if workout.indoor is not None:
-                    workout_item["indoor"] = workout.indoor
-                if workout.color:
-                    workout_item["color"] = workout.color
-
-                workouts_data.append(workout_item)
-
-            # Calculate summary
-            total_duration = sum(w.moving_time or 0 for w in workouts)
-            total_load = sum(w.icu_training_load or 0 for w in workouts)
-            indoor_count = sum(1 for w in workouts if w.indoor)
-
-            summary = {
-                "total_workouts": len(workouts),
-                "total_duration_seconds": total_duration,
-                "total_training_load": total_load,
-                "indoor_workouts": indoor_count,
-            }
+        if not workouts:
+            return ResponseBuilder.build_response(
+                data={"workouts": [], "count": 0, "folder_id": folder_id},
+                metadata={"message": f"No workouts found in folder {folder_id}"},
+            )
 
-            result_data = {
-                "folder_id": folder_id,
-                "workouts": workouts_data,
-                "summary": summary,
+        workouts_data: list[dict[str, Any]] = []
+        total_duration = 0
+        total_load = 0
+        indoor_count = 0
+        for workout in workouts:
+            total_duration += workout.moving_time or 0
+            total_load += workout.icu_training_load or 0
+            indoor_count += bool(workout.indoor)
+
+            workout_item: dict[str, Any] = {
+                "id": workout.id,
+                "name": workout.name,
+                **_non_empty(("description", workout.description), ("type", workout.type)),
             }
 
-            return ResponseBuilder.build_response(
-                data=result_data,
-                query_type="folder_workouts",
+            # Workout metrics
+            metrics = _non_empty(
+                ("duration_seconds", workout.moving_time),
+                ("distance_meters", workout.distance),
+                ("training_load", workout.icu_training_load),
+                ("intensity_factor", workout.icu_intensity),
+                ("joules", workout.joules),
+                ("joules_above_ftp", workout.joules_above_ftp),
             )
 
+            if metrics:
+                workout_item["metrics"] = metrics
+
+            # Other properties
+            if workout.indoor is not None:
+                workout_item["indoor"] = workout.indoor
+            if workout.color:
+                workout_item["color"] = workout.color
+
+            workouts_data.append(workout_item)
+
+        summary = {
+            "total_workouts": len(workouts),
+            "total_duration_seconds": total_duration,
+            "total_training_load": total_load,
+            "indoor_workouts": indoor_count,
+        }
+
+        result_data = {
+            "folder_id": folder_id,
+            "workouts": workouts_data,
+            "summary": summary,
+        }
+
+        return ResponseBuilder.build_response(
+            data=result_data,
+            query_type="folder_workouts",
+        )
+
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
     except Exception as e:
@@ -336,88 +420,33 @@ async def create_training_plan(
     ]
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     # Validate plan_type
-    if plan_type not in ["FOLDER", "PLAN"]:
+    if plan_type not in _PLAN_TYPES:
         return ResponseBuilder.build_error_response(
             "plan_type must be either 'FOLDER' or 'PLAN'",
             error_type="validation_error",
         )
 
     # Validate visibility
-    if visibility not in ["PRIVATE", "PUBLIC"]:
+    if visibility not in _VISIBILITIES:
         return ResponseBuilder.build_error_response(
             "visibility must be either 'PRIVATE' or 'PUBLIC'",
             error_type="validation_error",
         )
 
     # Parse and validate workouts if provided
-    import json
-
     workouts_list: list[dict[str, Any]] | None = None
     if workouts:
-        try:
-            workouts_list = json.loads(workouts)
-        except json.JSONDecodeError as e:
-            return ResponseBuilder.build_error_response(
-                f"Invalid JSON format: {str(e)}",
-                error_type="validation_error",
-            )
-
-        if not isinstance(workouts_list, list):
-            return ResponseBuilder.build_error_response(
-                "workouts must be a JSON array",
-                error_type="validation_error",
-            )
-
-        if len(workouts_list) == 0:
-            return ResponseBuilder.build_error_response(
-                "workouts array cannot be empty",
-                error_type="validation_error",
-            )
-
-        # Validate each workout
-        for i, workout in enumerate(workouts_list):
-            if not isinstance(workout, dict):  # type: ignore[reportUnnecessaryIsInstance]
-                return ResponseBuilder.build_error_response(
-                    f"Workout at index {i} must be an object",
-                    error_type="validation_error",
-                )
-
-            # Required fields
-            required_fields = ["name", "type", "moving_time", "day"]
-            for field in required_fields:
-                if field not in workout:
-                    return ResponseBuilder.build_error_response(
-                        f"Workout at index {i} missing required field: {field}",
-                        error_type="validation_error",
-                    )
-
-            # Set defaults for optional fields
-            if "indoor" not in workout:
-                workout["indoor"] = False
-            if "attachments" not in workout:
-                workout["attachments"] = []
-            if "joules" not in workout:
-                workout["joules"] = 0
-            if "joules_above_ftp" not in workout:
-                workout["joules_above_ftp"] = 0
-            if "sub_type" not in workout:
-                workout["sub_type"] = "NONE"
+        workouts_list, error = _parse_workouts(workouts)
+        if error:
+            return ResponseBuilder.build_error_response(error, error_type="validation_error")
 
     # Auto-set start_date to next Monday if not provided for PLAN type
-    from datetime import datetime, timedelta
-
     auto_set_date = False
     if plan_type == "PLAN" and not start_date:
-        today = datetime.now().date()
-        # Calculate days until next Monday (0=Monday, 6=Sunday)
-        days_until_monday = (7 - today.weekday()) % 7
-        if days_until_monday == 0:  # If today is Monday
-            days_until_monday = 7  # Set to next Monday
-        next_monday = today + timedelta(days=days_until_monday)
-        start_date = next_monday.isoformat()
+        start_date = _next_monday(date.today())
         auto_set_date = True
 
     try:
@@ -434,99 +463,70 @@ async def create_training_plan(
         if start_date:
             folder_data["start_date_local"] = start_date
 
-        async with ICUClient(config) as client:
-            folder = await client.create_folder(folder_data)
+        folder = await client.create_folder(folder_data)
 
-            # Build response data
-            result_data: dict[str, Any] = {
-                "id": folder.id,
-                "name": folder.name,
-                "type": folder.type,
-                "visibility": folder.visibility,
-            }
+        # Build response data
+        result_data: dict[str, Any] = {
+            "id": folder.id,
+            "name": folder.name,
+            "type": folder.type,
+            "visibility": folder.visibility,
+        }
 
-            if folder.description:
-                result_data["description"] = folder.description
-            if folder.start_date_local:
-                result_data["start_date"] = folder.start_date_local
-            if folder.num_workouts:
-                result_data["num_workouts"] = folder.num_workouts
-
-            # Create workouts if provided
-            created_workouts = None
-            if workouts_list:
-                # Add folder_id to each workout
-                for workout in workouts_list:
-                    workout["folder_id"] = folder.id
-
-                # Create workouts
-                created_workouts = await client.bulk_create_workouts(workouts_list)
-
-                # Add workouts to response
-                workouts_data: list[dict[str, Any]] = []
-                for workout in created_workouts:
-                    workout_item: dict[str, Any] = {
-                        "id": workout.id,
-                        "name": workout.name,
-                        "type": workout.type,
-                    }
+        if folder.description:
+            result_data["description"] = folder.description
+        if folder.start_date_local:
+            result_data["start_date"] = folder.start_date_local
+        if folder.num_workouts:
+            result_data["num_workouts"] = folder.num_workouts
+
+        # Create workouts if provided
+        created_summary: dict[str, Any] | None = None
+        if workouts_list:
+            # Add folder_id to each workout
+            for workout in workouts_list:
+                workout["folder_id"] = folder.id
+
+            # Create workouts
+            created_workouts = await client.bulk_create_workouts(workouts_list)
 
-                    if workout.description:
-                        workout_item["description"] = workout.description
-                    if workout.moving_time:
-                        workout_item["duration_seconds"] = workout.moving_time
-                    if workout.icu_training_load:
-                        workout_item["training_load"] = workout.icu_training_load
-                    if workout.folder_id:
-                        workout_item["folder_id"] = workout.folder_id
-
-                    workouts_data.append(workout_item)
-
-                # Calculate summary
-                total_duration = sum(w.moving_time or 0 for w in created_workouts)
-                total_load = sum(w.icu_training_load or 0 for w in created_workouts)
-
-                result_data["workouts"] = workouts_data
-                result_data["num_workouts"] = len(created_workouts)
-                result_data["summary"] = {
-                    "count": len(created_workouts),
-                    "total_duration_seconds": total_duration,
-                    "total_training_load": total_load,
-                }
+            # Add workouts to response
+            workouts_data, created_summary = _format_created_workouts(created_workouts)
+            result_data["workouts"] = workouts_data
+            result_data["num_workouts"] = len(created_workouts)
+            result_data["summary"] = created_summary
 
-            # Add analysis for training plans
-            analysis_data: dict[str, Any]
-            if plan_type == "PLAN":
-                analysis_data = {
-                    "type": "training_plan",
-                    "message": f"Training plan '{name}' created successfully",
-                }
-                if start_date:
-                    if auto_set_date:
-                        analysis_data["schedule"] = (
-                            f"Plan starts on {start_date} (auto-set to next Monday)"
-                        )
-                    else:
-                        analysis_data["schedule"] = f"Plan starts on {start_date}"
-            else:
-                analysis_data = {
-                    "type": "workout_folder",
-                    "message": f"Workout folder '{name}' created successfully",
-                }
+        # Add analysis for training plans
+        analysis_data: dict[str, Any]
+        if plan_type == "PLAN":
+            analysis_data = {
+                "type": "training_plan",
+                "message": f"Training plan '{name}' created successfully",
+            }
+            if start_date:
+                if auto_set_date:
+                    analysis_data["schedule"] = (
+                        f"Plan starts on {start_date} (auto-set to next Monday)"
+                    )
+                else:
+                    analysis_data["schedule"] = f"Plan starts on {start_date}"
+        else:
+            analysis_data = {
+                "type": "workout_folder",
+                "message": f"Workout folder '{name}' created successfully",
+            }
 
-            # Add workout analysis if workouts were created
-            if created_workouts:
-                total_duration = sum(w.moving_time or 0 for w in created_workouts)
-                total_load = sum(w.icu_training_load or 0 for w in created_workouts)
-                analysis_data["workouts_created"] = len(created_workouts)
-                analysis_data["total_duration_seconds"] = total_duration
-                analysis_data["total_training_load"] = total_load
+        # Add workout analysis if workouts were created
+        if created_summary and created_summary["count"]:
+            analysis_data["workouts_created"] = created_summary["count"]
+            analysis_data["total_duration_seconds"] = created_summary["total_duration_seconds"]
+            analysis_data["total_training_load"] = created_summary["total_training_load"]
 
-            return ResponseBuilder.build_response(
-                data=result_data,
-                analysis=analysis_data,
-                query_type="create_plan",
-            )
+        return ResponseBuilder.build_response(
+            data=result_data,
+            analysis=analysis_data,
+            query_type="create_plan",
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -636,115 +636,39 @@ async def add_workouts_to_plan(
     ]
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
-
-    # Parse workouts JSON
-    import json
-    from typing import cast
-
-    workouts_list: list[dict[str, Any]]
-    try:
-        parsed: Any = json.loads(workouts)
-        if not isinstance(parsed, list):
-            return ResponseBuilder.build_error_response(
-                "workouts must be a JSON array",
-                error_type="validation_error",
-            )
-        # Cast to proper type after validation
-        workouts_list = cast(list[dict[str, Any]], parsed)
-    except json.JSONDecodeError as e:
-        return ResponseBuilder.build_error_response(
-            f"Invalid JSON format: {str(e)}",
-            error_type="validation_error",
-        )
+    client: ICUClient = ctx.get_state("icu_client")
 
-    if len(workouts_list) == 0:
-        return ResponseBuilder.build_error_response(
-            "workouts array cannot be empty",
-            error_type="validation_error",
-        )
+    # Parse and validate workouts
+    workouts_list, error = _parse_workouts(workouts)
+    if error:
+        return ResponseBuilder.build_error_response(error, error_type="validation_error")
 
-    # Validate and enrich each workout with folder_id
-    for i, workout in enumerate(workouts_list):
-        if not isinstance(workout, dict):  # type: ignore[reportUnnecessaryIsInstance]
-            return ResponseBuilder.build_error_response(
-                f"Workout at index {i} must be an object",
-                error_type="validation_error",
-            )
-
-        # Required fields
-        required_fields = ["name", "type", "moving_time", "day"]
-        for field in required_fields:
-            if field not in workout:
-                return ResponseBuilder.build_error_response(
-                    f"Workout at index {i} missing required field: {field}",
-                    error_type="validation_error",
-                )
-
-        # Set folder_id for each workout
+    for workout in workouts_list:
         workout["folder_id"] = folder_id
 
-        # Set defaults for optional fields
-        if "indoor" not in workout:
-            workout["indoor"] = False
-        if "attachments" not in workout:
-            workout["attachments"] = []
-        if "joules" not in workout:
-            workout["joules"] = 0
-        if "joules_above_ftp" not in workout:
-            workout["joules_above_ftp"] = 0
-        if "sub_type" not in workout:
-            workout["sub_type"] = "NONE"
-
     try:
-        async with ICUClient(config) as client:
-            created_workouts = await client.bulk_create_workouts(workouts_list)
-
-            # Build response data
-            workouts_data: list[dict[str, Any]] = []
-            for workout in created_workouts:
-                workout_item: dict[str, Any] = {
-                    "id": workout.id,
-                    "name": workout.name,
-                    "type": workout.type,
-                }
-
-                if workout.description:
-                    workout_item["description"] = workout.description
-                if workout.moving_time:
-                    workout_item["duration_seconds"] = workout.moving_time
-                if workout.icu_training_load:
-                    workout_item["training_load"] = workout.icu_training_load
-                if workout.folder_id:
-                    workout_item["folder_id"] = workout.folder_id
-
-                workouts_data.append(workout_item)
+        created_workouts = await client.bulk_create_workouts(workouts_list)
 
-            # Calculate summary
-            total_duration = sum(w.moving_time or 0 for w in created_workouts)
-            total_load = sum(w.icu_training_load or 0 for w in created_workouts)
+        # Build response data and summary in one pass
+        workouts_data, summary = _format_created_workouts(created_workouts)
 
-            analysis_data = {
-                "workouts_created": len(created_workouts),
-                "total_duration_seconds": total_duration,
-                "total_training_load": total_load,
-                "folder_id": folder_id,
-            }
+        analysis_data = {
+            "workouts_created": summary["count"],
+            "total_duration_seconds": summary["total_duration_seconds"],
+            "total_training_load": summary["total_training_load"],
+            "folder_id": folder_id,
+        }
 
-            result_data = {
-                "workouts": workouts_data,
-                "summary": {
-                    "count": len(created_workouts),
-                    "total_duration_seconds": total_duration,
-                    "total_training_load": total_load,
-                },
-            }
+        result_data = {
+            "workouts": workouts_data,
+            "summary": summary,
+        }
 
-            return ResponseBuilder.build_response(
-                data=result_data,
-                analysis=analysis_data,
-                query_type="add_workouts_to_plan",
-            )
+        return ResponseBuilder.build_response(
+            data=result_data,
+            analysis=analysis_data,
+            query_type="add_workouts_to_plan",
+        )
 
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
@@ -770,50 +694,45 @@ async def delete_training_plan(
         JSON string confirming deletion
     """
     assert ctx is not None
-    config: ICUConfig = ctx.get_state("config")
+    client: ICUClient = ctx.get_state("icu_client")
 
     try:
-        async with ICUClient(config) as client:
-            # First, fetch the folder to get its name for the confirmation message
-            folders = await client.get_workout_folders()
-            folder_to_delete = None
-            for folder in folders:
-                if folder.id == folder_id:
-                    folder_to_delete = folder
-                    break
-
-            if not folder_to_delete:
-                return ResponseBuilder.build_error_response(
-                    f"Folder/plan with ID {folder_id} not found",
-                    error_type="not_found",
-                )
-
-            folder_name = folder_to_delete.name
-            folder_type = folder_to_delete.type or "FOLDER"
-            num_workouts = folder_to_delete.num_workouts or 0
-
-            # Delete the folder
-            await client.delete_folder(folder_id)
-
-            # Build response
-            result_data = {
-                "deleted": True,
-                "folder_id": folder_id,
-                "name": folder_name,
-                "type": folder_type,
-            }
+        # First, fetch the folder to get its name for the confirmation message
+        folders = await client.get_workout_folders()
+        folder_to_delete = next((f for f in folders if f.id == folder_id), None)
 
-            analysis_data = {
-                "message": f"Successfully deleted {folder_type.lower()} '{folder_name}'",
-                "workouts_deleted": num_workouts,
-            }
-
-            return ResponseBuilder.build_response(
-                data=result_data,
-                analysis=analysis_data,
-                query_type="delete_plan",
+        if folder_to_delete is None:
+            return ResponseBuilder.build_error_response(
+                f"Folder/plan with ID {folder_id} not found",
+                error_type="not_found",
             )
 
+        folder_name = folder_to_delete.name
+        folder_type = folder_to_delete.type or "FOLDER"
+        num_workouts = folder_to_delete.num_workouts or 0
+
+        # Delete the folder
+        await client.delete_folder(folder_id)
+
+        # Build response
+        result_data = {
+            "deleted": True,
+            "folder_id": folder_id,
+            "name": folder_name,
+            "type": folder_type,
+        }
+
+        analysis_data = {
+            "message": f"Successfully deleted {folder_type.lower()} '{folder_name}'",
+            "workouts_deleted": num_workouts,
+        }
+
+        return ResponseBuilder.build_response(
+            data=result_data,
+            analysis=analysis_data,
+            query_type="delete_plan",
+        )
+
     except ICUAPIError as e:
         return ResponseBuilder.build_error_response(e.message, error_type="api_error")
     except Exception as e:
@@ -1,12 +1,15 @@
 """Pytest configuration and shared fixtures."""
 
+from types import SimpleNamespace
+
 import pytest
 import respx
 
 from intervals_icu_mcp.auth import ICUConfig
+from intervals_icu_mcp.client import ICUClient
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
     """Provide a mock ICU configuration for testing."""
     return ICUConfig(
@@ -15,6 +18,20 @@ def mock_config():
     )
 
 
+@pytest.fixture
+async def icu_client(mock_config):
+    """Provide a client for the mock configuration, closed after the test."""
+    async with ICUClient(mock_config) as client:
+        yield client
+
+
+@pytest.fixture
+def mock_ctx(mock_config, icu_client):
+    """Provide a stub tool context holding the config and client the middleware injects."""
+    state = {"config": mock_config, "icu_client": icu_client}
+    return SimpleNamespace(get_state=state.get)
+
+
 @pytest.fixture
 def respx_mock():
     """Provide a respx mock router for HTTP requests."""
@@ -0,0 +1,44 @@
+"""Tests for activity tools."""
+
+import json
+
+from httpx import Response
+
+from intervals_icu_mcp.tools.activities import download_fit_file
+
+
+class TestDownloadFitFile:
+    """Tests for download_fit_file tool."""
+
+    async def test_download_fit_file_to_disk(self, mock_ctx, respx_mock, tmp_path):
+        """Test that the FIT file is streamed to output_path byte for byte."""
+        fit_bytes = bytes(range(256)) * 600  # Several 64 KiB chunks
+        respx_mock.get("/activity/12345/fit-file").mock(
+            return_value=Response(200, content=fit_bytes)
+        )
+        output_path = tmp_path / "rides" / "12345.fit"
+
+        result = await download_fit_file(
+            activity_id="12345", output_path=str(output_path), ctx=mock_ctx
+        )
+
+        response = json.loads(result)
+        assert response["data"]["saved_to"] == str(output_path)
+        assert response["data"]["size_bytes"] == len(fit_bytes)
+        assert output_path.read_bytes() == fit_bytes
+        assert list(output_path.parent.iterdir()) == [output_path]
+
+    async def test_download_fit_file_not_found(self, mock_ctx, respx_mock, tmp_path):
+        """Test that a failed download is an API error and leaves an existing file intact."""
+        respx_mock.get("/activity/404/fit-file").mock(return_value=Response(404))
+        output_path = tmp_path / "404.fit"
+        output_path.write_bytes(b"previous download")
+
+        result = await download_fit_file(
+            activity_id="404", output_path=str(output_path), ctx=mock_ctx
+        )
+
+        response = json.loads(result)
+        assert response["error"]["type"] == "api_error"
+        assert output_path.read_bytes() == b"previous download"
+        assert list(tmp_path.iterdir()) == [output_path]
@@ -1,6 +1,6 @@
 """Tests for athlete tools."""
 
-from unittest.mock import MagicMock
+import json
 
 from httpx import Response
 
@@ -12,23 +12,17 @@ class TestGetAthleteProfile:
 
     async def test_get_athlete_profile_success(
         self,
-        mock_config,
+        mock_ctx,
         respx_mock,
         mock_athlete_data,
     ):
         """Test successful athlete profile retrieval."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
         # Mock the API endpoint
         respx_mock.get("/athlete/i123456").mock(return_value=Response(200, json=mock_athlete_data))
 
         result = await get_athlete_profile(ctx=mock_ctx)
 
         # Check for JSON response with expected fields
-        import json
-
         response = json.loads(result)
         assert "data" in response
         assert "profile" in response["data"]
@@ -43,23 +37,17 @@ class TestGetFitnessSummary:
 
     async def test_get_fitness_summary_success(
         self,
-        mock_config,
+        mock_ctx,
         respx_mock,
         mock_athlete_data,
     ):
         """Test successful fitness summary retrieval."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
         # Mock the API endpoint
         respx_mock.get("/athlete/i123456").mock(return_value=Response(200, json=mock_athlete_data))
 
         result = await get_fitness_summary(ctx=mock_ctx)
 
         # Check for JSON response with expected fields
-        import json
-
         response = json.loads(result)
         assert "data" in response
         assert "fitness_metrics" in response["data"]
@@ -67,15 +55,11 @@ class TestGetFitnessSummary:
 
     async def test_get_fitness_summary_with_high_ramp_rate(
         self,
-        mock_config,
+        mock_ctx,
         respx_mock,
         mock_athlete_data,
     ):
         """Test fitness summary with high ramp rate warning."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
         # Modify athlete data to have high ramp rate
         athlete_data = mock_athlete_data.copy()
         athlete_data["ramp_rate"] = 10.0
@@ -85,9 +69,25 @@ class TestGetFitnessSummary:
         result = await get_fitness_summary(ctx=mock_ctx)
 
         # Check for JSON response with ramp rate analysis
-        import json
-
         response = json.loads(result)
         assert "analysis" in response
         assert "ramp_rate_status" in response["analysis"]
         assert response["analysis"]["ramp_rate_status"] == "high_risk"
+
+    async def test_profile_and_summary_share_cached_athlete(
+        self,
+        mock_ctx,
+        respx_mock,
+        mock_athlete_data,
+    ):
+        """Test that back-to-back athlete tools are served by one request."""
+        route = respx_mock.get("/athlete/i123456").mock(
+            return_value=Response(200, json=mock_athlete_data)
+        )
+
+        await get_athlete_profile(ctx=mock_ctx)
+        result = await get_fitness_summary(ctx=mock_ctx)
+
+        response = json.loads(result)
+        assert response["data"]["fitness_metrics"]["ctl"] is not None
+        assert route.call_count == 1
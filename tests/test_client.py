@@ -0,0 +1,539 @@
+"""Tests for the Intervals.icu API client."""
+
+import asyncio
+import gc
+import json
+
+import pytest
+from httpx import Response
+
+from intervals_icu_mcp import client as client_module
+from intervals_icu_mcp.auth import ICUConfig
+from intervals_icu_mcp.client import ICUAPIError, ICUClient
+
+HISTOGRAM = {"bins": [{"min": 0, "max": 100, "count": 10, "secs": 600}], "total_secs": 600}
+
+
+class TestResponseCache:
+    """Tests for the GET response cache."""
+
+    async def test_repeated_get_is_served_from_cache(self, icu_client, respx_mock):
+        """Test that a cached GET within the TTL sends one request."""
+        route = respx_mock.get("/activity/1/hr-histogram").mock(
+            return_value=Response(200, json=HISTOGRAM)
+        )
+
+        first = await icu_client.get_hr_histogram("1")
+        second = await icu_client.get_hr_histogram("1")
+
+        assert first == second
+        assert route.call_count == 1
+
+    async def test_cache_key_ignores_param_order(self, icu_client, respx_mock):
+        """Test that the same query params in a different order share a cache entry."""
+        route = respx_mock.get("/athlete/i123456/events").mock(return_value=Response(200, json=[]))
+
+        await icu_client._request(
+            "GET", "/athlete/i123456/events", params={"a": 1, "b": 2}, cache=True
+        )
+        await icu_client._request(
+            "GET", "/athlete/i123456/events", params={"b": 2, "a": 1}, cache=True
+        )
+        await icu_client._request(
+            "GET", "/athlete/i123456/events", params={"a": 2, "b": 2}, cache=True
+        )
+
+        assert route.call_count == 2
+
+    async def test_expired_entry_is_refetched(self, icu_client, respx_mock, monkeypatch):
+        """Test that a cached response older than the TTL is fetched again."""
+        monkeypatch.setattr(client_module, "_CACHE_TTL", 0.0)
+        route = respx_mock.get("/activity/1/hr-histogram").mock(
+            return_value=Response(200, json=HISTOGRAM)
+        )
+
+        await icu_client.get_hr_histogram("1")
+        await icu_client.get_hr_histogram("1")
+
+        assert route.call_count == 2
+
+    async def test_uncached_get_is_always_sent(self, icu_client, respx_mock, mock_event_data):
+        """Test that GETs without cache=True never read or fill the cache."""
+        route = respx_mock.get("/athlete/i123456/events/1001").mock(
+            return_value=Response(200, json=mock_event_data)
+        )
+
+        await icu_client.get_event(1001)
+        await icu_client.get_event(1001)
+
+        assert route.call_count == 2
+
+    async def test_write_invalidates_its_root(self, icu_client, respx_mock, mock_activity_data):
+        """Test that a write drops cached reads under its /activity/{id} root only."""
+        hr_1 = respx_mock.get("/activity/1/hr-histogram").mock(
+            return_value=Response(200, json=HISTOGRAM)
+        )
+        hr_10 = respx_mock.get("/activity/10/hr-histogram").mock(
+            return_value=Response(200, json=HISTOGRAM)
+        )
+        respx_mock.put("/activity/1").mock(return_value=Response(200, json=mock_activity_data))
+
+        await icu_client.get_hr_histogram("1")
+        await icu_client.get_hr_histogram("10")
+        await icu_client.update_activity("1", {"name": "Renamed"})
+        await icu_client.get_hr_histogram("1")
+        await icu_client.get_hr_histogram("10")
+
+        assert hr_1.call_count == 2
+        assert hr_10.call_count == 1
+
+    async def test_invalidate_prefix(self, icu_client, respx_mock, mock_athlete_data):
+        """Test that invalidate drops the path and its children, and nothing else."""
+        athlete = respx_mock.get("/athlete/i123456").mock(
+            return_value=Response(200, json=mock_athlete_data)
+        )
+        settings = respx_mock.get("/athlete/i123456/sport-settings").mock(
+            return_value=Response(200, json=[])
+        )
+        other = respx_mock.get("/athlete/i1234567/sport-settings").mock(
+            return_value=Response(200, json=[])
+        )
+
+        async def read_all() -> None:
+            await icu_client.get_athlete()
+            await icu_client.get_sport_settings()
+            await icu_client.get_sport_settings("i1234567")
+
+        await read_all()
+        icu_client.invalidate("/athlete/i123456/")
+        await read_all()
+
+        assert athlete.call_count == 2
+        assert settings.call_count == 2
+        assert other.call_count == 1
+
+        icu_client.invalidate()
+        await read_all()
+
+        assert other.call_count == 2
+
+    async def test_get_in_flight_during_write_is_not_cached(
+        self, icu_client, respx_mock, mock_athlete_data, mock_event_data
+    ):
+        """Test that a GET sent before a write completes doesn't cache its pre-write response."""
+        release = asyncio.Event()
+
+        async def slow_body():
+            await release.wait()
+            yield json.dumps({**mock_athlete_data, "name": "old"}).encode()
+
+        athlete_route = respx_mock.get("/athlete/i123456").mock(
+            side_effect=[
+                Response(200, content=slow_body()),
+                Response(200, json={**mock_athlete_data, "name": "new"}),
+            ]
+        )
+        respx_mock.post("/athlete/i123456/events").mock(
+            return_value=Response(200, json=mock_event_data)
+        )
+
+        slow_read = asyncio.create_task(icu_client.get_athlete())
+        while athlete_route.call_count == 0:
+            await asyncio.sleep(0)
+
+        # The write completes while the read is still waiting for its body
+        await icu_client.create_event({"name": "Threshold Intervals"})
+        release.set()
+        assert (await slow_read).name == "old"
+
+        athlete = await icu_client.get_athlete()
+
+        assert athlete.name == "new"
+        assert athlete_route.call_count == 2
+
+
+class TestRetry:
+    """Tests for retrying rate-limited and transient failures."""
+
+    async def test_retry_then_success(self, icu_client, respx_mock, mock_event_data):
+        """Test that a 429 and a 503 are retried until the request succeeds."""
+        route = respx_mock.get("/athlete/i123456/events/1001").mock(
+            side_effect=[
+                Response(429, headers={"Retry-After": "0"}),
+                Response(503, headers={"Retry-After": "0"}),
+                Response(200, json=mock_event_data),
+            ]
+        )
+
+        event = await icu_client.get_event(1001)
+
+        assert event.id == 1001
+        assert route.call_count == 3
+
+    async def test_gives_up_after_max_attempts(self, icu_client, respx_mock):
+        """Test that the last failure is raised once every attempt has been used."""
+        route = respx_mock.get("/athlete/i123456/events/1001").mock(
+            return_value=Response(503, headers={"Retry-After": "0"})
+        )
+
+        with pytest.raises(ICUAPIError) as exc_info:
+            await icu_client.get_event(1001)
+
+        assert exc_info.value.status_code == 503
+        assert route.call_count == client_module._MAX_ATTEMPTS
+
+    async def test_post_not_retried_on_server_error(self, icu_client, respx_mock):
+        """Test that a non-idempotent write is not repeated after a 503."""
+        route = respx_mock.post("/athlete/i123456/events").mock(
+            return_value=Response(503, headers={"Retry-After": "0"})
+        )
+
+        with pytest.raises(ICUAPIError) as exc_info:
+            await icu_client.create_event({"name": "Threshold Intervals"})
+
+        assert exc_info.value.status_code == 503
+        assert route.call_count == 1
+
+
+class TestSingleFlight:
+    """Tests for sharing one request between identical concurrent GETs."""
+
+    async def test_concurrent_identical_gets_send_one_request(
+        self, icu_client, respx_mock, mock_event_data
+    ):
+        """Test that identical GETs issued together share one request."""
+        route = respx_mock.get("/athlete/i123456/events/1001").mock(
+            return_value=Response(200, json=mock_event_data)
+        )
+
+        first, second = await asyncio.gather(icu_client.get_event(1001), icu_client.get_event(1001))
+
+        assert first == second
+        assert route.call_count == 1
+
+    async def test_cancelled_waiter_does_not_cancel_shared_request(
+        self, icu_client, respx_mock, mock_event_data
+    ):
+        """Test that cancelling one caller leaves the request running for the others."""
+        release = asyncio.Event()
+
+        async def body():
+            await release.wait()
+            yield json.dumps(mock_event_data).encode()
+
+        route = respx_mock.get("/athlete/i123456/events/1001").mock(
+            side_effect=lambda request: Response(200, content=body())
+        )
+
+        cancelled = asyncio.create_task(icu_client.get_event(1001))
+        waiting = asyncio.create_task(icu_client.get_event(1001))
+        while route.call_count == 0:
+            await asyncio.sleep(0)
+
+        cancelled.cancel()
+        release.set()
+        event = await waiting
+
+        assert cancelled.cancelled()
+        assert event.id == 1001
+        assert route.call_count == 1
+
+    async def test_read_after_write_does_not_join_earlier_request(
+        self, icu_client, respx_mock, mock_athlete_data, mock_event_data
+    ):
+        """Test that a GET issued after a write sends a new request instead of joining one."""
+        release = asyncio.Event()
+
+        async def slow_body():
+            await release.wait()
+            yield json.dumps({**mock_athlete_data, "name": "old"}).encode()
+
+        athlete_route = respx_mock.get("/athlete/i123456").mock(
+            side_effect=[
+                Response(200, content=slow_body()),
+                Response(200, json={**mock_athlete_data, "name": "new"}),
+            ]
+        )
+        respx_mock.post("/athlete/i123456/events").mock(
+            return_value=Response(200, json=mock_event_data)
+        )
+
+        slow_read = asyncio.create_task(icu_client.get_athlete())
+        while athlete_route.call_count == 0:
+            await asyncio.sleep(0)
+        await icu_client.create_event({"name": "Threshold Intervals"})
+
+        # Joining the earlier request would block until its body is released
+        athlete = await asyncio.wait_for(icu_client.get_athlete(), timeout=1)
+        release.set()
+
+        assert athlete.name == "new"
+        assert (await slow_read).name == "old"
+        assert athlete_route.call_count == 2
+
+    async def test_failure_after_all_waiters_cancelled_is_retrieved(self, icu_client, respx_mock):
+        """Test that a shared request failing with no one waiting isn't logged as unretrieved."""
+        release = asyncio.Event()
+        errors: list[dict[str, object]] = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _loop, context: errors.append(context))
+
+        async def slow_body():
+            await release.wait()
+            yield b"Not found"
+
+        route = respx_mock.get("/athlete/i123456/events/1001").mock(
+            side_effect=lambda request: Response(404, content=slow_body())
+        )
+
+        try:
+            waiter = asyncio.create_task(icu_client.get_event(1001))
+            while route.call_count == 0:
+                await asyncio.sleep(0)
+            waiter.cancel()
+            release.set()
+            while icu_client._pending:
+                await asyncio.sleep(0)
+            del waiter
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert errors == []
+
+
+class TestReplaceEvents:
+    """Tests for replacing calendar events with one bulk delete and one bulk create."""
+
+    async def test_replace_events(self, icu_client, respx_mock, mock_event_data):
+        """Test the bulk delete and create payloads and the parsed result."""
+        delete_route = respx_mock.delete("/athlete/i123456/events/bulk").mock(
+            return_value=Response(200, json={"deleted": 2})
+        )
+        create_route = respx_mock.post("/athlete/i123456/events/bulk").mock(
+            return_value=Response(200, json=[mock_event_data])
+        )
+        new_event = {"start_date_local": "2025-10-14", "name": "Threshold Intervals"}
+
+        result = await icu_client.replace_events([1, 2], [new_event])
+
+        assert json.loads(delete_route.calls.last.request.content) == {"ids": [1, 2]}
+        assert json.loads(create_route.calls.last.request.content) == [new_event]
+        assert result.deleted == {"deleted": 2}
+        assert [event.id for event in result.created] == [1001]
+
+    async def test_replace_events_skips_empty_operations(self, icu_client, respx_mock):
+        """Test that nothing is sent for an empty delete or create list."""
+        route = respx_mock.route(path__startswith="/athlete/i123456/events")
+
+        result = await icu_client.replace_events([], [])
+
+        assert result.deleted == {}
+        assert result.created == []
+        assert route.call_count == 0
+
+    async def test_replace_events_raises_after_both_finish(
+        self, icu_client, respx_mock, mock_event_data
+    ):
+        """Test that a failed delete is raised, and the create is still sent."""
+        respx_mock.delete("/athlete/i123456/events/bulk").mock(return_value=Response(404))
+        create_route = respx_mock.post("/athlete/i123456/events/bulk").mock(
+            return_value=Response(200, json=[mock_event_data])
+        )
+
+        with pytest.raises(ICUAPIError) as exc_info:
+            await icu_client.replace_events([1], [{"name": "Threshold Intervals"}])
+
+        assert exc_info.value.status_code == 404
+        assert create_route.call_count == 1
+
+
+class TestUpdateWellnessBulk:
+    """Tests for chunked bulk wellness updates."""
+
+    async def test_records_are_split_into_chunks(self, icu_client, respx_mock):
+        """Test that a large backfill is sent as several PUTs and the results are rejoined."""
+        records = [{"id": f"2025-01-{day:02d}", "weight": 70.0} for day in range(1, 26)]
+        route = respx_mock.put("/athlete/i123456/wellness-bulk").mock(
+            side_effect=lambda request: Response(200, content=request.content)
+        )
+
+        updated = await icu_client.update_wellness_bulk(records, chunk_size=10)
+
+        chunks = [json.loads(call.request.content) for call in route.calls]
+        assert route.call_count == 3
+        # Chunks are sent concurrently, so they may arrive in any order
+        assert sorted(chunks, key=lambda chunk: chunk[0]["id"]) == [
+            records[0:10],
+            records[10:20],
+            records[20:25],
+        ]
+        assert [record.id for record in updated] == [record["id"] for record in records]
+
+
+class TestStream:
+    """Tests for streamed downloads."""
+
+    async def test_stream_retries_and_releases_in_flight_slot(self, respx_mock):
+        """Test that a rate-limited download is retried and frees its slot once streaming."""
+        fit_bytes = bytes(range(256)) * 600  # Several 64 KiB chunks
+        route = respx_mock.get("/activity/1/fit-file").mock(
+            side_effect=[
+                Response(429, headers={"Retry-After": "0"}),
+                Response(200, content=fit_bytes),
+            ]
+        )
+        respx_mock.get("/athlete/i123456/events/1001").mock(
+            return_value=Response(200, json={"id": 1001, "start_date_local": "2025-10-14"})
+        )
+        config = ICUConfig(
+            intervals_icu_api_key="test_api_key_12345",
+            intervals_icu_athlete_id="i123456",
+            intervals_icu_max_in_flight=1,
+        )
+
+        async with ICUClient(config) as client:
+            chunks = client.stream_fit_file("1")
+            received = [await anext(chunks)]
+
+            # The only in-flight slot is free again while the body is still being read
+            event = await asyncio.wait_for(client.get_event(1001), timeout=1)
+            assert event.id == 1001
+
+            received.extend([chunk async for chunk in chunks])
+
+        assert b"".join(received) == fit_bytes
+        assert route.call_count == 2
+
+
+class TestGetAllHistograms:
+    """Tests for fetching every histogram of an activity at once."""
+
+    async def test_histograms_are_combined(self, icu_client, respx_mock):
+        """Test that all four histograms are fetched and missing ones are left out."""
+        routes = {
+            name: respx_mock.get(f"/activity/1/{name}-histogram").mock(
+                return_value=Response(200, json={**HISTOGRAM, "total_count": index})
+            )
+            for index, name in enumerate(("power", "hr", "pace"))
+        }
+        gap_route = respx_mock.get("/activity/1/gap-histogram").mock(return_value=Response(404))
+
+        histograms = await icu_client.get_all_histograms("1")
+
+        assert list(histograms) == ["power", "hr", "pace"]
+        assert [h.total_count for h in histograms.values()] == [0, 1, 2]
+        assert all(route.call_count == 1 for route in routes.values())
+        assert gap_route.call_count == 1
+
+    async def test_other_errors_are_raised(self, icu_client, respx_mock):
+        """Test that failures other than not found are raised."""
+        for name in ("power", "pace", "gap"):
+            respx_mock.get(f"/activity/1/{name}-histogram").mock(
+                return_value=Response(200, json=HISTOGRAM)
+            )
+        respx_mock.get("/activity/1/hr-histogram").mock(return_value=Response(401))
+
+        with pytest.raises(ICUAPIError) as exc_info:
+            await icu_client.get_all_histograms("1")
+
+        assert exc_info.value.status_code == 401
+
+
+class TestGetActivitiesByIds:
+    """Tests for fetching several activities concurrently."""
+
+    async def test_results_follow_id_order(self, icu_client, respx_mock, mock_activity_data):
+        """Test that every id is fetched once and results come back in the order given."""
+        routes = [
+            respx_mock.get(f"/activity/{activity_id}").mock(
+                return_value=Response(200, json={**mock_activity_data, "id": activity_id})
+            )
+            for activity_id in ("1", "2", "3")
+        ]
+
+        activities = await icu_client.get_activities_by_ids(["3", "1", "2"], concurrency=2)
+
+        assert [activity.id for activity in activities] == ["3", "1", "2"]
+        assert all(route.call_count == 1 for route in routes)
+
+    async def test_failed_fetch_is_raised(self, icu_client, respx_mock, mock_activity_data):
+        """Test that one failing activity fails the whole call with its API error."""
+        respx_mock.get("/activity/1").mock(return_value=Response(200, json=mock_activity_data))
+        respx_mock.get("/activity/2").mock(return_value=Response(404))
+
+        with pytest.raises(ICUAPIError) as exc_info:
+            await icu_client.get_activities_by_ids(["1", "2"])
+
+        assert exc_info.value.status_code == 404
+
+
+class TestInFlightLimit:
+    """Tests for the cap on concurrent requests per client."""
+
+    async def test_requests_in_flight_never_exceed_limit(self, respx_mock, mock_event_data):
+        """Test that a large fan-out keeps at most max_in_flight requests on the wire."""
+        in_flight = 0
+        peak = 0
+
+        async def body():
+            nonlocal in_flight
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            yield json.dumps(mock_event_data).encode()
+
+        def respond(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            return Response(200, content=body())
+
+        route = respx_mock.get(path__startswith="/athlete/i123456/events/").mock(
+            side_effect=respond
+        )
+        config = ICUConfig(
+            intervals_icu_api_key="test_api_key_12345",
+            intervals_icu_athlete_id="i123456",
+            intervals_icu_max_in_flight=3,
+        )
+
+        async with ICUClient(config) as client:
+            await asyncio.gather(*(client.get_event(event_id) for event_id in range(12)))
+
+        assert route.call_count == 12
+        assert peak == 3
+
+
+class TestQueryParams:
+    """Tests for query parameters forwarded to the API."""
+
+    async def test_date_range_and_limit_are_forwarded(self, icu_client, respx_mock):
+        """Test that dates and limit reach the query string and unset dates are left out."""
+        route = respx_mock.get("/athlete/i123456/activities").mock(
+            return_value=Response(200, json=[])
+        )
+
+        await icu_client.get_activities(oldest="2025-10-01", newest="2025-10-13", limit=5)
+        await icu_client.get_activities(oldest="2025-10-01", limit=0)
+
+        first, second = (dict(call.request.url.params) for call in route.calls)
+        assert first == {"oldest": "2025-10-01", "newest": "2025-10-13", "limit": "5"}
+        assert second == {"oldest": "2025-10-01", "limit": "0"}
+
+    async def test_optional_filters_are_forwarded_only_when_set(self, icu_client, respx_mock):
+        """Test that category and gap are only sent when requested."""
+        events = respx_mock.get("/athlete/i123456/events").mock(return_value=Response(200, json=[]))
+        curves = respx_mock.get("/athlete/i123456/pace-curves").mock(
+            return_value=Response(200, json={})
+        )
+
+        await icu_client.get_events(oldest="2025-10-01", category="WORKOUT")
+        await icu_client.get_events(oldest="2025-10-01")
+        await icu_client.get_pace_curves(use_gap=True)
+        await icu_client.get_pace_curves()
+
+        assert [dict(call.request.url.params) for call in events.calls] == [
+            {"oldest": "2025-10-01", "category": "WORKOUT"},
+            {"oldest": "2025-10-01"},
+        ]
+        assert [dict(call.request.url.params) for call in curves.calls] == [{"gap": "true"}, {}]
@@ -0,0 +1,144 @@
+"""Tests for calendar and event tools."""
+
+import json
+from datetime import date, timedelta
+
+from httpx import Response
+
+from intervals_icu_mcp.tools.event_management import create_event
+from intervals_icu_mcp.tools.events import (
+    get_calendar_events,
+    get_training_context,
+    get_upcoming_workouts,
+)
+
+
+class TestCalendarCache:
+    """Tests for calendar reads served from the shared client's response cache."""
+
+    async def test_calendar_read_after_write_is_fresh(
+        self,
+        mock_ctx,
+        respx_mock,
+        mock_event_data,
+    ):
+        """Test that creating an event invalidates the cached calendar window."""
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        event = {**mock_event_data, "start_date_local": tomorrow}
+        calendar: list[dict[str, object]] = []
+
+        events_route = respx_mock.get("/athlete/i123456/events").mock(
+            side_effect=lambda request: Response(200, json=calendar)
+        )
+        respx_mock.post("/athlete/i123456/events").mock(return_value=Response(200, json=event))
+
+        response = json.loads(await get_calendar_events(ctx=mock_ctx))
+        assert response["data"]["count"] == 0
+
+        # A second read within the TTL is served from the cache
+        response = json.loads(await get_calendar_events(ctx=mock_ctx))
+        assert response["data"]["count"] == 0
+        assert events_route.call_count == 1
+
+        calendar.append(event)
+        response = json.loads(
+            await create_event(
+                start_date=tomorrow,
+                name="Threshold Intervals",
+                category="WORKOUT",
+                ctx=mock_ctx,
+            )
+        )
+        assert response["data"]["id"] == 1001
+
+        response = json.loads(await get_calendar_events(ctx=mock_ctx))
+        assert response["data"]["summary"]["total_events"] == 1
+        assert response["data"]["events_by_date"][tomorrow][0]["name"] == "Threshold Intervals"
+        assert events_route.call_count == 2
+
+    async def test_calendar_and_upcoming_workouts_share_one_request(
+        self,
+        mock_ctx,
+        respx_mock,
+        mock_event_data,
+    ):
+        """Test that upcoming workouts are filtered from the cached calendar window."""
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        events = [
+            {**mock_event_data, "start_date_local": tomorrow},
+            {"id": 1002, "start_date_local": tomorrow, "category": "NOTE", "name": "Travel"},
+        ]
+        events_route = respx_mock.get("/athlete/i123456/events").mock(
+            return_value=Response(200, json=events)
+        )
+
+        calendar = json.loads(await get_calendar_events(ctx=mock_ctx))
+        upcoming = json.loads(await get_upcoming_workouts(ctx=mock_ctx))
+
+        assert calendar["data"]["summary"]["total_events"] == 2
+        assert upcoming["data"]["count"] == 1
+        assert upcoming["data"]["workouts"][0]["name"] == "Threshold Intervals"
+        assert events_route.call_count == 1
+
+
+class TestGetTrainingContext:
+    """Tests for get_training_context tool."""
+
+    async def test_get_training_context_success(
+        self,
+        mock_ctx,
+        respx_mock,
+        mock_athlete_data,
+        mock_wellness_data,
+        mock_event_data,
+    ):
+        """Test that fitness, wellness and upcoming events are combined in one response."""
+        today = date.today()
+        tomorrow = (today + timedelta(days=1)).isoformat()
+        yesterday = (today - timedelta(days=1)).isoformat()
+        wellness = [
+            {**mock_wellness_data, "id": yesterday},
+            {**mock_wellness_data, "id": today.isoformat(), "hrv": 70.0},
+        ]
+        respx_mock.get("/athlete/i123456").mock(return_value=Response(200, json=mock_athlete_data))
+        wellness_route = respx_mock.get("/athlete/i123456/wellness").mock(
+            return_value=Response(200, json=wellness)
+        )
+        respx_mock.get("/athlete/i123456/events").mock(
+            return_value=Response(
+                200, json=[{**mock_event_data, "start_date_local": f"{tomorrow}T08:00:00"}]
+            )
+        )
+
+        result = await get_training_context(ctx=mock_ctx)
+
+        response = json.loads(result)
+        data = response["data"]
+        assert data["fitness"] == {"ctl": 50.0, "atl": 35.0, "tsb": 15.0, "ramp_rate": 3.5}
+
+        # Wellness is most recent first
+        assert [day["date"] for day in data["wellness"]] == [today.isoformat(), yesterday]
+        assert data["wellness"][0]["hrv_rmssd"] == 70.0
+        assert wellness_route.calls.last.request.url.params["newest"] == today.isoformat()
+
+        assert data["upcoming_events"] == [
+            {
+                "date": tomorrow,
+                "name": "Threshold Intervals",
+                "category": "WORKOUT",
+                "type": "Ride",
+                "duration_seconds": 3600,
+                "training_load": 100,
+            }
+        ]
+        assert response["metadata"]["query_type"] == "training_context"
+
+    async def test_get_training_context_api_error(self, mock_ctx, respx_mock):
+        """Test that a failing request is reported as an API error."""
+        respx_mock.get("/athlete/i123456").mock(return_value=Response(401))
+        respx_mock.get("/athlete/i123456/wellness").mock(return_value=Response(200, json=[]))
+        respx_mock.get("/athlete/i123456/events").mock(return_value=Response(200, json=[]))
+
+        response = json.loads(await get_training_context(ctx=mock_ctx))
+
+        assert response["error"]["type"] == "api_error"
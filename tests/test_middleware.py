@@ -0,0 +1,49 @@
+"""Tests for the config middleware's shared client."""
+
+import asyncio
+
+from intervals_icu_mcp.auth import ICUConfig
+from intervals_icu_mcp.middleware import ConfigMiddleware
+
+
+class TestSharedClient:
+    """Tests for the process-wide client injected by ConfigMiddleware."""
+
+    async def test_concurrent_first_calls_share_one_client(self, mock_config):
+        """Test that tool calls arriving together before any client exists get the same one."""
+        middleware = ConfigMiddleware()
+
+        clients = await asyncio.gather(*(middleware._shared_client(mock_config) for _ in range(5)))
+
+        assert all(client is clients[0] for client in clients)
+        await middleware.aclose()
+
+    async def test_config_change_closes_replaced_client(self, mock_config):
+        """Test that a client replaced after a credentials change has its pool closed."""
+        middleware = ConfigMiddleware()
+        old = await middleware._shared_client(mock_config)
+        assert old._client is not None
+
+        new_config = ICUConfig(
+            intervals_icu_api_key="other_api_key",
+            intervals_icu_athlete_id="i654321",
+        )
+        new = await middleware._shared_client(new_config)
+
+        assert new is not old
+        assert new.config == new_config
+        assert old._client is None
+        await middleware.aclose()
+
+    async def test_replaced_client_stays_open_for_running_calls(self, mock_config):
+        """Test that a tool call still using the replaced client keeps its pool open."""
+        middleware = ConfigMiddleware()
+        old = await middleware._shared_client(mock_config)
+
+        async with old:
+            await middleware._shared_client(
+                ICUConfig(intervals_icu_api_key="other_api_key", intervals_icu_athlete_id="i1")
+            )
+            assert old._client is not None
+        assert old._client is None
+        await middleware.aclose()
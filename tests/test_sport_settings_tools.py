@@ -0,0 +1,66 @@
+"""Tests for sport settings tools."""
+
+import json
+
+import pytest
+from httpx import Response
+
+from intervals_icu_mcp.tools.sport_settings import get_sport_settings, update_sport_settings
+
+
+@pytest.fixture
+def mock_sport_settings_data():
+    """Sample sport settings for testing."""
+    return [
+        {"id": 1, "type": "Ride", "ftp": 250, "fthr": 165},
+        {"id": 2, "type": "Run", "fthr": 170, "pace_threshold": 4.5},
+    ]
+
+
+class TestGetSportSettings:
+    """Tests for get_sport_settings tool."""
+
+    async def test_second_read_is_served_from_cache(
+        self,
+        mock_ctx,
+        respx_mock,
+        mock_sport_settings_data,
+    ):
+        """Test that repeated reads within the TTL send a single request."""
+        route = respx_mock.get("/athlete/i123456/sport-settings").mock(
+            return_value=Response(200, json=mock_sport_settings_data)
+        )
+
+        first = json.loads(await get_sport_settings(ctx=mock_ctx))
+        second = json.loads(await get_sport_settings(ctx=mock_ctx))
+
+        assert first["data"] == second["data"]
+        assert second["data"]["sport_settings"][0]["ftp_watts"] == 250
+        assert second["data"]["sport_settings"][1]["pace_threshold"] == "4:30 /km"
+        assert route.call_count == 1
+
+    async def test_update_invalidates_cache(
+        self,
+        mock_ctx,
+        respx_mock,
+        mock_sport_settings_data,
+    ):
+        """Test that updating settings makes the next read fetch them again."""
+        updated = {**mock_sport_settings_data[0], "ftp": 260}
+        route = respx_mock.get("/athlete/i123456/sport-settings").mock(
+            side_effect=[
+                Response(200, json=mock_sport_settings_data),
+                Response(200, json=[updated, mock_sport_settings_data[1]]),
+            ]
+        )
+        respx_mock.put("/athlete/i123456/sport-settings/1").mock(
+            return_value=Response(200, json=updated)
+        )
+
+        await get_sport_settings(ctx=mock_ctx)
+        result = json.loads(await update_sport_settings(sport_id=1, ftp=260, ctx=mock_ctx))
+        assert result["data"]["ftp_watts"] == 260
+
+        response = json.loads(await get_sport_settings(ctx=mock_ctx))
+        assert response["data"]["sport_settings"][0]["ftp_watts"] == 260
+        assert route.call_count == 2
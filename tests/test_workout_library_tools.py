@@ -1,47 +1,66 @@
 """Tests for workout library tools."""
 
 import json
-from unittest.mock import MagicMock
 
+import pytest
 from httpx import Response
 
 from intervals_icu_mcp.tools.workout_library import (
     add_workouts_to_plan,
     create_training_plan,
     delete_training_plan,
+    get_workout_library,
 )
 
+# Folders returned by the create-folder endpoint, keyed by the requested folder type
+CREATED_FOLDERS = {
+    "PLAN": {
+        "id": 12345,
+        "athlete_id": "i123456",
+        "type": "PLAN",
+        "name": "Marathon Training Plan",
+        "description": "12-week marathon training plan",
+        "visibility": "PRIVATE",
+        "start_date_local": "2024-01-01",
+        "num_workouts": 0,
+    },
+    "FOLDER": {
+        "id": 54321,
+        "athlete_id": "i123456",
+        "type": "FOLDER",
+        "name": "My Workouts",
+        "visibility": "PRIVATE",
+        "num_workouts": 0,
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def folder_routes(respx_mock):
+    """Register the folder list and create routes once for every test.
+
+    The list route returns no folders unless a test sets its return value via
+    respx_mock["list_folders"]; the create route answers with the canned folder for
+    the requested type.
+    """
+    respx_mock.get("/athlete/i123456/folders", name="list_folders").mock(
+        return_value=Response(200, json=[])
+    )
+    respx_mock.post("/athlete/i123456/folders", name="create_folder").mock(
+        side_effect=lambda request: Response(
+            200, json=CREATED_FOLDERS[json.loads(request.content)["type"]]
+        )
+    )
+
 
 class TestCreateTrainingPlan:
     """Tests for create_training_plan tool."""
 
     async def test_create_training_plan_success(
         self,
-        mock_config,
-        respx_mock,
+        mock_ctx,
     ):
         """Test successful training plan creation."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
-        # Mock response data
-        mock_folder_data = {
-            "id": 12345,
-            "athlete_id": "i123456",
-            "type": "PLAN",
-            "name": "Marathon Training Plan",
-            "description": "12-week marathon training plan",
-            "visibility": "PRIVATE",
-            "start_date_local": "2024-01-01",
-            "num_workouts": 0,
-        }
-
-        # Mock the API endpoint
-        respx_mock.post("/athlete/i123456/folders").mock(
-            return_value=Response(200, json=mock_folder_data)
-        )
-
         result = await create_training_plan(
             name="Marathon Training Plan",
             plan_type="PLAN",
@@ -52,8 +71,6 @@ class TestCreateTrainingPlan:
         )
 
         # Check for JSON response with expected fields
-        import json
-
         response = json.loads(result)
         assert "data" in response
         assert response["data"]["id"] == 12345
@@ -69,29 +86,9 @@ class TestCreateTrainingPlan:
 
     async def test_create_folder_success(
         self,
-        mock_config,
-        respx_mock,
+        mock_ctx,
     ):
         """Test successful workout folder creation."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
-        # Mock response data
-        mock_folder_data = {
-            "id": 54321,
-            "athlete_id": "i123456",
-            "type": "FOLDER",
-            "name": "My Workouts",
-            "visibility": "PRIVATE",
-            "num_workouts": 0,
-        }
-
-        # Mock the API endpoint
-        respx_mock.post("/athlete/i123456/folders").mock(
-            return_value=Response(200, json=mock_folder_data)
-        )
-
         result = await create_training_plan(
             name="My Workouts",
             plan_type="FOLDER",
@@ -100,8 +97,6 @@ class TestCreateTrainingPlan:
         )
 
         # Check for JSON response with expected fields
-        import json
-
         response = json.loads(result)
         assert "data" in response
         assert response["data"]["id"] == 54321
@@ -114,13 +109,9 @@ class TestCreateTrainingPlan:
 
     async def test_create_training_plan_invalid_type(
         self,
-        mock_config,
+        mock_ctx,
     ):
         """Test error handling for invalid plan type."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
         result = await create_training_plan(
             name="Test Plan",
             plan_type="INVALID",
@@ -128,21 +119,15 @@ class TestCreateTrainingPlan:
         )
 
         # Check for error response
-        import json
-
         response = json.loads(result)
         assert "error" in response
         assert "validation_error" in response["error"]["type"]
 
     async def test_create_training_plan_invalid_visibility(
         self,
-        mock_config,
+        mock_ctx,
     ):
         """Test error handling for invalid visibility."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
         result = await create_training_plan(
             name="Test Plan",
             plan_type="PLAN",
@@ -151,8 +136,6 @@ class TestCreateTrainingPlan:
         )
 
         # Check for error response
-        import json
-
         response = json.loads(result)
         assert "error" in response
         assert "validation_error" in response["error"]["type"]
@@ -163,14 +146,10 @@ class TestAddWorkoutsToPlan:
 
     async def test_add_workouts_to_plan_success(
         self,
-        mock_config,
+        mock_ctx,
         respx_mock,
     ):
         """Test successful workout addition to plan."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
         # Mock workouts data
         workouts_json = json.dumps(
             [
@@ -266,13 +245,9 @@ class TestAddWorkoutsToPlan:
 
     async def test_add_workouts_invalid_json(
         self,
-        mock_config,
+        mock_ctx,
     ):
         """Test error handling for invalid JSON."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
         result = await add_workouts_to_plan(
             folder_id=12345,
             workouts="invalid json {",
@@ -287,13 +262,9 @@ class TestAddWorkoutsToPlan:
 
     async def test_add_workouts_empty_array(
         self,
-        mock_config,
+        mock_ctx,
     ):
         """Test error handling for empty workouts array."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
         result = await add_workouts_to_plan(
             folder_id=12345,
             workouts="[]",
@@ -308,13 +279,9 @@ class TestAddWorkoutsToPlan:
 
     async def test_add_workouts_missing_required_field(
         self,
-        mock_config,
+        mock_ctx,
     ):
         """Test error handling for missing required field."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
         # Missing "day" field
         workouts_json = json.dumps(
             [
@@ -345,14 +312,10 @@ class TestDeleteTrainingPlan:
 
     async def test_delete_training_plan_success(
         self,
-        mock_config,
+        mock_ctx,
         respx_mock,
     ):
         """Test successful training plan deletion."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
         # Mock existing folder data
         mock_folders = [
             {
@@ -367,9 +330,7 @@ class TestDeleteTrainingPlan:
         ]
 
         # Mock the API endpoints
-        respx_mock.get("/athlete/i123456/folders").mock(
-            return_value=Response(200, json=mock_folders)
-        )
+        respx_mock["list_folders"].return_value = Response(200, json=mock_folders)
         respx_mock.delete("/athlete/i123456/folders/12345").mock(
             return_value=Response(204)  # DELETE typically returns 204 No Content
         )
@@ -393,17 +354,10 @@ class TestDeleteTrainingPlan:
 
     async def test_delete_training_plan_not_found(
         self,
-        mock_config,
-        respx_mock,
+        mock_ctx,
     ):
         """Test error handling when folder not found."""
-        # Create mock context with config
-        mock_ctx = MagicMock()
-        mock_ctx.get_state.return_value = mock_config
-
-        # Mock empty folders list
-        respx_mock.get("/athlete/i123456/folders").mock(return_value=Response(200, json=[]))
-
+        # The pre-registered folders route returns an empty list
         result = await delete_training_plan(
             folder_id=99999,
             ctx=mock_ctx,
@@ -413,3 +367,29 @@ class TestDeleteTrainingPlan:
         response = json.loads(result)
         assert "error" in response
         assert "not_found" in response["error"]["type"]
+
+
+class TestFolderCache:
+    """Tests for folder lists cached on the shared client."""
+
+    async def test_browse_then_delete_reuses_folders_until_changed(
+        self,
+        mock_ctx,
+        respx_mock,
+    ):
+        """Test that deleting after browsing reuses the folder list, and the delete clears it."""
+        folders = [CREATED_FOLDERS["PLAN"]]
+        list_route = respx_mock["list_folders"].mock(
+            side_effect=lambda request: Response(200, json=folders)
+        )
+        respx_mock.delete("/athlete/i123456/folders/12345").mock(return_value=Response(204))
+
+        await get_workout_library(ctx=mock_ctx)
+        response = json.loads(await delete_training_plan(folder_id=12345, ctx=mock_ctx))
+        assert response["data"]["deleted"] is True
+        assert list_route.call_count == 1
+
+        folders.clear()
+        response = json.loads(await get_workout_library(ctx=mock_ctx))
+        assert "error" not in response
+        assert list_route.call_count == 2